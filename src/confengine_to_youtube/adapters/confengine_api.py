@@ -8,6 +8,7 @@ from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
 from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
 from confengine_to_youtube.domain.session import Session
 from confengine_to_youtube.domain.speaker import Speaker
+from confengine_to_youtube.usecases.timing import phase
 
 if TYPE_CHECKING:
     from confengine_to_youtube.adapters.confengine_schema import ApiSession
@@ -69,7 +70,8 @@ class ConfEngineApiGateway:
             timeslot=api_session.timeslot.replace(tzinfo=timezone),
             room=api_session.room,
         )
-        abstract = self._markdown_converter.convert(html=api_session.abstract)
+        with phase(name="markdown.convert"):
+            abstract = self._markdown_converter.convert(html=api_session.abstract)
 
         return Session(
             slot=slot,
@@ -80,6 +80,15 @@ class DateSlotsSchema(RootModel[dict[date, RoomSlotsSchema]]):
         return result
 
 
+class PlaylistTargetsSchema(BaseModel):
+    """日付・トラックごとのプレイリストのスキーマ"""
+
+    model_config = ConfigDict(frozen=True)
+
+    by_day: dict[date, str] = Field(default_factory=dict)
+    by_track: dict[str, str] = Field(default_factory=dict)
+
+
 class MappingFileBaseSchema(BaseModel):
     """マッピングファイルの共通基底スキーマ"""
 
@@ -94,6 +103,7 @@ class MappingFileSchema(MappingFileBaseSchema):
     """マッピングファイルのルートスキーマ (Reader用)"""
 
     playlist_id: str
+    playlists: PlaylistTargetsSchema = Field(default_factory=PlaylistTargetsSchema)
     sessions: DateSlotsSchema
 
     def to_domain(self, timezone: ZoneInfo) -> MappingConfig:
@@ -126,6 +136,8 @@ class MappingFileSchema(MappingFileBaseSchema):
             mappings=frozenset(mappings),
             hashtags=tuple(self.hashtags),
             footer=self.footer,
+            day_playlist_ids=self.playlists.by_day,
+            track_playlist_ids=self.playlists.by_track,
         )
 
 
@@ -0,0 +1,135 @@
+"""プレイリスト同期計画ファイルの読み書き (JSON)"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Self
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, ValidationError
+
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.usecases.dto import (
+    PlaylistOperationType,
+    PlaylistSyncPlan,
+    PlaylistVideoOperation,
+)
+from confengine_to_youtube.usecases.errors import PlaylistPlanFileError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+class _ScheduleSlotSchema(BaseModel):
+    """スケジュールスロットのスキーマ"""
+
+    model_config = ConfigDict(frozen=True)
+
+    timeslot: AwareDatetime
+    room: str
+
+
+class _PlaylistOperationSchema(BaseModel):
+    """プレイリスト操作のスキーマ"""
+
+    model_config = ConfigDict(frozen=True)
+
+    video_id: str
+    title: str
+    # PlaylistOperationType の名前
+    operation: Literal["ADD", "REORDER", "UNCHANGED", "MOVE_TO_END"]
+    position: int
+    slot: _ScheduleSlotSchema | None = None
+    after_video_id: str | None = None
+
+    @classmethod
+    def from_dto(cls, operation: PlaylistVideoOperation) -> Self:
+        return cls(
+            video_id=operation.video_id,
+            title=operation.title,
+            operation=operation.operation.name,  # type: ignore[arg-type]
+            position=operation.position,
+            slot=(
+                _ScheduleSlotSchema(
+                    timeslot=operation.slot.timeslot,
+                    room=operation.slot.room,
+                )
+                if operation.slot is not None
+                else None
+            ),
+            after_video_id=operation.after_video_id,
+        )
+
+    def to_dto(self) -> PlaylistVideoOperation:
+        return PlaylistVideoOperation(
+            video_id=self.video_id,
+            title=self.title,
+            operation=PlaylistOperationType[self.operation],
+            position=self.position,
+            slot=(
+                ScheduleSlot(timeslot=self.slot.timeslot, room=self.slot.room)
+                if self.slot is not None
+                else None
+            ),
+            after_video_id=self.after_video_id,
+        )
+
+
+class PlaylistPlanSchema(BaseModel):
+    """1つのプレイリストの同期計画のスキーマ"""
+
+    model_config = ConfigDict(frozen=True)
+
+    playlist_id: str
+    playlist_etag: str
+    operations: list[_PlaylistOperationSchema]
+
+    @classmethod
+    def from_dto(cls, plan: PlaylistSyncPlan) -> Self:
+        return cls(
+            playlist_id=plan.playlist_id,
+            playlist_etag=plan.playlist_etag,
+            operations=[
+                _PlaylistOperationSchema.from_dto(operation=operation)
+                for operation in plan.operations
+            ],
+        )
+
+    def to_dto(self) -> PlaylistSyncPlan:
+        return PlaylistSyncPlan(
+            playlist_id=self.playlist_id,
+            playlist_etag=self.playlist_etag,
+            operations=tuple(operation.to_dto() for operation in self.operations),
+        )
+
+
+class PlaylistPlanFileSchema(BaseModel):
+    """プレイリスト同期計画ファイルのルートスキーマ"""
+
+    model_config = ConfigDict(frozen=True)
+
+    plans: list[PlaylistPlanSchema]
+
+
+class PlaylistPlanFile:
+    """同期計画をJSONファイルに保存し、読み込む"""
+
+    def write(self, plans: Sequence[PlaylistSyncPlan], file_path: Path) -> None:
+        schema = PlaylistPlanFileSchema(
+            plans=[PlaylistPlanSchema.from_dto(plan=plan) for plan in plans],
+        )
+        data = schema.model_dump_json(indent=2)
+        file_path.write_text(data=data + "\n", encoding="utf-8")
+
+    def read(self, file_path: Path) -> tuple[PlaylistSyncPlan, ...]:
+        try:
+            data = file_path.read_text(encoding="utf-8")
+        except FileNotFoundError as e:
+            msg = f"Plan file not found: {file_path}"
+            raise PlaylistPlanFileError(msg) from e
+
+        try:
+            schema = PlaylistPlanFileSchema.model_validate_json(json_data=data)
+            return tuple(plan.to_dto() for plan in schema.plans)
+        except ValidationError as e:
+            msg = f"Invalid plan file format in {file_path}:\n{e}"
+            raise PlaylistPlanFileError(msg) from e
@@ -0,0 +1,122 @@
+"""プレイリスト同期の操作ジャーナル (JSON Lines)
+
+プレイリストごとに1ファイルで、計画・各操作の完了・全体の完了を1行ずつ追記する。
+途中で中断した場合は、次回の実行でこのファイルから計画と進捗を復元して続きから適用する。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING, Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+from confengine_to_youtube.adapters.playlist_plan_file import PlaylistPlanSchema
+from confengine_to_youtube.usecases.dto import PlaylistSyncProgress
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from confengine_to_youtube.usecases.dto import PlaylistSyncPlan
+
+logger = logging.getLogger(name=__name__)
+
+
+class _PlanRecord(BaseModel):
+    """計画の適用開始"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["plan"] = "plan"
+    plan: PlaylistPlanSchema
+
+
+class _CompletedRecord(BaseModel):
+    """1件の操作の適用完了"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["completed"] = "completed"
+    index: int
+
+
+class _FinishedRecord(BaseModel):
+    """計画全体の適用完了"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["finished"] = "finished"
+
+
+_JournalRecord = Annotated[
+    _PlanRecord | _CompletedRecord | _FinishedRecord,
+    Field(discriminator="type"),
+]
+_record_adapter: TypeAdapter[_JournalRecord] = TypeAdapter(_JournalRecord)
+
+
+class JsonlPlaylistSyncJournal:
+    """directory 配下にプレイリストごとのジャーナルファイルを追記する"""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    def _file_path(self, playlist_id: str) -> Path:
+        return self._directory / f"playlist_sync_{playlist_id}.jsonl"
+
+    def start(self, plan: PlaylistSyncPlan) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._file_path(playlist_id=plan.playlist_id).unlink(missing_ok=True)
+        self._append(
+            playlist_id=plan.playlist_id,
+            record=_PlanRecord(plan=PlaylistPlanSchema.from_dto(plan=plan)),
+        )
+
+    def record_completed(self, playlist_id: str, index: int) -> None:
+        self._append(playlist_id=playlist_id, record=_CompletedRecord(index=index))
+
+    def finish(self, playlist_id: str) -> None:
+        self._append(playlist_id=playlist_id, record=_FinishedRecord())
+
+    def load(self, playlist_id: str) -> PlaylistSyncProgress | None:
+        file_path = self._file_path(playlist_id=playlist_id)
+        if not file_path.exists():
+            return None
+
+        plan: PlaylistSyncPlan | None = None
+        completed: set[int] = set()
+
+        for line in file_path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = _record_adapter.validate_json(line)
+            except ValidationError:
+                # 書き込み途中で中断した最終行は読み飛ばす
+                logger.warning("Ignoring broken journal line in %s", file_path)
+                continue
+
+            match record:
+                case _PlanRecord():
+                    plan = record.plan.to_dto()
+                    completed = set()
+                case _CompletedRecord():
+                    completed.add(record.index)
+                case _FinishedRecord():
+                    plan = None
+
+        if plan is None:
+            return None
+
+        return PlaylistSyncProgress(plan=plan, completed=frozenset(completed))
+
+    def _append(
+        self,
+        playlist_id: str,
+        record: _PlanRecord | _CompletedRecord | _FinishedRecord,
+    ) -> None:
+        file_path = self._file_path(playlist_id=playlist_id)
+        with file_path.open(mode="a", encoding="utf-8") as f:
+            f.write(record.model_dump_json() + "\n")
+            f.flush()
+            # 書き込みが成功した操作を取りこぼさないよう、1件ごとにディスクへ書き出す
+            os.fsync(f.fileno())
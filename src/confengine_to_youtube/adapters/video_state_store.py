@@ -0,0 +1,131 @@
+"""同期済み動画コンテンツの状態ストア (SQLite)"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Self
+
+from confengine_to_youtube.usecases.dto import VideoSyncState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_sync_state (
+    video_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    category_id INTEGER NOT NULL,
+    etag TEXT,
+    synced_at TEXT NOT NULL
+)
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO video_sync_state "
+    "(video_id, content_hash, category_id, etag, synced_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+# 保存した状態をまとめて書き込む件数 (1回のトランザクションで書く行数)
+FLUSH_ROW_COUNT = 50
+
+_Row = tuple[str, str, int, str | None, str]
+
+
+class SqliteVideoStateStore:
+    """video_id ごとに最後に同期したコンテンツのハッシュ・ETag・日時を保持する
+
+    動画1件ごとにコミットすると書き込みのたびに fsync が走るため、保存した状態は
+    メモリに溜め、flush_row_count 件ごとと close() 時に1つのトランザクションで
+    書き込む。書き込む前の状態も get() で参照できる。
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_row_count: int = FLUSH_ROW_COUNT,
+    ) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # パイプラインの各スレッドから参照されるため、接続はロックで保護して共有する
+        self._connection = sqlite3.connect(
+            database=db_path,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._flush_row_count = flush_row_count
+        # video_id -> まだ書き込んでいない行 (同じ動画は最後の状態だけを残す)
+        self._pending: dict[str, _Row] = {}
+
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(  # noqa: D105
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+    def flush(self) -> None:
+        """溜めている状態を書き込む"""
+        with self._lock:
+            self._flush()
+
+    def get(self, video_id: str) -> VideoSyncState | None:
+        with self._lock:
+            pending = self._pending.get(video_id)
+            row = (
+                pending[1:]
+                if pending is not None
+                else self._connection.execute(
+                    "SELECT content_hash, category_id, etag, synced_at "
+                    "FROM video_sync_state WHERE video_id = ?",
+                    (video_id,),
+                ).fetchone()
+            )
+
+        if row is None:
+            return None
+
+        content_hash, category_id, etag, synced_at = row
+
+        return VideoSyncState(
+            video_id=video_id,
+            content_hash=content_hash,
+            category_id=category_id,
+            etag=etag,
+            synced_at=datetime.fromisoformat(synced_at),
+        )
+
+    def save(self, state: VideoSyncState) -> None:
+        with self._lock:
+            self._pending[state.video_id] = (
+                state.video_id,
+                state.content_hash,
+                state.category_id,
+                state.etag,
+                state.synced_at.isoformat(),
+            )
+            if len(self._pending) >= self._flush_row_count:
+                self._flush()
+
+    def _flush(self) -> None:
+        """溜めている行を1つのトランザクションで書き込む (ロックを取って呼ぶ)"""
+        if not self._pending:
+            return
+
+        with self._connection:
+            self._connection.executemany(_UPSERT, self._pending.values())
+        self._pending.clear()
@@ -2,27 +2,50 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+import hashlib
+import json
+import threading
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Self
 
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from confengine_to_youtube.adapters.youtube_schema import (
+    YouTubePlaylistItemInsertResponse,
     YouTubePlaylistItemsListResponse,
     YouTubeVideoItem,
     YouTubeVideosListResponse,
 )
 from confengine_to_youtube.usecases.dto import (
     PlaylistItem,
+    PlaylistSnapshot,
     VideoInfo,
     VideoUpdateRequest,
 )
-from confengine_to_youtube.usecases.errors import VideoNotFoundError
+from confengine_to_youtube.usecases.errors import VideoFetchError, VideoUpdateError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import httplib2
     from googleapiclient._apis.youtube.v3 import YouTubeResource
-    from googleapiclient._apis.youtube.v3.schemas import Video, VideoSnippet
+    from googleapiclient._apis.youtube.v3.schemas import (
+        PlaylistItemSnippet,
+        Video,
+        VideoSnippet,
+    )
+    from googleapiclient.http import HttpRequest
 
     from confengine_to_youtube.adapters.protocols import YouTubeAuthProvider
+    from confengine_to_youtube.adapters.youtube_etag_cache import YouTubeEtagCache
+
+
+def _build_http() -> httplib2.Http:
+    """タイムアウトを設定し、308をリダイレクトとして辿らないトランスポート"""
+    return build_http()  # type: ignore[no-any-return,no-untyped-call]
 
 
 def _video_info_from_api_response(item: YouTubeVideoItem) -> VideoInfo:
@@ -32,9 +55,45 @@ def _video_info_from_api_response(item: YouTubeVideoItem) -> VideoInfo:
         title=item.snippet.title,
         description=item.snippet.description,
         category_id=item.snippet.category_id,
+        etag=item.etag,
     )
 
 
+def _playlist_items_from_page(
+    page: YouTubePlaylistItemsListResponse,
+) -> list[PlaylistItem]:
+    """playlistItems.list の1ページ分を PlaylistItem に変換"""
+    return [
+        PlaylistItem(
+            video_id=item.content_details.video_id,
+            playlist_item_id=item.id,
+            position=item.snippet.position,
+        )
+        for item in page.items
+    ]
+
+
+def _combine_page_etags(
+    page_etags: Sequence[str | None],
+    items: Sequence[PlaylistItem],
+) -> str:
+    """各ページのETagからプレイリスト全体のETagを作る
+
+    ETagが返されないページがあれば、アイテムの並びそのもののハッシュで代用する。
+    """
+    if len(page_etags) == 1 and page_etags[0] is not None:
+        return page_etags[0]
+
+    if all(etag is not None for etag in page_etags):
+        payload = json.dumps(obj=page_etags)
+    else:
+        payload = json.dumps(
+            obj=[[item.playlist_item_id, item.video_id] for item in items],
+        )
+
+    return hashlib.sha256(payload.encode(encoding="utf-8")).hexdigest()
+
+
 def _to_api_body(request: VideoUpdateRequest) -> Video:
     """Convert VideoUpdateRequest to API request body."""
     snippet: VideoSnippet = {
@@ -46,13 +105,36 @@ def _to_api_body(request: VideoUpdateRequest) -> Video:
 
 
 class YouTubeApiGateway:
-    """YouTube Data API v3との通信"""
+    """YouTube Data API v3との通信
+
+    etag_cache を渡すと videos.list / playlistItems.list を If-None-Match 付きで送り、
+    変更がなければ (304) キャッシュ済みのレスポンスを再利用する。
+
+    httplib2.Http はスレッドセーフではないため、各リクエストには
+    http_factory で生成したスレッドごとのトランスポートを使う。
+    これにより複数スレッドから同じインスタンスを呼び出せる。
+    トランスポートは googleapiclient の build_http() で作り、タイムアウトと
+    リダイレクトの扱いを youtube クライアントの既定と揃える。
+    http_factory を省略した場合は youtube クライアントのトランスポートを共有する。
+    """
 
-    def __init__(self, youtube: YouTubeResource) -> None:
+    def __init__(
+        self,
+        youtube: YouTubeResource,
+        etag_cache: YouTubeEtagCache | None = None,
+        http_factory: Callable[[], httplib2.Http] | None = None,
+    ) -> None:
         self._youtube = youtube
+        self._etag_cache = etag_cache
+        self._http_factory = http_factory
+        self._thread_local = threading.local()
 
     @classmethod
-    def from_auth_provider(cls, auth_provider: YouTubeAuthProvider) -> Self:
+    def from_auth_provider(
+        cls,
+        auth_provider: YouTubeAuthProvider,
+        etag_cache: YouTubeEtagCache | None = None,
+    ) -> Self:
         """認証プロバイダーからインスタンスを生成"""
         credentials = auth_provider.get_credentials()
         youtube: YouTubeResource = build(
@@ -60,77 +142,198 @@ class YouTubeApiGateway:
             version="v3",
             credentials=credentials,
         )
-        return cls(youtube=youtube)
+        return cls(
+            youtube=youtube,
+            etag_cache=etag_cache,
+            http_factory=lambda: AuthorizedHttp(
+                credentials=credentials,
+                http=_build_http(),
+            ),
+        )
 
-    def get_video_info(self, video_id: str) -> VideoInfo:
-        response = self._youtube.videos().list(part="snippet", id=video_id).execute()
+    @classmethod
+    def from_api_endpoint(
+        cls,
+        api_endpoint: str,
+        etag_cache: YouTubeEtagCache | None = None,
+    ) -> Self:
+        """任意のエンドポイントに接続するインスタンスを生成 (認証なし)
 
-        parsed = YouTubeVideosListResponse.model_validate(obj=response)
+        ローカルのフェイクサーバーに向けてオフラインで動作確認・計測するために使う。
+        """
+        youtube: YouTubeResource = build(
+            serviceName="youtube",
+            version="v3",
+            http=_build_http(),
+            client_options={"api_endpoint": api_endpoint},
+        )
+        return cls(youtube=youtube, etag_cache=etag_cache, http_factory=_build_http)
 
-        if not parsed.items:
-            msg = f"Video not found: {video_id}"
-            raise VideoNotFoundError(msg)
+    def _thread_http(self) -> httplib2.Http | None:
+        """呼び出し元スレッド専用のトランスポートを返す
 
-        return _video_info_from_api_response(item=parsed.items[0])
+        http_factory がなければ None (youtube クライアントのトランスポートを使う)。
+        """
+        if self._http_factory is None:
+            return None
 
-    def update_video(self, request: VideoUpdateRequest) -> None:
-        """動画のsnippetを更新"""
-        self._youtube.videos().update(
-            part="snippet",
-            body=_to_api_body(request=request),
-        ).execute()
+        http: httplib2.Http | None = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = self._http_factory()
+            self._thread_local.http = http
 
-    def list_playlist_items(self, playlist_id: str) -> dict[str, PlaylistItem]:
-        """プレイリスト内のアイテムを取得
+        return http
 
-        Returns:
-            video_id -> PlaylistItem のマッピング
+    def _execute_conditional(
+        self,
+        request: HttpRequest,
+        cache_key: str,
+        http: httplib2.Http | None = None,
+    ) -> dict[str, Any]:
+        """キャッシュ済みETagがあれば条件付きでリクエストを実行する
 
+        304 Not Modified の場合はキャッシュ済みのレスポンスを返す。
         """
-        result: dict[str, PlaylistItem] = {}
-        page_token: str | None = None
+        cached = self._etag_cache.get(key=cache_key) if self._etag_cache else None
 
-        while True:
+        if cached is not None:
+            request.headers = {**(request.headers or {}), "If-None-Match": cached.etag}
+
+        try:
+            response: dict[str, Any] = request.execute(http=http)
+        except HttpError as e:
+            if cached is not None and e.resp.status == HTTPStatus.NOT_MODIFIED:
+                return cached.response
+            raise
+
+        if self._etag_cache is not None and (etag := response.get("etag")):
+            self._etag_cache.put(key=cache_key, etag=etag, response=response)
+
+        return response
+
+    def get_videos_info(self, video_ids: Sequence[str]) -> dict[str, VideoInfo]:
+        """複数の動画情報を1回のvideos.listで取得する (最大50件)
+
+        見つからなかった動画は結果に含めない。
+        YouTube が取得を拒否した場合は VideoFetchError を送出する。
+        """
+        # 同じ動画の組なら渡された順序や重複によらず同じリクエスト・キーにする
+        joined_ids = ",".join(sorted(set(video_ids)))
+        try:
+            response = self._execute_conditional(
+                request=self._youtube.videos().list(part="snippet", id=joined_ids),
+                cache_key=f"videos.list:{joined_ids}",
+                http=self._thread_http(),
+            )
+        except HttpError as e:
+            msg = (
+                f"Failed to fetch {len(video_ids)} videos: "
+                f"HTTP {e.resp.status} {e.reason}"
+            )
+            raise VideoFetchError(msg) from e
+
+        parsed = YouTubeVideosListResponse.model_validate(obj=response)
+        return {
+            item.id: _video_info_from_api_response(item=item) for item in parsed.items
+        }
+
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        """動画のsnippetを更新し、更新後のETagを返す
+
+        YouTube が更新を拒否した場合は VideoUpdateError を送出する。
+        """
+        try:
             response = (
-                self._youtube.playlistItems()
-                .list(
-                    part="snippet,contentDetails",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=page_token,  # type: ignore[arg-type]
+                self._youtube.videos()
+                .update(
+                    part="snippet",
+                    body=_to_api_body(request=request),
                 )
-                .execute()
+                .execute(http=self._thread_http())
             )
+        except HttpError as e:
+            msg = (
+                f"Failed to update video {request.video_id}: "
+                f"HTTP {e.resp.status} {e.reason}"
+            )
+            raise VideoUpdateError(msg) from e
 
-            parsed = YouTubePlaylistItemsListResponse.model_validate(obj=response)
+        return response.get("etag")
 
-            for item in parsed.items:
-                result[item.content_details.video_id] = PlaylistItem(
-                    video_id=item.content_details.video_id,
-                    playlist_item_id=item.id,
-                    position=item.snippet.position,
-                )
+    def fetch_playlist(self, playlist_id: str) -> PlaylistSnapshot:
+        """プレイリスト全体を、取得時点を表すETagと共に取得する"""
+        page_etags: list[str | None] = []
+        items: list[PlaylistItem] = []
+        page_token: str | None = None
 
-            if not (page_token := parsed.next_page_token):
+        while True:
+            page = self._fetch_playlist_page(
+                playlist_id=playlist_id,
+                page_token=page_token,
+            )
+            page_etags.append(page.etag)
+            items.extend(_playlist_items_from_page(page=page))
+
+            if not (page_token := page.next_page_token):
                 break
 
-        return result
+        return PlaylistSnapshot(
+            etag=_combine_page_etags(page_etags=page_etags, items=items),
+            items=tuple(items),
+        )
 
-    def add_to_playlist(self, playlist_id: str, video_id: str, position: int) -> None:
-        """動画をプレイリストに追加する"""
-        self._youtube.playlistItems().insert(
-            part="snippet",
-            body={
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "position": position,
-                    "resourceId": {
-                        "kind": "youtube#video",
-                        "videoId": video_id,
-                    },
-                },
+    def _fetch_playlist_page(
+        self,
+        playlist_id: str,
+        page_token: str | None,
+    ) -> YouTubePlaylistItemsListResponse:
+        """playlistItems.list を1ページ分実行する"""
+        response = self._execute_conditional(
+            request=self._youtube.playlistItems().list(
+                part="snippet,contentDetails",
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=page_token,  # type: ignore[arg-type]
+            ),
+            cache_key=f"playlistItems.list:{playlist_id}:{page_token or ''}",
+            http=self._thread_http(),
+        )
+
+        return YouTubePlaylistItemsListResponse.model_validate(obj=response)
+
+    def add_to_playlist(
+        self,
+        playlist_id: str,
+        video_id: str,
+        position: int | None = None,
+    ) -> PlaylistItem:
+        """動画をプレイリストに追加し、追加されたアイテムを返す
+
+        position を省略した場合は末尾に追加する。
+        """
+        snippet: PlaylistItemSnippet = {
+            "playlistId": playlist_id,
+            "resourceId": {
+                "kind": "youtube#video",
+                "videoId": video_id,
             },
-        ).execute()
+        }
+        if position is not None:
+            snippet["position"] = position
+
+        response = (
+            self._youtube.playlistItems()
+            .insert(part="snippet", body={"snippet": snippet})
+            .execute(http=self._thread_http())
+        )
+
+        parsed = YouTubePlaylistItemInsertResponse.model_validate(obj=response)
+
+        return PlaylistItem(
+            video_id=video_id,
+            playlist_item_id=parsed.id,
+            position=parsed.snippet.position,
+        )
 
     def update_playlist_item_position(
         self,
@@ -153,4 +356,4 @@ class YouTubeApiGateway:
                     },
                 },
             },
-        ).execute()
+        ).execute(http=self._thread_http())
@@ -0,0 +1,120 @@
+"""YouTube API レスポンスのETagキャッシュ
+
+list系リクエストのETagとレスポンス本体をJSONファイルに保存し、
+次回以降は If-None-Match による条件付きリクエスト (304) で再利用する。
+キーは "<名前空間>:<個別のキー>" の形で、名前空間はリクエストの種類 (videos.list) や
+プレイリスト (playlistItems.list:<playlist_id>) を表す。videos.list のキーは同時に
+取得した動画IDの組で決まり、実行ごとに変わりうるため、保存時にはその実行で
+問い合わせた名前空間のうち、使わなかったエントリを捨てる。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, RootModel
+
+logger = logging.getLogger(name=__name__)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CachedResponse(BaseModel):
+    """ETagとそのETagに対応するレスポンス本体"""
+
+    model_config = ConfigDict(frozen=True)
+
+    etag: str
+    response: dict[str, Any]
+
+
+class _EtagCacheFileSchema(RootModel[dict[str, CachedResponse]]):
+    """キャッシュファイルのスキーマ (リクエストキー -> キャッシュ)"""
+
+
+def _namespace(key: str) -> str:
+    """キーの名前空間 (最後の ":" より前)"""
+    return key.rpartition(":")[0]
+
+
+class YouTubeEtagCache:
+    """リクエストキーごとにETagとレスポンスを保持するキャッシュ
+
+    file_path を省略した場合はメモリ上のみで保持する。
+    バックグラウンドスレッドからも参照されるためスレッドセーフにしている。
+    """
+
+    def __init__(self, file_path: Path | None = None) -> None:
+        self._file_path = file_path
+        self._entries: dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        # この実行で参照した (ヒットした) か保存したキー
+        self._touched: set[str] = set()
+        # この実行で問い合わせた (ヒットしなかった場合も含む) 名前空間
+        self._queried: set[str] = set()
+
+        if file_path is not None:
+            self._entries = self._load(file_path=file_path)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            cached = self._entries.get(key)
+            self._queried.add(_namespace(key=key))
+            if cached is not None:
+                self._touched.add(key)
+            return cached
+
+    def put(self, key: str, etag: str, response: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = CachedResponse(etag=etag, response=response)
+            self._touched.add(key)
+            self._queried.add(_namespace(key=key))
+            self._dirty = True
+
+    def save(self) -> None:
+        """この実行で使わなかったエントリを捨て、変更があればファイルに書き出す
+
+        捨てるのはこの実行で問い合わせた名前空間のエントリだけで、動画の取得を
+        すべて同期状態ストアでスキップした場合の videos.list や、同期しなかった
+        プレイリストのページは残す。
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries.keys() - self._touched
+                if _namespace(key=key) in self._queried
+            ]
+            if stale:
+                for key in stale:
+                    del self._entries[key]
+                self._dirty = True
+
+            if self._file_path is None or not self._dirty:
+                return
+
+            data = _EtagCacheFileSchema(root=self._entries).model_dump_json()
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            # 書き込み途中で中断しても壊れたファイルを残さないよう置き換える
+            tmp_path = self._file_path.with_suffix(suffix=".tmp")
+            tmp_path.write_text(data=data, encoding="utf-8")
+            tmp_path.replace(target=self._file_path)
+            self._dirty = False
+
+    @staticmethod
+    def _load(file_path: Path) -> dict[str, CachedResponse]:
+        if not file_path.exists():
+            return {}
+
+        try:
+            data = json.loads(s=file_path.read_text(encoding="utf-8"))
+            return _EtagCacheFileSchema.model_validate(obj=data).root
+        except ValueError:
+            # JSONDecodeError / ValidationError (いずれも ValueError のサブクラス)。
+            # キャッシュは性能のためだけのものなので、壊れていれば捨てて作り直す
+            logger.warning("Ignoring corrupted ETag cache: %s", file_path)
+            return {}
@@ -29,12 +29,14 @@ class YouTubeVideoItem(_YouTubeBaseSchema):
     """YouTube API video item レスポンス"""
 
     id: str
+    etag: str | None = None
     snippet: YouTubeSnippet
 
 
 class YouTubeVideosListResponse(_YouTubeBaseSchema):
     """YouTube API videos.list レスポンス"""
 
+    etag: str | None = None
     items: list[YouTubeVideoItem]
 
 
@@ -55,12 +57,21 @@ class YouTubePlaylistItem(_YouTubeBaseSchema):
     """YouTube API playlistItems レスポンスのアイテム"""
 
     id: str
+    etag: str | None = None
     content_details: YouTubePlaylistItemContentDetails
     snippet: YouTubePlaylistItemSnippet
 
 
+class YouTubePlaylistItemInsertResponse(_YouTubeBaseSchema):
+    """YouTube API playlistItems.insert レスポンス (part=snippet)"""
+
+    id: str
+    snippet: YouTubePlaylistItemSnippet
+
+
 class YouTubePlaylistItemsListResponse(_YouTubeBaseSchema):
     """YouTube API playlistItems.list レスポンス"""
 
+    etag: str | None = None
     items: list[YouTubePlaylistItem]
     next_page_token: str | None = None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date, datetime
     from zoneinfo import ZoneInfo
 
     from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
@@ -38,3 +43,103 @@ class ConferenceSchedule:
     def sessions_with_content(self) -> tuple[Session, ...]:
         """コンテンツのあるセッションのみ取得"""
         return tuple(s for s in self.sessions if s.has_content)
+
+    def sessions_on(self, dates: Iterable[date]) -> list[Session]:
+        """指定日 (会場のタイムゾーン) のセッション"""
+        return [
+            session for day in dates for session in self._sessions_by_date.get(day, ())
+        ]
+
+    def sessions_in_rooms(self, rooms: Iterable[str]) -> list[Session]:
+        """指定した部屋のセッション"""
+        return [
+            session
+            for room in rooms
+            for session in self._sessions_by_room.get(room, ())
+        ]
+
+    def sessions_in_tracks(self, tracks: Iterable[str]) -> list[Session]:
+        """指定したトラックのセッション"""
+        return [
+            session
+            for track in tracks
+            for session in self._sessions_by_track.get(track, ())
+        ]
+
+    def sessions_at(self, slots: Iterable[ScheduleSlot]) -> list[Session]:
+        """指定スロットのセッション (セッションのないスロットは無視)"""
+        return [
+            self._sessions_by_slot[slot]
+            for slot in slots
+            if slot in self._sessions_by_slot
+        ]
+
+    def session_by_url(self, url: str) -> Session | None:
+        """セッションページのURLからセッションを引く (同じURLが複数あれば最初のもの)"""
+        return self._sessions_by_url.get(url)
+
+    def sessions_between(self, start: datetime, end: datetime) -> list[Session]:
+        """開始時刻が start 以上 end 未満のセッションを開始時刻順に返す
+
+        同じ時刻のセッションは元の順序のまま。start と end はタイムゾーン付きで渡す。
+        """
+        timeslots = self._timeslots
+        low = bisect_left(timeslots, start)
+        high = bisect_left(timeslots, end, lo=low)
+        return list(self._sessions_by_time[low:high])
+
+    def subset(self, sessions: Iterable[Session]) -> ConferenceSchedule:
+        """指定したセッションだけを元の順序で持つスケジュール"""
+        positions = self._positions
+        selected = sorted(
+            {session.slot: session for session in sessions}.values(),
+            key=lambda session: positions[session.slot],
+        )
+        return replace(self, sessions=tuple(selected))
+
+    # 以下の索引はそれぞれ初回の検索時に1度だけ作る
+
+    @cached_property
+    def _positions(self) -> dict[ScheduleSlot, int]:
+        return {session.slot: index for index, session in enumerate(self.sessions)}
+
+    @cached_property
+    def _sessions_by_slot(self) -> dict[ScheduleSlot, Session]:
+        return {session.slot: session for session in self.sessions}
+
+    @cached_property
+    def _sessions_by_date(self) -> dict[date, list[Session]]:
+        index: defaultdict[date, list[Session]] = defaultdict(list)
+        for session in self.sessions:
+            index[session.slot.timeslot.date()].append(session)
+        return dict(index)
+
+    @cached_property
+    def _sessions_by_room(self) -> dict[str, list[Session]]:
+        index: defaultdict[str, list[Session]] = defaultdict(list)
+        for session in self.sessions:
+            index[session.slot.room].append(session)
+        return dict(index)
+
+    @cached_property
+    def _sessions_by_track(self) -> dict[str, list[Session]]:
+        index: defaultdict[str, list[Session]] = defaultdict(list)
+        for session in self.sessions:
+            index[session.track].append(session)
+        return dict(index)
+
+    @cached_property
+    def _sessions_by_url(self) -> dict[str, Session]:
+        index: dict[str, Session] = {}
+        for session in self.sessions:
+            if session.url:
+                index.setdefault(session.url, session)
+        return index
+
+    @cached_property
+    def _sessions_by_time(self) -> tuple[Session, ...]:
+        return tuple(sorted(self.sessions, key=lambda session: session.slot.timeslot))
+
+    @cached_property
+    def _timeslots(self) -> list[datetime]:
+        return [session.slot.timeslot for session in self._sessions_by_time]
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleSlot:
     """カンファレンスのスケジュールスロット (時間帯 + 部屋)"""
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from confengine_to_youtube.domain.speaker import Speaker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Session:
     slot: ScheduleSlot
     title: str
@@ -19,6 +19,25 @@ class Session:
     speakers: tuple[Speaker, ...]
     abstract: SessionAbstract
     url: str
+    # スピーカー部分の表記は生成のたびに何度も参照されるため、初回に組み立てて保持する
+    _speakers_full: str | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _speakers_initials: str | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _speakers_last_name: str | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         """タイトルが空でないことを検証"""
@@ -33,14 +52,26 @@ class Session:
     @property
     def speakers_full(self) -> str:
         """スピーカー部分をフルネームで生成"""
-        return ", ".join(s.full_name for s in self.speakers if s.full_name)
+        value = self._speakers_full
+        if value is None:
+            value = ", ".join(s.full_name for s in self.speakers if s.full_name)
+            object.__setattr__(self, "_speakers_full", value)
+        return value
 
     @property
     def speakers_initials(self) -> str:
         """スピーカー部分をイニシャル表記で生成"""
-        return ", ".join(s.initial_name for s in self.speakers if s.initial_name)
+        value = self._speakers_initials
+        if value is None:
+            value = ", ".join(s.initial_name for s in self.speakers if s.initial_name)
+            object.__setattr__(self, "_speakers_initials", value)
+        return value
 
     @property
     def speakers_last_name(self) -> str:
         """スピーカー部分をラストネームのみで生成"""
-        return ", ".join(s.last_name for s in self.speakers if s.last_name)
+        value = self._speakers_last_name
+        if value is None:
+            value = ", ".join(s.last_name for s in self.speakers if s.last_name)
+            object.__setattr__(self, "_speakers_last_name", value)
+        return value
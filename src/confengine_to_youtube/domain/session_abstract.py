@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionAbstract:
     """セッション概要 (Markdown形式のテキストを保持)"""
 
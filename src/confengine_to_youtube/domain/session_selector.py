@@ -0,0 +1,123 @@
+"""対象セッションの絞り込み条件"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+    from datetime import date, datetime
+
+    from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
+    from confengine_to_youtube.domain.session import Session
+    from confengine_to_youtube.domain.video_mapping import MappingConfig
+
+
+@dataclass(frozen=True)
+class SessionSelector:
+    """対象セッションの絞り込み条件
+
+    条件の種類どうしは AND、同じ種類の値どうしは OR。値のない種類では絞り込まない。
+    """
+
+    dates: frozenset[date] = frozenset()
+    rooms: frozenset[str] = frozenset()
+    tracks: frozenset[str] = frozenset()
+    # 会場のタイムゾーンでの開始日時 (タイムゾーンなし) と部屋の組
+    slots: frozenset[tuple[datetime, str]] = frozenset()
+    video_ids: frozenset[str] = frozenset()
+
+    @property
+    def is_empty(self) -> bool:
+        """絞り込み条件が1つもないかどうか"""
+        return not (
+            self.dates or self.rooms or self.tracks or self.slots or self.video_ids
+        )
+
+    def select(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> tuple[ConferenceSchedule, MappingConfig]:
+        """条件に合うセッションとそのマッピングだけに絞り込む
+
+        条件ごとの索引から候補が最も少ない条件を選び、その候補だけを他の条件で
+        確かめるため、計算量はスケジュール全体ではなく候補の数に比例する。
+        """
+        if self.is_empty:
+            return schedule, mapping_config
+
+        criteria = self._criteria(schedule=schedule, mapping_config=mapping_config)
+        candidates, _ = min(criteria, key=lambda criterion: len(criterion[0]))
+        selected = [
+            session
+            for session in candidates
+            if all(matches(session) for _, matches in criteria)
+        ]
+
+        return (
+            schedule.subset(sessions=selected),
+            mapping_config.subset(slots=(session.slot for session in selected)),
+        )
+
+    def _criteria(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> list[tuple[Collection[Session], Callable[[Session], bool]]]:
+        """指定された条件ごとの (索引から引いた候補, 判定関数)"""
+        criteria: list[tuple[Collection[Session], Callable[[Session], bool]]] = []
+
+        if self.dates:
+            criteria.append(
+                (
+                    schedule.sessions_on(dates=self.dates),
+                    lambda session: session.slot.timeslot.date() in self.dates,
+                ),
+            )
+        if self.rooms:
+            criteria.append(
+                (
+                    schedule.sessions_in_rooms(rooms=self.rooms),
+                    lambda session: session.slot.room in self.rooms,
+                ),
+            )
+        if self.tracks:
+            criteria.append(
+                (
+                    schedule.sessions_in_tracks(tracks=self.tracks),
+                    lambda session: session.track in self.tracks,
+                ),
+            )
+        if self.slots:
+            slots = frozenset(
+                ScheduleSlot(
+                    timeslot=timeslot.replace(tzinfo=schedule.timezone),
+                    room=room,
+                )
+                for timeslot, room in self.slots
+            )
+            criteria.append(
+                (
+                    schedule.sessions_at(slots=slots),
+                    lambda session: session.slot in slots,
+                ),
+            )
+        if self.video_ids:
+            video_slots = frozenset(
+                mapping.slot
+                for mapping in mapping_config.mappings_for_videos(
+                    video_ids=self.video_ids,
+                )
+            )
+            criteria.append(
+                (
+                    schedule.sessions_at(slots=video_slots),
+                    lambda session: session.slot in video_slots,
+                ),
+            )
+
+        return criteria
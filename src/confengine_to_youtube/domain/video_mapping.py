@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import date
+
     from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+    from confengine_to_youtube.domain.session import Session
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoMapping:
     slot: ScheduleSlot
     video_id: str
@@ -19,19 +25,84 @@ class VideoMapping:
 
 @dataclass(frozen=True)
 class MappingConfig:
+    """マッピング設定
+
+    playlist_id は全セッションを並べるプレイリスト。
+    day_playlist_ids / track_playlist_ids は、日付・トラックごとに
+    該当セッションだけを並べるプレイリスト。
+    """
+
     conf_id: str
     playlist_id: str
     mappings: frozenset[VideoMapping]
     hashtags: tuple[str, ...]
     footer: str
+    day_playlist_ids: Mapping[date, str] = field(default_factory=dict)
+    track_playlist_ids: Mapping[str, str] = field(default_factory=dict)
 
-    def find_mapping(self, slot: ScheduleSlot) -> VideoMapping | None:
-        # 線形検索だが、セッション数は通常数百以下のため実用上問題なし
-        for mapping in self.mappings:
-            if mapping.slot == slot:
-                return mapping
+    @property
+    def playlist_ids(self) -> tuple[str, ...]:
+        """同期対象の全プレイリスト (全セッション用が先頭、重複なし)"""
+        return tuple(
+            dict.fromkeys(
+                (
+                    self.playlist_id,
+                    *self.day_playlist_ids.values(),
+                    *self.track_playlist_ids.values(),
+                ),
+            ),
+        )
+
+    def playlist_ids_for(self, session: Session) -> tuple[str, ...]:
+        """セッションの動画を並べるプレイリスト (重複なし)"""
+        day_playlist_id = self.day_playlist_ids.get(session.slot.timeslot.date())
+        track_playlist_id = self.track_playlist_ids.get(session.track)
 
-        return None
+        return tuple(
+            dict.fromkeys(
+                playlist_id
+                for playlist_id in (
+                    self.playlist_id,
+                    day_playlist_id,
+                    track_playlist_id,
+                )
+                if playlist_id is not None
+            ),
+        )
+
+    def find_mapping(self, slot: ScheduleSlot) -> VideoMapping | None:
+        # スロットの索引は最初の呼び出しで1度だけ作り、以降は O(1) で引く
+        return self._mappings_by_slot.get(slot)
 
     def find_unused(self, used_slots: set[ScheduleSlot]) -> frozenset[VideoMapping]:
         return frozenset(m for m in self.mappings if m.slot not in used_slots)
+
+    def mappings_for_videos(self, video_ids: Iterable[str]) -> list[VideoMapping]:
+        """指定した動画のマッピング (1つの動画が複数スロットにある場合は全て)"""
+        return [
+            mapping
+            for video_id in video_ids
+            for mapping in self._mappings_by_video_id.get(video_id, ())
+        ]
+
+    def subset(self, slots: Iterable[ScheduleSlot]) -> MappingConfig:
+        """指定スロットのマッピングだけを持つ設定 (プレイリスト設定はそのまま)"""
+        return replace(
+            self,
+            mappings=frozenset(
+                self._mappings_by_slot[slot]
+                for slot in slots
+                if slot in self._mappings_by_slot
+            ),
+        )
+
+    @cached_property
+    def _mappings_by_slot(self) -> dict[ScheduleSlot, VideoMapping]:
+        return {mapping.slot: mapping for mapping in self.mappings}
+
+    @cached_property
+    def _mappings_by_video_id(self) -> dict[str, list[VideoMapping]]:
+        index: defaultdict[str, list[VideoMapping]] = defaultdict(list)
+        for mapping in self.mappings:
+            index[mapping.video_id].append(mapping)
+        return dict(index)
@@ -19,6 +19,9 @@ from confengine_to_youtube.domain.youtube_title import YouTubeTitle
 if TYPE_CHECKING:
     from confengine_to_youtube.domain.session import Session
 
+# 説明文のテンプレートで abstract を差し込む位置の印 (セッション情報には現れない文字)
+_ABSTRACT_MARKER = "\x00"
+
 
 class YouTubeContentGenerator:
     """SessionからYouTube用コンテンツを生成するドメインサービス
@@ -106,11 +109,13 @@ class YouTubeContentGenerator:
         abstract = str(session.abstract)
         max_length = YouTubeDescription.MAX_LENGTH
 
-        frame_length = _calculate_frame_length(
+        # Markdown文書の組み立ては1回だけにし、abstract は切り詰めた後で差し込む
+        template = _build_description_template(
             session=session,
             hashtags=hashtags,
             footer=footer,
         )
+        frame_length = _calculate_frame_length(session=session, template=template)
         available = max_length - frame_length
 
         if available < len(ELLIPSIS):
@@ -119,11 +124,8 @@ class YouTubeContentGenerator:
         if abstract and len(abstract) > available:
             abstract = abstract[: available - len(ELLIPSIS)] + ELLIPSIS
 
-        description_text = _build_description_document(
-            session=session,
-            abstract=abstract,
-            hashtags=hashtags,
-            footer=footer,
+        description_text = YouTubeDescription.sanitize_for_youtube(
+            text=template.replace(_ABSTRACT_MARKER, abstract, 1),
         )
 
         return YouTubeDescription.create(value=description_text)
@@ -167,37 +169,29 @@ def _truncate_title_keeping_speaker(title: str, speaker_part: str) -> str:
     return f"{truncated}{TITLE_SPEAKER_SEPARATOR}{speaker_part}"
 
 
-def _calculate_frame_length(
-    session: Session,
-    hashtags: tuple[str, ...],
-    footer: str,
-) -> int:
+def _calculate_frame_length(session: Session, template: str) -> int:
     """フレーム部分 (abstract以外) の文字数を計算"""
-    placeholder = "X" if session.has_content else ""
-    doc_with_placeholder = _build_description_document(
-        session=session,
-        abstract=placeholder,
-        hashtags=hashtags,
-        footer=footer,
-    )
+    marker_length = len(_ABSTRACT_MARKER) if session.has_content else 0
 
-    return len(doc_with_placeholder) - len(placeholder)
+    return len(YouTubeDescription.sanitize_for_youtube(text=template)) - marker_length
 
 
-def _build_description_document(
+def _build_description_template(
     session: Session,
-    abstract: str,
     hashtags: tuple[str, ...],
     footer: str,
 ) -> str:
-    """説明文のMarkdown文書を構築"""
+    """説明文のMarkdown文書を、abstract の位置に _ABSTRACT_MARKER を置いて構築
+
+    YouTube向けの文字の置換は abstract を差し込んだ後に行うため、ここでは行わない。
+    """
     doc = Document()
 
     if session.speakers_full:
         doc.add_paragraph(text=f"Speaker: {session.speakers_full}")
 
-    if abstract:
-        doc.add_raw(text=abstract)
+    if session.has_content:
+        doc.add_raw(text=_ABSTRACT_MARKER)
 
     doc.add_horizontal_rule()
 
@@ -212,4 +206,4 @@ def _build_description_document(
     if footer:
         doc.add_paragraph(text=footer)
 
-    return YouTubeDescription.sanitize_for_youtube(text=str(doc))
+    return str(doc)
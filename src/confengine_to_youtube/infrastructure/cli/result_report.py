@@ -0,0 +1,116 @@
+"""実行結果のフェーズ別計測の表示とJSON変換"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from confengine_to_youtube.usecases.dto import (
+        PhaseTiming,
+        PlaylistSyncResult,
+        VideoUpdateRecord,
+        VideoUpdateResult,
+    )
+
+
+def format_phase_table(phases: Sequence[PhaseTiming]) -> str:
+    """フェーズ別の回数・累計時間・平均時間を固定幅の表にする"""
+    name_width = max((len(timing.name) for timing in phases), default=0)
+    name_width = max(name_width, len("phase"))
+
+    lines = [f"{'phase':<{name_width}} {'calls':>6} {'total':>9} {'avg':>9}"]
+    lines.extend(
+        f"{timing.name:<{name_width}} {timing.calls:>6} "
+        f"{timing.seconds:>8.3f}s {timing.seconds / timing.calls * 1000:>7.1f}ms"
+        for timing in phases
+    )
+
+    return "\n".join(lines)
+
+
+def phases_to_dict(phases: Sequence[PhaseTiming]) -> list[dict[str, Any]]:
+    return [
+        {"name": timing.name, "calls": timing.calls, "seconds": timing.seconds}
+        for timing in phases
+    ]
+
+
+def record_to_dict(record: VideoUpdateRecord) -> dict[str, Any]:
+    """1セッションの結果をJSONに変換できる形にする"""
+    return {
+        "session_key": record.session_key,
+        "video_id": record.video_id,
+        "status": record.status.name.lower(),
+        "title_changed": record.title_changed,
+        "description_changed": record.description_changed,
+        "error": record.error_message,
+        "elapsed_seconds": record.elapsed_seconds,
+        "update_seconds": record.update_seconds,
+    }
+
+
+def update_result_to_dict(result: VideoUpdateResult) -> dict[str, Any]:
+    """動画更新結果をJSONに変換できる形にする (プレビューの本文は含めない)"""
+    return {
+        "dry_run": result.is_dry_run,
+        "changed": result.changed_count,
+        "unchanged": result.unchanged_count,
+        "state_skipped": result.state_skipped_count,
+        "preserved": result.preserved_count,
+        "duplicate": result.duplicate_count,
+        "no_mapping": result.no_mapping_count,
+        "unused_mappings": result.unused_mappings_count,
+        "aborted": result.aborted,
+        "aborted_count": result.aborted_count,
+        "errors": [
+            {
+                "session_key": error.session_key,
+                "video_id": error.video_id,
+                "message": error.error.message,
+            }
+            for error in result.errors
+        ],
+        "stages": [
+            {
+                "name": stats.name,
+                "items": stats.items,
+                "busy_seconds": stats.busy_seconds,
+            }
+            for stats in result.stage_stats
+        ],
+        "phases": phases_to_dict(phases=result.phases),
+    }
+
+
+def playlist_result_to_dict(result: PlaylistSyncResult) -> dict[str, Any]:
+    """プレイリスト同期結果をJSONに変換できる形にする (操作の一覧・計測は含めない)"""
+    return {
+        "dry_run": result.is_dry_run,
+        "playlist_id": result.playlist_id,
+        "added": result.added_count,
+        "reordered": result.reordered_count,
+        "moved_to_end": result.moved_to_end_count,
+        "unchanged": result.unchanged_count,
+    }
+
+
+def report_to_dict(
+    result: VideoUpdateResult,
+    playlist_results: Sequence[PlaylistSyncResult],
+) -> dict[str, Any]:
+    """1回の実行結果全体をJSONに変換できる形にする
+
+    プレイリストのフェーズ別計測は全プレイリストで共通のため、1回だけ出力する。
+    """
+    return {
+        "update": update_result_to_dict(result=result),
+        "playlists": [
+            playlist_result_to_dict(result=playlist_result)
+            for playlist_result in playlist_results
+        ],
+        "playlist_phases": phases_to_dict(
+            phases=playlist_results[0].phases if playlist_results else (),
+        ),
+    }
@@ -1,19 +1,41 @@
 from __future__ import annotations
 
+import argparse
+import itertools
+import json
 import sys
 from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, assert_never
+from typing import TYPE_CHECKING, Any, assert_never
 
 from rich.console import Console
 
 from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.adapters.playlist_plan_file import PlaylistPlanFile
+from confengine_to_youtube.adapters.playlist_sync_journal import (
+    JsonlPlaylistSyncJournal,
+)
+from confengine_to_youtube.adapters.video_state_store import SqliteVideoStateStore
 from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
+from confengine_to_youtube.adapters.youtube_etag_cache import YouTubeEtagCache
+from confengine_to_youtube.domain.session_selector import SessionSelector
 from confengine_to_youtube.infrastructure.cli.diff_formatter import DiffFormatter
 from confengine_to_youtube.infrastructure.cli.factories import create_confengine_api
+from confengine_to_youtube.infrastructure.cli.result_report import (
+    format_phase_table,
+    record_to_dict,
+    report_to_dict,
+)
 from confengine_to_youtube.infrastructure.youtube_auth import YouTubeAuthClient
+from confengine_to_youtube.usecases.circuit_breaker import (
+    DEFAULT_MAX_CONSECUTIVE_FAILURES,
+    DEFAULT_MAX_FAILURE_RATE,
+    WriteFailurePolicy,
+)
 from confengine_to_youtube.usecases.dto import (
     PlaylistOperationType,
+    PlaylistSyncResult,
     PlaylistVideoOperation,
 )
 from confengine_to_youtube.usecases.sync_playlist import SyncPlaylistUseCase
@@ -22,9 +44,20 @@ from confengine_to_youtube.usecases.update_youtube_descriptions import (
 )
 
 if TYPE_CHECKING:
-    import argparse
+    from collections.abc import Callable, Sequence
 
-    from confengine_to_youtube.usecases.dto import PlaylistSyncResult, VideoUpdateResult
+    from confengine_to_youtube.usecases.dto import (
+        PhaseTiming,
+        VideoUpdatePreview,
+        VideoUpdateRecord,
+        VideoUpdateResult,
+    )
+
+# 動画の更新に失敗した場合の終了コード (打ち切らなかった場合も含む)。
+# 他のエラーでも1で終了する
+EXIT_UPDATES_FAILED = 1
+# 動画の更新の失敗が続いて打ち切った場合の終了コード
+EXIT_UPDATES_ABORTED = 3
 
 
 @dataclass(frozen=True)
@@ -35,6 +68,32 @@ class YouTubeUpdateConfig:
     credentials_path: Path
     token_path: Path
     dry_run: bool
+    api_endpoint: str | None
+    workspace: Path
+    state_ttl: timedelta | None
+    verify_remote: bool
+    verify_playlist: bool
+    plan_out: Path | None
+    apply_plan: Path | None
+    resume: bool
+    output: str
+    selector: SessionSelector
+    write_failure_policy: WriteFailurePolicy
+
+    @property
+    def etag_cache_path(self) -> Path:
+        """ETagキャッシュファイルのパス"""
+        return self.workspace / "youtube_etag_cache.json"
+
+    @property
+    def state_db_path(self) -> Path:
+        """同期状態データベースのパス"""
+        return self.workspace / "video_state.sqlite3"
+
+    @property
+    def journal_dir(self) -> Path:
+        """プレイリスト同期ジャーナルの保存先"""
+        return self.workspace / "journal"
 
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> YouTubeUpdateConfig:
@@ -44,6 +103,30 @@ class YouTubeUpdateConfig:
             credentials_path=Path(args.credentials),
             token_path=Path(args.token),
             dry_run=args.dry_run,
+            api_endpoint=args.api_endpoint,
+            workspace=Path(args.workspace),
+            state_ttl=(
+                timedelta(hours=args.state_ttl_hours)
+                if args.state_ttl_hours is not None
+                else None
+            ),
+            verify_remote=args.verify_remote,
+            verify_playlist=args.verify_playlist,
+            plan_out=Path(args.plan_out) if args.plan_out else None,
+            apply_plan=Path(args.apply_plan) if args.apply_plan else None,
+            resume=args.resume,
+            output=args.output,
+            selector=SessionSelector(
+                dates=frozenset(args.date or ()),
+                rooms=frozenset(args.room or ()),
+                tracks=frozenset(args.track or ()),
+                slots=frozenset(args.slot or ()),
+                video_ids=frozenset(args.video_id or ()),
+            ),
+            write_failure_policy=WriteFailurePolicy(
+                max_consecutive_failures=args.max_consecutive_failures,
+                max_failure_rate=args.max_failure_rate,
+            ),
         )
 
 
@@ -69,12 +152,138 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="実際の更新を行わずプレビュー表示",
     )
+    parser.add_argument(
+        "--api-endpoint",
+        help="YouTube Data APIのエンドポイント (指定時はOAuth認証を行わない)",
+    )
+    parser.add_argument(
+        "--workspace",
+        default="workspace",
+        help="ETagキャッシュなどの状態ファイルの保存先ディレクトリ",
+    )
+    parser.add_argument(
+        "--state-ttl-hours",
+        type=float,
+        help=(
+            "前回同期時と生成内容が同じ動画の取得を省略する期間 (時間)。省略時は無期限"
+        ),
+    )
+    parser.add_argument(
+        "--verify-remote",
+        action="store_true",
+        help="前回同期時と生成内容が同じ動画もYouTubeから取得して比較",
+    )
+    parser.add_argument(
+        "--verify-playlist",
+        action="store_true",
+        help="プレイリスト同期後に1回だけ再取得して並びを確認",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="中断したプレイリスト同期があれば続きから再開",
+    )
+    parser.add_argument(
+        "--output",
+        choices=("text", "json", "ndjson"),
+        default="text",
+        help=(
+            "結果の出力形式。json は件数とフェーズ別の計測を標準出力に出す。"
+            "ndjson は処理を終えたセッションから1行ずつ出力し、最後に集計を出す"
+            " (既定: text)"
+        ),
+    )
+    parser.add_argument(
+        "--max-consecutive-failures",
+        type=int,
+        default=DEFAULT_MAX_CONSECUTIVE_FAILURES,
+        help=(
+            "動画の更新がこの回数連続で失敗したら残りの更新を打ち切る"
+            f" (既定: {DEFAULT_MAX_CONSECUTIVE_FAILURES})"
+        ),
+    )
+    parser.add_argument(
+        "--max-failure-rate",
+        type=float,
+        default=DEFAULT_MAX_FAILURE_RATE,
+        help=(
+            "直近の動画の更新のうちこの割合以上が失敗したら残りの更新を打ち切る"
+            f" (既定: {DEFAULT_MAX_FAILURE_RATE})"
+        ),
+    )
+    select_group = parser.add_argument_group(
+        title="対象セッションの絞り込み",
+        description=(
+            "指定した条件に合うセッションの動画だけを更新・プレイリストに反映する。"
+            "各オプションは複数回指定でき、同じオプションどうしはOR、"
+            "異なるオプションどうしはANDで絞り込む"
+        ),
+    )
+    select_group.add_argument(
+        "--date",
+        action="append",
+        type=_parse_date,
+        help="開催日 (YYYY-MM-DD)",
+    )
+    select_group.add_argument(
+        "--room",
+        action="append",
+        help="部屋名",
+    )
+    select_group.add_argument(
+        "--track",
+        action="append",
+        help="トラック名",
+    )
+    select_group.add_argument(
+        "--slot",
+        action="append",
+        type=_parse_slot,
+        help='会場の現地時刻での開始日時と部屋名 ("YYYY-MM-DD HH:MM 部屋名")',
+    )
+    select_group.add_argument(
+        "--video-id",
+        action="append",
+        help="YouTube動画ID",
+    )
+    plan_group = parser.add_mutually_exclusive_group()
+    plan_group.add_argument(
+        "--plan-out",
+        help="プレイリスト同期計画をJSONファイルに保存 (プレイリストは変更しない)",
+    )
+    plan_group.add_argument(
+        "--apply-plan",
+        help="保存済みのプレイリスト同期計画を適用",
+    )
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError as e:
+        msg = f"invalid date (expected YYYY-MM-DD): {value}"
+        raise argparse.ArgumentTypeError(msg) from e
+
+
+def _parse_slot(value: str) -> tuple[datetime, str]:
+    parts = value.split(maxsplit=2)
+    msg = f"invalid slot (expected 'YYYY-MM-DD HH:MM ROOM'): {value}"
+    if len(parts) != 3:  # noqa: PLR2004
+        raise argparse.ArgumentTypeError(msg)
+
+    day, time, room = parts
+    try:
+        timeslot = datetime.strptime(f"{day} {time}", "%Y-%m-%d %H:%M")  # noqa: DTZ007
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(msg) from e
+
+    return timeslot, room
 
 
 def run(args: argparse.Namespace) -> None:
     config = YouTubeUpdateConfig.from_args(args=args)
 
-    if not config.credentials_path.exists():
+    if config.api_endpoint is None and not config.credentials_path.exists():
         print(  # noqa: T201
             f"Error: credentials file not found: {config.credentials_path}",
             file=sys.stderr,
@@ -88,52 +297,182 @@ def run(args: argparse.Namespace) -> None:
     confengine_api = create_confengine_api()
     mapping_reader = MappingFileReader()
 
-    auth_client = YouTubeAuthClient(
-        credentials_path=config.credentials_path,
-        token_path=config.token_path,
-    )
-    youtube_api = YouTubeApiGateway.from_auth_provider(auth_provider=auth_client)
+    etag_cache = YouTubeEtagCache(file_path=config.etag_cache_path)
+
+    if config.api_endpoint is not None:
+        youtube_api = YouTubeApiGateway.from_api_endpoint(
+            api_endpoint=config.api_endpoint,
+            etag_cache=etag_cache,
+        )
+    else:
+        auth_client = YouTubeAuthClient(
+            credentials_path=config.credentials_path,
+            token_path=config.token_path,
+        )
+        youtube_api = YouTubeApiGateway.from_auth_provider(
+            auth_provider=auth_client,
+            etag_cache=etag_cache,
+        )
+
+    state_store = SqliteVideoStateStore(db_path=config.state_db_path)
 
     update_usecase = UpdateYouTubeDescriptionsUseCase(
         confengine_api=confengine_api,
         mapping_reader=mapping_reader,
         youtube_api=youtube_api,
+        state_store=state_store,
+        state_ttl=config.state_ttl,
+        write_failure_policy=config.write_failure_policy,
     )
 
     sync_usecase = SyncPlaylistUseCase(
         confengine_api=confengine_api,
         mapping_reader=mapping_reader,
         youtube_api=youtube_api,
+        journal=JsonlPlaylistSyncJournal(directory=config.journal_dir),
     )
 
+    formatter = DiffFormatter(console=Console(stderr=True))
+
     try:
+        if config.output == "text" and config.dry_run:
+            formatter.print_header(message="=== Dry Run Mode ===")
+
         result = update_usecase.execute(
             mapping_file=config.mapping_file,
             dry_run=config.dry_run,
+            verify_remote=config.verify_remote,
+            sink=_write_ndjson_record if config.output == "ndjson" else None,
+            preview_sink=_preview_sink(config=config, formatter=formatter),
+            selector=config.selector,
         )
-        _print_result(result=result)
-
-        playlist_result = sync_usecase.execute(
-            mapping_file=config.mapping_file,
-            dry_run=config.dry_run,
+        if config.output == "text":
+            _print_result(result=result, formatter=formatter)
+
+        # 更新を打ち切った場合は、プレイリストへの書き込みも失敗するとみなして同期しない
+        playlist_results = (
+            ()
+            if result.aborted
+            else _sync_playlist(sync_usecase=sync_usecase, config=config)
         )
-        _print_playlist_result(result=playlist_result)
+
+        _report(result=result, playlist_results=playlist_results, config=config)
+
+        if result.aborted:
+            print(  # noqa: T201
+                "Error: aborted after repeated video update failures "
+                f"({result.aborted_count} updates skipped, playlists not synced)",
+                file=sys.stderr,
+            )
+            sys.exit(EXIT_UPDATES_ABORTED)
+
+        if result.write_failure_count:
+            print(  # noqa: T201
+                f"Error: failed to update {result.write_failure_count} videos",
+                file=sys.stderr,
+            )
+            sys.exit(EXIT_UPDATES_FAILED)
 
     # CLIエントリポイントで全例外をキャッチし、ユーザーフレンドリーなエラー表示を行う
     except Exception as e:  # noqa: BLE001
         print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)  # noqa: T201
         sys.exit(1)
+    finally:
+        etag_cache.save()
+        state_store.close()
+
+
+def _report(
+    result: VideoUpdateResult,
+    playlist_results: Sequence[PlaylistSyncResult],
+    config: YouTubeUpdateConfig,
+) -> None:
+    """プレイリスト同期の結果を表示し、json / ndjson では実行全体の集計を出力する"""
+    if config.output == "json":
+        report = report_to_dict(result=result, playlist_results=playlist_results)
+        print(json.dumps(obj=report, ensure_ascii=False, indent=2))  # noqa: T201
+    elif config.output == "ndjson":
+        report = report_to_dict(result=result, playlist_results=playlist_results)
+        _write_ndjson_line(obj={"type": "summary", **report})
+    else:
+        for playlist_result in playlist_results:
+            _print_playlist_result(result=playlist_result)
+        # フェーズ別計測は全プレイリストで共通のため1回だけ表示する
+        if playlist_results and playlist_results[0].phases:
+            _print_phases(
+                title="Playlist phases",
+                phases=playlist_results[0].phases,
+            )
 
 
-def _print_result(result: VideoUpdateResult) -> None:
-    if result.is_dry_run:
-        formatter = DiffFormatter(console=Console(stderr=True))
+def _sync_playlist(
+    sync_usecase: SyncPlaylistUseCase,
+    config: YouTubeUpdateConfig,
+) -> tuple[PlaylistSyncResult, ...]:
+    plan_file = PlaylistPlanFile()
+
+    if config.apply_plan is not None:
+        plans = plan_file.read(file_path=config.apply_plan)
+
+        if config.dry_run:
+            return tuple(
+                PlaylistSyncResult.from_plan(plan=plan, is_dry_run=True)
+                for plan in plans
+            )
 
-        formatter.print_header(message="=== Dry Run Mode ===")
+        return sync_usecase.apply(plans=plans, verify=config.verify_playlist)
+
+    if config.plan_out is not None:
+        plans = sync_usecase.plan(
+            mapping_file=config.mapping_file,
+            selector=config.selector,
+        )
+        plan_file.write(plans=plans, file_path=config.plan_out)
+        print(f"Playlist plan written to: {config.plan_out}", file=sys.stderr)  # noqa: T201
+        return tuple(
+            PlaylistSyncResult.from_plan(plan=plan, is_dry_run=True) for plan in plans
+        )
+
+    return sync_usecase.execute(
+        mapping_file=config.mapping_file,
+        dry_run=config.dry_run,
+        verify=config.verify_playlist,
+        resume=config.resume,
+        selector=config.selector,
+    )
 
-        for i, preview in enumerate(iterable=result.previews, start=1):
-            formatter.print_preview(preview=preview, index=i)
 
+def _write_ndjson_line(obj: dict[str, Any]) -> None:
+    # パイプ先でも逐次読めるよう、1行ごとにフラッシュする
+    print(json.dumps(obj=obj, ensure_ascii=False), flush=True)  # noqa: T201
+
+
+def _write_ndjson_record(record: VideoUpdateRecord) -> None:
+    _write_ndjson_line(obj={"type": "session", **record_to_dict(record=record)})
+
+
+def _preview_sink(
+    config: YouTubeUpdateConfig,
+    formatter: DiffFormatter,
+) -> Callable[[VideoUpdatePreview], None]:
+    """ユースケースから1件ずつ受け取ったプレビューの扱い
+
+    テキスト出力の dry-run では受け取った順に表示し、それ以外では表示しないため捨てる。
+    どちらの場合もプレビューは溜めないので、メモリ使用量は動画数によらない。
+    """
+    if config.output != "text" or not config.dry_run:
+        return lambda _preview: None
+
+    indexes = itertools.count(start=1)
+
+    def print_preview(preview: VideoUpdatePreview) -> None:
+        formatter.print_preview(preview=preview, index=next(indexes))
+
+    return print_preview
+
+
+def _print_result(result: VideoUpdateResult, formatter: DiffFormatter) -> None:
+    if result.is_dry_run:
         formatter.print_summary(
             update_count=result.changed_count,
             unchanged_count=result.unchanged_count,
@@ -145,21 +484,18 @@ def _print_result(result: VideoUpdateResult) -> None:
             file=sys.stderr,
         )
 
-    if result.preserved_count > 0:
-        print(  # noqa: T201
-            f"Preserved (update disabled): {result.preserved_count}",
-            file=sys.stderr,
-        )
-    if result.no_mapping_count > 0:
-        print(  # noqa: T201
-            f"Skipped (no mapping): {result.no_mapping_count}",
-            file=sys.stderr,
-        )
-    if result.unused_mappings_count > 0:
-        print(  # noqa: T201
-            f"Unused mappings: {result.unused_mappings_count}",
-            file=sys.stderr,
-        )
+    # 0件の項目は表示しない
+    counts = (
+        ("Skipped (updates aborted)", result.aborted_count),
+        ("Skipped (unchanged since last sync)", result.state_skipped_count),
+        ("Preserved (update disabled)", result.preserved_count),
+        ("Skipped (video mapped to an earlier session)", result.duplicate_count),
+        ("Skipped (no mapping)", result.no_mapping_count),
+        ("Unused mappings", result.unused_mappings_count),
+    )
+    for label, count in counts:
+        if count > 0:
+            print(f"{label}: {count}", file=sys.stderr)  # noqa: T201
 
     if result.errors:
         print(  # noqa: T201
@@ -172,6 +508,15 @@ def _print_result(result: VideoUpdateResult) -> None:
                 file=sys.stderr,
             )
 
+    if result.phases:
+        _print_phases(title="Update phases", phases=result.phases)
+
+
+def _print_phases(title: str, phases: Sequence[PhaseTiming]) -> None:
+    """フェーズ別の回数と所要時間を表にして表示"""
+    print(f"\n{title}:", file=sys.stderr)  # noqa: T201
+    print(format_phase_table(phases=phases), file=sys.stderr)  # noqa: T201
+
 
 def _format_playlist_operation(op: PlaylistVideoOperation) -> str:
     """プレイリスト操作を文字列にフォーマット"""
@@ -216,8 +561,9 @@ def _print_playlist_result(result: PlaylistSyncResult) -> None:
             f"unchanged: {result.unchanged_count}",
         )
     else:
+        console.print(f"\nPlaylist ID: {result.playlist_id}")
         if result.added_count > 0:
-            console.print(f"\nPlaylist: Added {result.added_count} videos")
+            console.print(f"Playlist: Added {result.added_count} videos")
         if result.reordered_count > 0:
             console.print(f"Playlist: Reordered {result.reordered_count} videos")
         if result.moved_to_end_count > 0:
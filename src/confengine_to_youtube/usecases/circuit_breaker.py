@@ -0,0 +1,72 @@
+"""書き込みの失敗が続いたときに以降の書き込みを打ち切るサーキットブレーカー
+
+トークンの権限切れやクォータ超過などで YouTube が更新を拒否し始めると、
+残りの動画を更新しようとしても同じように失敗し、時間とクォータを消費するだけになる。
+失敗が一定の条件を満たしたらブレーカーを開き、以降の書き込みを行わない。
+書き込む動画の情報の取得 (読み込み) の成否も同じように記録する。
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+# 連続でこの回数失敗したら打ち切る
+DEFAULT_MAX_CONSECUTIVE_FAILURES = 5
+
+# 直近 DEFAULT_FAILURE_WINDOW 回の書き込みのうち、この割合以上が失敗したら打ち切る
+DEFAULT_MAX_FAILURE_RATE = 0.5
+DEFAULT_FAILURE_WINDOW = 20
+
+
+@dataclass(frozen=True)
+class WriteFailurePolicy:
+    """書き込みを打ち切る条件
+
+    max_consecutive_failures 回連続で失敗するか、直近 window 回のうち
+    max_failure_rate 以上の割合が失敗したら打ち切る。
+    割合は window 回書き込むまでは判定しない。
+    """
+
+    max_consecutive_failures: int = DEFAULT_MAX_CONSECUTIVE_FAILURES
+    max_failure_rate: float = DEFAULT_MAX_FAILURE_RATE
+    window: int = DEFAULT_FAILURE_WINDOW
+
+
+class WriteCircuitBreaker:
+    """書き込みの成否を記録し、打ち切るかどうかを判定する
+
+    一度開いたら閉じない (1回の実行の中だけで使う)。
+    読み込みと書き込みのステージのスレッドから記録されるためスレッドセーフにしている。
+    """
+
+    def __init__(self, policy: WriteFailurePolicy) -> None:
+        self._policy = policy
+        self._recent: deque[bool] = deque(maxlen=policy.window)
+        self._consecutive_failures = 0
+        self._is_open = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """以降の書き込みを打ち切るかどうか"""
+        with self._lock:
+            return self._is_open
+
+    def record(self, *, succeeded: bool) -> None:
+        """1回の読み込み・書き込みの成否を記録する"""
+        with self._lock:
+            self._recent.append(succeeded)
+
+            if succeeded:
+                self._consecutive_failures = 0
+                return
+
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._policy.max_consecutive_failures:
+                self._is_open = True
+            elif len(self._recent) == self._recent.maxlen:
+                failures = self._recent.count(False)
+                if failures >= self._policy.max_failure_rate * len(self._recent):
+                    self._is_open = True
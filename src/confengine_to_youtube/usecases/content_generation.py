@@ -0,0 +1,210 @@
+"""セッションごとのYouTube用コンテンツ (タイトル・description) の一括生成
+
+生成は純粋な関数なので、件数が多い場合はセッションを複数のワーカーに分配する。
+GILが有効ならプロセスプール、GILなし (free-threaded) のビルドではスレッドを使う。
+件数が少ない場合はワーカーの起動・データ転送のコストの方が大きいため、直列に生成する。
+どちらの場合も少数ずつ生成して順に流すため、生成結果を溜め込まない。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import batched
+from typing import TYPE_CHECKING, Self
+
+from returns.result import Failure, Result, Success
+
+from confengine_to_youtube.domain.youtube_content_generator import (
+    YouTubeContentGenerator,
+)
+from confengine_to_youtube.usecases.timing import phase
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    from confengine_to_youtube.domain.errors import DomainError
+    from confengine_to_youtube.domain.session import Session
+
+# この件数を直列に生成した後で、まだ続きがあればワーカーを起動する
+PARALLEL_GENERATION_THRESHOLD = 2000
+
+# まとめて生成するセッション数 (1ワーカーに1回で渡す件数)
+_CHUNK_SIZE = 32
+
+# 結果を受け取っていないチャンクを、ワーカー1つあたりこの数までに抑える
+_IN_FLIGHT_CHUNKS_PER_WORKER = 2
+
+# 並列化するのに必要なワーカー数
+_MIN_PARALLEL_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class ContentJob:
+    """1セッション分のコンテンツ生成条件"""
+
+    session: Session
+    update_title: bool
+    update_description: bool
+    hashtags: tuple[str, ...]
+    footer: str
+
+
+@dataclass(frozen=True)
+class GeneratedContent:
+    """セッションから生成したコンテンツ (None の項目はYouTube既存値を維持)"""
+
+    title: str | None
+    description: str | None
+
+    @property
+    def content_hash(self) -> str:
+        payload = json.dumps(obj=[self.title, self.description], ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def generate_content(job: ContentJob) -> Result[GeneratedContent, DomainError]:
+    """フラグがtrueの項目を生成する。falseの項目は None (YouTube既存値を使用)。"""
+    title: str | None = None
+    description: str | None = None
+
+    if job.update_title:
+        match YouTubeContentGenerator.generate_title(session=job.session):
+            case Failure(error):
+                return Failure(error)
+            case Success(generated_title):
+                title = str(generated_title)
+
+    if job.update_description:
+        desc_result = YouTubeContentGenerator.generate_description(
+            session=job.session,
+            hashtags=job.hashtags,
+            footer=job.footer,
+        )
+        match desc_result:
+            case Failure(error):
+                return Failure(error)
+            case Success(generated_desc):
+                description = str(generated_desc)
+
+    return Success(GeneratedContent(title=title, description=description))
+
+
+def _generate_chunk(
+    jobs: Sequence[ContentJob],
+) -> list[Result[GeneratedContent, DomainError]]:
+    """チャンク1つ分を生成する (ワーカーから呼ばれる)"""
+    return [generate_content(job=job) for job in jobs]
+
+
+def is_free_threaded() -> bool:
+    """GILが無効な (free-threaded) インタプリタで実行しているかどうか"""
+    return not sys._is_gil_enabled()  # noqa: SLF001
+
+
+class ContentBatchGenerator:
+    """複数セッションのコンテンツを、件数に応じて並列または直列に生成する
+
+    with 文の中で使う。stream() はジョブを少数ずつまとめて生成し、
+    結果をジョブの順に流す。parallel_threshold 件を直列に生成しても
+    まだジョブが続く場合に限りワーカーを起動し、以降のチャンクをワーカーに渡す。
+    結果を受け取っていないチャンクの数には上限があるため、ジョブの総数によらず、
+    溜め込まれる生成結果は一定の件数に収まる。
+    """
+
+    def __init__(
+        self,
+        *,
+        parallel_threshold: int = PARALLEL_GENERATION_THRESHOLD,
+        max_workers: int | None = None,
+    ) -> None:
+        self._parallel_threshold = parallel_threshold
+        self._max_workers = max_workers or os.process_cpu_count() or 1
+        self._executor: Executor | None = None
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(  # noqa: D105
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def generate(
+        self,
+        jobs: Sequence[ContentJob],
+    ) -> list[Result[GeneratedContent, DomainError]]:
+        """生成結果を jobs と同じ順に返す"""
+        return list(self.stream(jobs=jobs))
+
+    def stream(
+        self,
+        jobs: Iterable[ContentJob],
+    ) -> Iterator[Result[GeneratedContent, DomainError]]:
+        """生成結果を jobs と同じ順に、生成できたものから流す
+
+        jobs は必要な分だけ読み進めるため、上流から少しずつ届くイテレータを渡してよい。
+        """
+        in_flight: deque[Future[list[Result[GeneratedContent, DomainError]]]] = deque()
+        max_in_flight = self._max_workers * _IN_FLIGHT_CHUNKS_PER_WORKER
+        serial_count = 0
+
+        for chunk in batched(jobs, _CHUNK_SIZE, strict=False):
+            if (
+                self._max_workers < _MIN_PARALLEL_WORKERS
+                or serial_count < self._parallel_threshold
+            ):
+                with phase(name="generate"):
+                    results = _generate_chunk(jobs=chunk)
+                serial_count += len(chunk)
+                yield from results
+                continue
+
+            in_flight.append(self._get_executor().submit(_generate_chunk, chunk))
+            # 上限まで渡したら先頭のチャンクを待つ。終わっているチャンクは
+            # 次のジョブが届くのを待たずに先に流す
+            while in_flight and (
+                len(in_flight) >= max_in_flight or in_flight[0].done()
+            ):
+                yield from self._receive(in_flight=in_flight)
+
+        while in_flight:
+            yield from self._receive(in_flight=in_flight)
+
+    @staticmethod
+    def _receive(
+        in_flight: deque[Future[list[Result[GeneratedContent, DomainError]]]],
+    ) -> list[Result[GeneratedContent, DomainError]]:
+        """先頭のチャンクの生成結果を待って受け取る"""
+        with phase(name="generate"):
+            return in_flight.popleft().result()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # GILなしならスレッドで十分並列に動き、セッションの転送も不要。
+            # プロセスはパイプラインのスレッドから起動するため fork は使わない
+            self._executor = (
+                ThreadPoolExecutor(max_workers=self._max_workers)
+                if is_free_threaded()
+                else ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context(method="forkserver"),
+                )
+            )
+        return self._executor
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from confengine_to_youtube.domain.errors import DomainError
     from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoInfo:
     """ビデオ情報"""
 
@@ -19,9 +22,10 @@ class VideoInfo:
     title: str
     description: str
     category_id: int
+    etag: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoUpdateRequest:
     """動画更新リクエスト"""
 
@@ -31,7 +35,19 @@ class VideoUpdateRequest:
     category_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class VideoSyncState:
+    """最後に同期した動画コンテンツの状態"""
+
+    video_id: str
+    # 生成したタイトル・descriptionのハッシュ
+    content_hash: str
+    category_id: int
+    etag: str | None
+    synced_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
 class VideoUpdatePreview:
     """更新プレビュー情報"""
 
@@ -58,16 +74,39 @@ class VideoUpdatePreview:
         return self.has_title_changes or self.has_description_changes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class VideoNotFound:
+    """マッピングされた動画が YouTube に見つからなかったこと"""
+
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class VideoFetchFailure:
+    """動画情報の取得が YouTube に拒否されたこと"""
+
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class VideoWriteFailure:
+    """動画の更新が YouTube に拒否されたこと"""
+
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
 class SessionProcessError:
     """セッション処理エラー"""
 
     session_key: str
     video_id: str
-    error: DomainError
+    # コンテンツ生成の失敗 (DomainError)、動画が見つからない、動画情報の取得の失敗、
+    # 動画の更新の失敗のいずれか
+    error: DomainError | VideoNotFound | VideoFetchFailure | VideoWriteFailure
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlaylistItem:
     """プレイリストアイテム"""
 
@@ -76,6 +115,17 @@ class PlaylistItem:
     position: int
 
 
+@dataclass(frozen=True, slots=True)
+class PlaylistSnapshot:
+    """ある時点のプレイリスト全体
+
+    etag はこの時点のプレイリストを表し、プレイリストが変更されると変わる。
+    """
+
+    etag: str
+    items: tuple[PlaylistItem, ...]
+
+
 class PlaylistOperationType(Enum):
     """プレイリスト操作の種類"""
 
@@ -85,18 +135,50 @@ class PlaylistOperationType(Enum):
     MOVE_TO_END = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlaylistVideoOperation:
     """プレイリスト操作の情報"""
 
     video_id: str
     title: str
     operation: PlaylistOperationType
+    # 同期後の位置
     position: int
     slot: ScheduleSlot | None = None
+    # 追加・移動先の直前に来る動画 (先頭の場合は None)
+    after_video_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PlaylistSyncPlan:
+    """プレイリスト同期計画
+
+    計画時点のプレイリストのETagを持ち、適用前にプレイリストが変わっていないか確認する。
+    """
+
+    playlist_id: str
+    playlist_etag: str
+    # 適用順 (目標の並び順) の操作
+    operations: tuple[PlaylistVideoOperation, ...]
+
+    @property
+    def has_writes(self) -> bool:
+        """追加・移動が必要かどうか"""
+        return any(
+            op.operation != PlaylistOperationType.UNCHANGED for op in self.operations
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlaylistSyncProgress:
+    """ジャーナルに記録された、途中まで適用した同期計画"""
+
+    plan: PlaylistSyncPlan
+    # 適用が完了した操作の plan.operations 上のインデックス
+    completed: frozenset[int]
+
+
+@dataclass(frozen=True, slots=True)
 class PlaylistSyncResult:
     """プレイリスト同期結果"""
 
@@ -107,9 +189,92 @@ class PlaylistSyncResult:
     unchanged_count: int
     moved_to_end_count: int
     operations: tuple[PlaylistVideoOperation, ...]
+    # 同期を実行した execute() / apply() 全体のフェーズ別の所要時間と回数
+    # (1回の実行で同期した全プレイリストの結果が同じものを持つ)
+    phases: tuple[PhaseTiming, ...] = ()
+
+    @classmethod
+    def from_plan(cls, plan: PlaylistSyncPlan, *, is_dry_run: bool) -> Self:
+        """同期計画から結果を作る"""
+        counts = Counter(op.operation for op in plan.operations)
+
+        return cls(
+            is_dry_run=is_dry_run,
+            playlist_id=plan.playlist_id,
+            added_count=counts[PlaylistOperationType.ADD],
+            reordered_count=counts[PlaylistOperationType.REORDER],
+            unchanged_count=counts[PlaylistOperationType.UNCHANGED],
+            moved_to_end_count=counts[PlaylistOperationType.MOVE_TO_END],
+            operations=plan.operations,
+        )
+
+
+class VideoUpdateStatus(Enum):
+    """1セッションの処理結果の種類"""
+
+    # 変更があり更新した (dry-run では更新予定)
+    UPDATED = auto()
+    UNCHANGED = auto()
+    # 前回同期時から生成内容が変わらず、YouTube APIを呼ばなかった
+    STATE_SKIPPED = auto()
+    # update_title / update_description が両方 false
+    PRESERVED = auto()
+    NO_MAPPING = auto()
+    # 同じ動画がより前のセッションにもマッピングされており、そちらの内容で更新する
+    DUPLICATE = auto()
+    # コンテンツの生成または動画の更新に失敗した
+    FAILED = auto()
+    # 更新の失敗が続いて書き込みを打ち切ったため、更新しなかった
+    ABORTED = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class VideoUpdateRecord:
+    """処理を終えた1セッションの結果 (逐次出力用)"""
 
+    session_key: str
+    # マッピングがないセッションは None
+    video_id: str | None
+    status: VideoUpdateStatus
+    # 実行開始からこのセッションの処理を終えるまでの秒数
+    elapsed_seconds: float
+    title_changed: bool = False
+    description_changed: bool = False
+    # 動画の更新にかかった秒数。更新しなかった場合は None
+    update_seconds: float | None = None
+    error_message: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseTiming:
+    """実行中のあるフェーズ (YAML読み込み・API呼び出しなど) の累計"""
+
+    name: str
+    # フェーズに入った回数。API呼び出しのフェーズなら呼び出し回数になる
+    calls: int
+    # 累計の所要時間の秒数。並行に実行されたフェーズは重なった分も足し合わせる
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStageStats:
+    """パイプラインの1ステージの処理実績"""
+
+    name: str
+    # ステージが受け取った要素数
+    items: int
+    # キュー待ちを除いた処理時間の秒数
+    busy_seconds: float
 
-@dataclass(frozen=True)
+    @property
+    def throughput(self) -> float:
+        """1秒あたりの処理件数 (処理時間を計測できなかった場合は0)"""
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.items / self.busy_seconds
+
+
+@dataclass(frozen=True, slots=True)
 class VideoUpdateResult:
     """動画更新結果"""
 
@@ -120,4 +285,20 @@ class VideoUpdateResult:
     preserved_count: int = 0
     no_mapping_count: int = 0
     unused_mappings_count: int = 0
+    # 前回同期時から生成内容が変わらず、YouTube APIを呼ばずにスキップした件数
+    state_skipped_count: int = 0
+    # 同じ動画がより前のセッションにもマッピングされていたためスキップした件数
+    duplicate_count: int = 0
     errors: tuple[SessionProcessError, ...] = ()
+    # 更新の失敗が続いて書き込みを打ち切ったかどうかと、そのため更新しなかった件数
+    aborted: bool = False
+    aborted_count: int = 0
+    # パイプラインのステージごとの処理実績。実行順に並ぶ
+    stage_stats: tuple[PipelineStageStats, ...] = ()
+    # フェーズ別の所要時間と回数。最初に記録された順に並ぶ
+    phases: tuple[PhaseTiming, ...] = ()
+
+    @property
+    def write_failure_count(self) -> int:
+        """YouTube に更新を拒否された動画の件数"""
+        return sum(isinstance(error.error, VideoWriteFailure) for error in self.errors)
@@ -3,9 +3,21 @@
 from __future__ import annotations
 
 
-class VideoNotFoundError(Exception):
-    """動画が見つからないエラー"""
+class VideoFetchError(Exception):
+    """動画情報の取得 (読み込み) が YouTube に拒否されたエラー"""
+
+
+class VideoUpdateError(Exception):
+    """動画の更新 (書き込み) が YouTube に拒否されたエラー"""
 
 
 class MappingFileError(Exception):
     """マッピングファイル読み込みエラー"""
+
+
+class PlaylistStateMismatchError(Exception):
+    """同期後のプレイリストの並びが想定と一致しないエラー"""
+
+
+class PlaylistPlanFileError(Exception):
+    """プレイリスト同期計画ファイル読み込みエラー"""
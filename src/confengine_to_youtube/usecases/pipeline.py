@@ -0,0 +1,210 @@
+"""有界キューで接続したステージを、ステージごとのスレッドで並行に実行するパイプライン
+
+I/O待ちのステージ (YouTube APIの取得・更新) とCPU処理のステージ (コンテンツ生成・差分)
+を重ねて実行する。ステージ間のキューは有界なので、下流が詰まれば上流も待ち、
+処理中の要素数 (メモリ使用量) はセッション数によらず一定に抑えられる。
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from confengine_to_youtube.usecases.dto import PipelineStageStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+logger = logging.getLogger(name=__name__)
+
+# ステージ間のキューに溜められる要素数の既定値
+DEFAULT_QUEUE_SIZE = 64
+
+# 中断を確認する間隔の秒数
+_POLL_INTERVAL = 0.05
+
+# ストリームの終端を表す番兵
+_END = object()
+
+
+class _CancelledError(Exception):
+    """他のステージが失敗したため処理を打ち切る"""
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """パイプラインの1ステージ
+
+    func は上流の要素のイテレータを受け取り、下流に流す要素を返す。
+    要素の絞り込み・まとめ・分割は func の中で自由に行ってよい。
+    """
+
+    name: str
+    func: Callable[[Iterator[Any]], Iterable[Any]]
+
+
+class _Channel:
+    """ステージ間の有界キュー (中断されたら待機をやめる)"""
+
+    def __init__(self, maxsize: int, cancelled: threading.Event) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self._cancelled = cancelled
+
+    def put(self, item: Any) -> None:  # noqa: ANN401
+        while True:
+            if self._cancelled.is_set():
+                raise _CancelledError
+            try:
+                self._queue.put(item=item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return
+
+    def get(self) -> Any:  # noqa: ANN401
+        while True:
+            if self._cancelled.is_set():
+                raise _CancelledError
+            try:
+                return self._queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+
+class _StageRunner:
+    """1ステージをスレッドで実行し、処理件数とキュー待ちを除いた処理時間を計測する"""
+
+    def __init__(
+        self,
+        stage: PipelineStage,
+        inputs: Iterable[Any] | _Channel,
+        output: _Channel,
+        cancelled: threading.Event,
+    ) -> None:
+        self._stage = stage
+        self._inputs = inputs
+        self._output = output
+        self._cancelled = cancelled
+        self._items = 0
+        self._waited = 0.0
+        self._elapsed = 0.0
+        self.error: Exception | None = None
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        try:
+            for item in self._stage.func(self._iter_inputs()):
+                self._put(item=item)
+            self._put(item=_END)
+        except _CancelledError:
+            pass
+        except Exception as error:  # noqa: BLE001 - run_pipeline が呼び出し元で再送出する
+            self.error = error
+            self._cancelled.set()
+        finally:
+            self._elapsed = time.perf_counter() - started
+
+    def stats(self) -> PipelineStageStats:
+        return PipelineStageStats(
+            name=self._stage.name,
+            items=self._items,
+            busy_seconds=max(0.0, self._elapsed - self._waited),
+        )
+
+    def _iter_inputs(self) -> Iterator[Any]:
+        if not isinstance(self._inputs, _Channel):
+            for item in self._inputs:
+                self._items += 1
+                yield item
+            return
+
+        while True:
+            started = time.perf_counter()
+            item = self._inputs.get()
+            self._waited += time.perf_counter() - started
+            if item is _END:
+                return
+            self._items += 1
+            yield item
+
+    def _put(self, item: Any) -> None:  # noqa: ANN401
+        started = time.perf_counter()
+        self._output.put(item=item)
+        self._waited += time.perf_counter() - started
+
+
+def run_pipeline(
+    source: Iterable[Any],
+    stages: Sequence[PipelineStage],
+    *,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> tuple[PipelineStageStats, ...]:
+    """要素をステージに順に流し、すべて処理し終えるまで待つ
+
+    各ステージは1スレッドで要素を到着順に処理するため、ステージ内の順序は保たれる。
+    最後のステージが返す要素は捨てる (結果はステージ側で集計する)。
+    いずれかのステージで例外が発生すると全ステージを打ち切り、その例外を送出する。
+
+    Returns:
+        ステージごとの処理実績 (stages と同じ順)
+
+    """
+    cancelled = threading.Event()
+    runners: list[_StageRunner] = []
+    inputs: Iterable[Any] | _Channel = source
+
+    for stage in stages:
+        output = _Channel(maxsize=queue_size, cancelled=cancelled)
+        runners.append(
+            _StageRunner(
+                stage=stage,
+                inputs=inputs,
+                output=output,
+                cancelled=cancelled,
+            ),
+        )
+        inputs = output
+
+    # phase() の計測先などのコンテキスト変数をステージのスレッドに引き継ぐ
+    threads = [
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(runner.run,),
+            name=f"pipeline-{stage.name}",
+            daemon=True,
+        )
+        for runner, stage in zip(runners, stages, strict=True)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        if isinstance(inputs, _Channel):
+            while inputs.get() is not _END:
+                pass
+    except _CancelledError:
+        pass
+    finally:
+        # 途中で入力を読むのをやめたステージがあっても上流が待ち続けないようにする
+        cancelled.set()
+        for thread in threads:
+            thread.join()
+
+    for runner in runners:
+        if runner.error is not None:
+            raise runner.error
+
+    stats = tuple(runner.stats() for runner in runners)
+    for stage_stats in stats:
+        logger.info(
+            "Stage %s: %d items in %.3fs (%.1f items/s)",
+            stage_stats.name,
+            stage_stats.items,
+            stage_stats.busy_seconds,
+            stage_stats.throughput,
+        )
+    return stats
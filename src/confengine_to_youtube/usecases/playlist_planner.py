@@ -0,0 +1,129 @@
+"""プレイリストの並べ替え計画
+
+現在の並びのうち、目標の並びと相対順序が一致している最長部分列
+(最長増加部分列, LIS) をそのまま残し、それ以外のアイテムだけを移動・追加する。
+一部の動画だけを同期する場合は、それ以外の動画を現在の並びのまま残し、
+対象の動画だけを目標の並びでの直前の動画の後ろに置く。
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+
+def find_items_to_keep(current: Sequence[str], target: Sequence[str]) -> set[str]:
+    """移動しなくてよいアイテムの video_id を返す
+
+    Args:
+        current: 現在の並び (video_id)
+        target: 目標の並び (video_id)。
+            current に含まれない動画 (新規追加) を含んでもよい
+
+    Returns:
+        current の中で、目標の並びでの相対順序を保ったまま残せる最大のアイテム集合
+
+    """
+    target_index = {video_id: index for index, video_id in enumerate(target)}
+    # 目標に含まれるアイテムだけを、現在の並び順に目標位置へ置き換える
+    candidates = [video_id for video_id in current if video_id in target_index]
+    values = [target_index[video_id] for video_id in candidates]
+
+    return {candidates[i] for i in _longest_increasing_subsequence(values=values)}
+
+
+def restrict_target(
+    current: Sequence[str],
+    target: Sequence[str],
+    selected: Collection[str],
+) -> list[str]:
+    """一部の動画 (selected) だけを目標の並びに合わせた並びを返す
+
+    selected 以外の動画は現在の並び順のまま残し (まだない動画は追加しない)、
+    selected の動画は、目標の並びで直前にある残る動画の直後に置く。
+
+    Args:
+        current: 現在の並び (video_id)
+        target: プレイリスト全体の目標の並び (video_id)
+        selected: 同期する動画。target に含まれないものは無視する
+
+    """
+    result = [video_id for video_id in current if video_id not in selected]
+    present = set(result)
+    previous: str | None = None
+
+    for video_id in target:
+        if video_id in selected:
+            position = result.index(previous) + 1 if previous is not None else 0
+            result.insert(position, video_id)
+            present.add(video_id)
+
+        if video_id in present:
+            previous = video_id
+
+    return result
+
+
+def find_selected_items_to_keep(
+    current: Sequence[str],
+    target: Sequence[str],
+    selected: Collection[str],
+) -> set[str]:
+    """一部の動画 (selected) 以外は必ず残すとして、移動しなくてよいアイテムを返す
+
+    target は restrict_target() の結果のように、selected 以外の動画が
+    current と同じ相対順序で並んでいること。
+    selected の動画は、前後の残るアイテムとの順序が保たれる場合だけ残す。
+    """
+    target_index = {video_id: index for index, video_id in enumerate(target)}
+    candidates = [video_id for video_id in current if video_id in target_index]
+
+    # 各位置より後ろで最初に現れる selected 以外のアイテムの目標位置
+    next_fixed: list[int] = [len(target)] * (len(candidates) + 1)
+    for index in range(len(candidates) - 1, -1, -1):
+        video_id = candidates[index]
+        next_fixed[index] = (
+            next_fixed[index + 1] if video_id in selected else target_index[video_id]
+        )
+
+    keep: set[str] = set()
+    last = -1
+    for index, video_id in enumerate(candidates):
+        value = target_index[video_id]
+        if video_id not in selected or last < value < next_fixed[index + 1]:
+            keep.add(video_id)
+            last = value
+
+    return keep
+
+
+def _longest_increasing_subsequence(values: Sequence[int]) -> list[int]:
+    """狭義単調増加な最長部分列のインデックスを返す (O(n log n))"""
+    # tails[k]: 長さ k+1 の増加部分列の末尾のうち最小の値
+    tails: list[int] = []
+    # tail_indices[k]: tails[k] に対応する values のインデックス
+    tail_indices: list[int] = []
+    predecessors: list[int | None] = []
+
+    for index, value in enumerate(values):
+        length = bisect_left(tails, value)
+        predecessors.append(tail_indices[length - 1] if length > 0 else None)
+
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[length] = value
+            tail_indices[length] = index
+
+    result: list[int] = []
+    current = tail_indices[-1] if tail_indices else None
+    while current is not None:
+        result.append(current)
+        current = predecessors[current]
+
+    result.reverse()
+    return result
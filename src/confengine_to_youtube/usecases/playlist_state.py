@@ -0,0 +1,76 @@
+"""プレイリストの並びのローカルモデル
+
+YouTube のプレイリストは挿入・位置更新のたびに後続アイテムの position がずれる。
+書き込みが成功するたびに同じずれ方をローカルで適用し、再取得せずに現在の並びを追跡する。
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from confengine_to_youtube.usecases.dto import PlaylistItem
+
+
+class PlaylistState:
+    """プレイリスト内のアイテムの並び (先頭が position 0)"""
+
+    def __init__(self, items: Iterable[PlaylistItem]) -> None:
+        ordered = sorted(items, key=lambda item: item.position)
+        self._video_ids = [item.video_id for item in ordered]
+        self._items = {item.video_id: item for item in ordered}
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._video_ids)
+
+    def __contains__(self, video_id: object) -> bool:  # noqa: D105
+        return video_id in self._items
+
+    def get(self, video_id: str) -> PlaylistItem | None:
+        """現在の position を反映したアイテムを返す"""
+        item = self._items.get(video_id)
+        if item is None:
+            return None
+
+        return replace(item, position=self._video_ids.index(video_id))
+
+    def items(self) -> tuple[PlaylistItem, ...]:
+        """先頭から順に全アイテムを返す"""
+        return tuple(
+            replace(self._items[video_id], position=position)
+            for position, video_id in enumerate(self._video_ids)
+        )
+
+    def video_ids(self) -> tuple[str, ...]:
+        """先頭から順に video_id を返す"""
+        return tuple(self._video_ids)
+
+    def position_after(self, video_id: str, after_video_id: str | None) -> int:
+        """video_id を after_video_id の直後に置くために API に渡す position を返す
+
+        after_video_id が None の場合は先頭。移動の場合は、取り除いた後に
+        挿入される playlistItems.update のずれ方を考慮する。
+        """
+        if after_video_id is None:
+            return 0
+
+        after_position = self._video_ids.index(after_video_id)
+
+        if video_id in self._items and self._video_ids.index(video_id) < after_position:
+            # 自身を取り除くと after_video_id が1つ前にずれる
+            return after_position
+
+        return after_position + 1
+
+    def insert(self, item: PlaylistItem, position: int) -> None:
+        """playlistItems.insert と同様に、position 以降のアイテムを後ろにずらして挿入"""
+        self._video_ids.insert(position, item.video_id)
+        self._items[item.video_id] = item
+
+    def move(self, video_id: str, position: int) -> None:
+        """playlistItems.update と同様に、取り除いてから position に挿入"""
+        self._video_ids.remove(video_id)
+        self._video_ids.insert(position, video_id)
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
     from pathlib import Path
     from typing import TextIO
@@ -19,7 +20,11 @@ if TYPE_CHECKING:
     from confengine_to_youtube.domain.video_mapping import MappingConfig
     from confengine_to_youtube.usecases.dto import (
         PlaylistItem,
+        PlaylistSnapshot,
+        PlaylistSyncPlan,
+        PlaylistSyncProgress,
         VideoInfo,
+        VideoSyncState,
         VideoUpdateRequest,
     )
 
@@ -66,25 +71,41 @@ class MappingWriterProtocol(Protocol):  # pragma: no cover
 class YouTubeApiProtocol(Protocol):  # pragma: no cover
     """YouTube API との通信プロトコル"""
 
-    def get_video_info(self, video_id: str) -> VideoInfo:
-        """動画情報を取得する"""
-        ...
+    def get_videos_info(self, video_ids: Sequence[str]) -> dict[str, VideoInfo]:
+        """複数の動画情報を1回のリクエストでまとめて取得する (最大50件)
+
+        Returns:
+            動画IDから動画情報への辞書 (存在しない動画は含まない)
+
+        Raises:
+            VideoFetchError: YouTube が取得を拒否した場合
 
-    def update_video(self, request: VideoUpdateRequest) -> None:
-        """動画を更新する"""
+        """
         ...
 
-    def list_playlist_items(self, playlist_id: str) -> dict[str, PlaylistItem]:
-        """プレイリスト内のアイテムを取得する
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        """動画を更新する
 
         Returns:
-            video_id -> PlaylistItem のマッピング
+            更新後の動画のETag (取得できない場合は None)
 
         """
         ...
 
-    def add_to_playlist(self, playlist_id: str, video_id: str, position: int) -> None:
-        """動画をプレイリストに追加する"""
+    def fetch_playlist(self, playlist_id: str) -> PlaylistSnapshot:
+        """プレイリスト全体をETagと共に取得する"""
+        ...
+
+    def add_to_playlist(
+        self,
+        playlist_id: str,
+        video_id: str,
+        position: int | None = None,
+    ) -> PlaylistItem:
+        """動画をプレイリストに追加し、追加されたアイテムを返す
+
+        position を省略した場合は末尾に追加する。
+        """
         ...
 
     def update_playlist_item_position(
@@ -98,6 +119,38 @@ class YouTubeApiProtocol(Protocol):  # pragma: no cover
         ...
 
 
+class VideoStateStoreProtocol(Protocol):  # pragma: no cover
+    """同期済み動画コンテンツの状態ストアプロトコル"""
+
+    def get(self, video_id: str) -> VideoSyncState | None:
+        """動画の最終同期状態を取得する"""
+        ...
+
+    def save(self, state: VideoSyncState) -> None:
+        """動画の同期状態を保存する"""
+        ...
+
+
+class PlaylistSyncJournalProtocol(Protocol):  # pragma: no cover
+    """プレイリスト同期の操作ジャーナルプロトコル"""
+
+    def start(self, plan: PlaylistSyncPlan) -> None:
+        """計画の適用開始を記録する (同じプレイリストの以前の記録は破棄する)"""
+        ...
+
+    def record_completed(self, playlist_id: str, index: int) -> None:
+        """plan.operations[index] の適用完了を記録する"""
+        ...
+
+    def finish(self, playlist_id: str) -> None:
+        """計画の適用がすべて完了したことを記録する"""
+        ...
+
+    def load(self, playlist_id: str) -> PlaylistSyncProgress | None:
+        """未完了の計画と進捗を取得する (なければ None)"""
+        ...
+
+
 class MarkdownConverterProtocol(Protocol):  # pragma: no cover
     """HTML から Markdown への変換プロトコル"""
 
@@ -2,220 +2,601 @@
 
 from __future__ import annotations
 
+import contextvars
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import pairwise
+from typing import TYPE_CHECKING, assert_never
 
 from confengine_to_youtube.usecases.dto import (
     PlaylistOperationType,
+    PlaylistSyncPlan,
     PlaylistSyncResult,
     PlaylistVideoOperation,
 )
+from confengine_to_youtube.usecases.errors import PlaylistStateMismatchError
+from confengine_to_youtube.usecases.playlist_planner import (
+    find_items_to_keep,
+    find_selected_items_to_keep,
+    restrict_target,
+)
+from confengine_to_youtube.usecases.playlist_state import PlaylistState
+from confengine_to_youtube.usecases.timing import (
+    TimedYouTubeApi,
+    measure_phases,
+    phase,
+)
 
 logger = logging.getLogger(name=__name__)
 
+# 複数のプレイリストを並行して取得・同期するときの最大スレッド数
+MAX_CONCURRENT_PLAYLISTS = 4
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
-    from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
-    from confengine_to_youtube.domain.video_mapping import MappingConfig
+    from confengine_to_youtube.domain.session import Session
+    from confengine_to_youtube.domain.session_selector import SessionSelector
+    from confengine_to_youtube.usecases.dto import (
+        PlaylistSnapshot,
+        PlaylistSyncProgress,
+    )
     from confengine_to_youtube.usecases.protocols import (
         ConfEngineApiProtocol,
         MappingFileReaderProtocol,
+        PlaylistSyncJournalProtocol,
         YouTubeApiProtocol,
     )
 
 
+def _map_concurrently[T, R](func: Callable[[T], R], items: Sequence[T]) -> list[R]:
+    """要素ごとに func を並行して実行し、結果を items の順で返す"""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(items), MAX_CONCURRENT_PLAYLISTS),
+    ) as executor:
+        # phase() の計測先などのコンテキスト変数を要素ごとにワーカーへ引き継ぐ
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
+def _trailing_adds_start(operations: Sequence[PlaylistVideoOperation]) -> int:
+    """末尾に連続する ADD 操作の先頭インデックスを返す (なければ len(operations))"""
+    start = len(operations)
+    while start > 0 and operations[start - 1].operation == PlaylistOperationType.ADD:
+        start -= 1
+
+    return start
+
+
 class SyncPlaylistUseCase:
     def __init__(
         self,
         confengine_api: ConfEngineApiProtocol,
         mapping_reader: MappingFileReaderProtocol,
         youtube_api: YouTubeApiProtocol,
+        journal: PlaylistSyncJournalProtocol | None = None,
     ) -> None:
         self._confengine_api = confengine_api
         self._mapping_reader = mapping_reader
-        self._youtube_api = youtube_api
+        self._youtube_api = TimedYouTubeApi(youtube_api=youtube_api)
+        self._journal = journal
 
     def execute(
         self,
         mapping_file: Path,
         *,
         dry_run: bool,
-    ) -> PlaylistSyncResult:
-        mapping = self._mapping_reader.read(file_path=mapping_file)
-        schedule = self._confengine_api.fetch_schedule(conf_id=mapping.conf_id)
+        verify: bool = False,
+        resume: bool = False,
+        selector: SessionSelector | None = None,
+    ) -> tuple[PlaylistSyncResult, ...]:
+        """全プレイリストの同期計画を立て、dry_run でなければそのまま適用する
+
+        プレイリストごとの処理は並行して行い、結果はマッピングファイルの
+        プレイリスト順 (全セッション用が先頭) で返す。
+        resume 指定時は、ジャーナルに未完了の計画があるプレイリストは
+        計画を立て直さずに続きから適用する。
+        selector 指定時は、対象セッションの動画を含むプレイリストだけを取得し、
+        対象の動画だけを追加・移動する (それ以外の動画は現在の位置のまま)。
+        """
+        with measure_phases() as timer:
+            targets, selected = self._load_targets(
+                mapping_file=mapping_file,
+                selector=selector,
+            )
+            results = _map_concurrently(
+                func=lambda playlist_id: self._sync(
+                    playlist_id=playlist_id,
+                    mapped=targets[playlist_id],
+                    selected=selected,
+                    dry_run=dry_run,
+                    verify=verify,
+                    resume=resume,
+                ),
+                items=tuple(targets),
+            )
+
+        phases = timer.phases()
+        return tuple(replace(result, phases=phases) for result in results)
+
+    def plan(
+        self,
+        mapping_file: Path,
+        *,
+        selector: SessionSelector | None = None,
+    ) -> tuple[PlaylistSyncPlan, ...]:
+        """プレイリストを変更せずに全プレイリストの同期計画だけを立てる"""
+        targets, selected = self._load_targets(
+            mapping_file=mapping_file,
+            selector=selector,
+        )
+        planned = _map_concurrently(
+            func=lambda playlist_id: self._plan_playlist(
+                playlist_id=playlist_id,
+                mapped=targets[playlist_id],
+                selected=selected,
+            ),
+            items=tuple(targets),
+        )
+
+        return tuple(plan for _, plan in planned)
+
+    def apply(
+        self,
+        plans: Sequence[PlaylistSyncPlan],
+        *,
+        verify: bool = False,
+    ) -> tuple[PlaylistSyncResult, ...]:
+        """保存済みの同期計画を適用する
+
+        各プレイリストを1回だけ取得し、計画時点からETagが変わったものが
+        1つでもあれば、どのプレイリストにも適用しない。
+        """
+        with measure_phases() as timer:
+            snapshots = _map_concurrently(
+                func=lambda plan: self._youtube_api.fetch_playlist(
+                    playlist_id=plan.playlist_id,
+                ),
+                items=plans,
+            )
+            changed = [
+                plan.playlist_id
+                for plan, snapshot in zip(plans, snapshots, strict=True)
+                if snapshot.etag != plan.playlist_etag
+            ]
+
+            if changed:
+                msg = (
+                    "Playlist has changed since the plan was created: "
+                    f"{', '.join(changed)}"
+                )
+                raise PlaylistStateMismatchError(msg)
+
+            _map_concurrently(
+                func=lambda pair: self._apply(
+                    plan=pair[0], snapshot=pair[1], verify=verify
+                ),
+                items=tuple(zip(plans, snapshots, strict=True)),
+            )
+
+        phases = timer.phases()
+        return tuple(
+            replace(
+                PlaylistSyncResult.from_plan(plan=plan, is_dry_run=False),
+                phases=phases,
+            )
+            for plan in plans
+        )
+
+    def _load_targets(
+        self,
+        mapping_file: Path,
+        selector: SessionSelector | None,
+    ) -> tuple[dict[str, dict[str, Session]], frozenset[str] | None]:
+        """プレイリストごとに、並べる動画とそのセッションをセッション順に返す
+
+        スケジュールは1回だけ取得し、1回の走査で全プレイリストの並びを作る。
+        同じ動画が複数のスロットにある場合は最初のセッションを使う。
+        selector 指定時は、対象の動画を含むプレイリストだけを返し、対象の動画も返す。
+        並び順は全セッションから決めるため、プレイリストの中身は絞り込まない。
+        """
+        with phase(name="mapping.read"):
+            mapping = self._mapping_reader.read(file_path=mapping_file)
+        with phase(name="confengine.fetch_schedule"):
+            schedule = self._confengine_api.fetch_schedule(conf_id=mapping.conf_id)
         mapping_config = mapping.to_domain(timezone=schedule.timezone)
 
-        return self._execute(
-            schedule=schedule,
-            mapping_config=mapping_config,
-            dry_run=dry_run,
+        targets: dict[str, dict[str, Session]] = {
+            playlist_id: {} for playlist_id in mapping_config.playlist_ids
+        }
+        # セッションは既にソート済み (日付→時間→ルーム)
+        for session in schedule.sessions:
+            video_mapping = mapping_config.find_mapping(slot=session.slot)
+            if video_mapping is None:
+                continue
+
+            for playlist_id in mapping_config.playlist_ids_for(session=session):
+                targets[playlist_id].setdefault(video_mapping.video_id, session)
+
+        if selector is None or selector.is_empty:
+            return targets, None
+
+        with phase(name="select"):
+            selected_schedule, selected_config = selector.select(
+                schedule=schedule,
+                mapping_config=mapping_config,
+            )
+        selected = frozenset(mapping.video_id for mapping in selected_config.mappings)
+        touched = {
+            playlist_id
+            for session in selected_schedule.sessions
+            if selected_config.find_mapping(slot=session.slot) is not None
+            for playlist_id in mapping_config.playlist_ids_for(session=session)
+        }
+        if not touched:
+            logger.warning("No mapped session matched the selection")
+
+        return (
+            {
+                playlist_id: mapped
+                for playlist_id, mapped in targets.items()
+                if playlist_id in touched
+            },
+            selected,
         )
 
-    def _execute(
+    def _sync(  # noqa: PLR0913
         self,
-        schedule: ConferenceSchedule,
-        mapping_config: MappingConfig,
+        playlist_id: str,
+        mapped: dict[str, Session],
+        selected: frozenset[str] | None,
         *,
         dry_run: bool,
+        verify: bool,
+        resume: bool,
     ) -> PlaylistSyncResult:
-        """プレイリストに動画を同期する
+        """1つのプレイリストを同期する"""
+        if resume and not dry_run and self._journal is not None:
+            with phase(name="journal.read"):
+                progress = self._journal.load(playlist_id=playlist_id)
 
-        1. プレイリスト内の全アイテムを取得
-        2. セッション順で動画をループし、追加または位置更新
-        3. マッピングにない動画を末尾に移動
-        """
-        playlist_id = mapping_config.playlist_id
+            if progress is not None:
+                return self._resume(progress=progress, verify=verify)
+
+            logger.info("No unfinished playlist sync to resume: %s", playlist_id)
+
+        snapshot, plan = self._plan_playlist(
+            playlist_id=playlist_id,
+            mapped=mapped,
+            selected=selected,
+        )
+
+        if not dry_run:
+            self._apply(plan=plan, snapshot=snapshot, verify=verify)
+
+        return PlaylistSyncResult.from_plan(plan=plan, is_dry_run=dry_run)
 
+    def _plan_playlist(
+        self,
+        playlist_id: str,
+        mapped: dict[str, Session],
+        selected: frozenset[str] | None,
+    ) -> tuple[PlaylistSnapshot, PlaylistSyncPlan]:
         # プレイリスト内の既存アイテムを取得
-        existing_items = self._youtube_api.list_playlist_items(playlist_id=playlist_id)
+        snapshot = self._youtube_api.fetch_playlist(playlist_id=playlist_id)
+        with phase(name="plan"):
+            operations = self._plan(
+                mapped=mapped,
+                state=PlaylistState(items=snapshot.items),
+                selected=selected,
+            )
+        plan = PlaylistSyncPlan(
+            playlist_id=playlist_id,
+            playlist_etag=snapshot.etag,
+            operations=operations,
+        )
 
-        operations: list[PlaylistVideoOperation] = []
-        added_count = 0
-        reordered_count = 0
-        unchanged_count = 0
-        moved_to_end_count = 0
+        return snapshot, plan
 
-        # マッピングされた動画のvideo_idを追跡
-        mapped_video_ids: set[str] = set()
+    def _resume(
+        self,
+        progress: PlaylistSyncProgress,
+        *,
+        verify: bool,
+    ) -> PlaylistSyncResult:
+        """ジャーナルに記録された計画を、完了済みの操作を飛ばして適用する
 
-        # セッションは既にソート済み (日付→時間→ルーム)
-        position = 0
-        for session in schedule.sessions:
-            mapping = mapping_config.find_mapping(slot=session.slot)
-            if mapping is None:
+        プレイリストを1回だけ取得し、完了済みの操作と移動不要のアイテムが
+        計画どおりの順序で並んでいることを確認してから続ける。
+        """
+        plan = progress.plan
+        snapshot = self._youtube_api.fetch_playlist(playlist_id=plan.playlist_id)
+        positions = {item.video_id: item.position for item in snapshot.items}
+
+        settled = [
+            operation.video_id
+            for index, operation in enumerate(plan.operations)
+            if index in progress.completed
+            or operation.operation == PlaylistOperationType.UNCHANGED
+        ]
+        settled_positions = [positions.get(video_id) for video_id in settled]
+        # 末尾に番兵を置き、プレイリストから消えたアイテム (None) も不一致として扱う
+        is_in_order = all(
+            a is not None and b is not None and a < b
+            for a, b in pairwise([*settled_positions, len(positions)])
+        )
+
+        if not is_in_order:
+            msg = (
+                "Playlist has changed since the sync was interrupted: "
+                f"{plan.playlist_id}"
+            )
+            raise PlaylistStateMismatchError(msg)
+
+        logger.info(
+            "Resuming playlist sync: %s (%d/%d operations done)",
+            plan.playlist_id,
+            len(progress.completed),
+            sum(
+                op.operation != PlaylistOperationType.UNCHANGED
+                for op in plan.operations
+            ),
+        )
+        self._apply(
+            plan=plan,
+            snapshot=snapshot,
+            verify=verify,
+            completed=progress.completed,
+        )
+
+        return PlaylistSyncResult.from_plan(plan=plan, is_dry_run=False)
+
+    def _apply(
+        self,
+        plan: PlaylistSyncPlan,
+        snapshot: PlaylistSnapshot,
+        *,
+        verify: bool,
+        completed: frozenset[int] = frozenset(),
+    ) -> None:
+        """計画を適用する
+
+        書き込み後の position のずれは PlaylistState でローカルに反映するため、
+        プレイリストの再取得は verify 指定時の確認の1回だけで済む。
+        ジャーナルがあれば、各操作の完了を記録して中断後に再開できるようにする。
+        """
+        if not plan.has_writes:
+            return
+
+        state = PlaylistState(items=snapshot.items)
+        append_start = _trailing_adds_start(operations=plan.operations)
+
+        if self._journal is not None and not completed:
+            with phase(name="journal.write"):
+                self._journal.start(plan=plan)
+
+        for index, operation in enumerate(plan.operations[:append_start]):
+            if index in completed or operation.operation == (
+                PlaylistOperationType.UNCHANGED
+            ):
                 continue
 
-            video_id = mapping.video_id
-            mapped_video_ids.add(video_id)
+            self._apply_operation(
+                playlist_id=plan.playlist_id,
+                state=state,
+                operation=operation,
+            )
+            self._record_completed(playlist_id=plan.playlist_id, index=index)
 
-            existing_item = existing_items.get(video_id)
+        self._append_operations(
+            plan=plan,
+            state=state,
+            start=append_start,
+            completed=completed,
+        )
 
-            if existing_item is None:
-                # 新規追加
-                operations.append(
-                    PlaylistVideoOperation(
-                        video_id=video_id,
-                        title=session.title,
-                        operation=PlaylistOperationType.ADD,
-                        position=position,
-                        slot=session.slot,
-                    ),
-                )
-                added_count += 1
-                if not dry_run:
-                    self._youtube_api.add_to_playlist(
-                        playlist_id=playlist_id,
-                        video_id=video_id,
-                        position=position,
-                    )
-                    logger.info(
-                        "Added to playlist: %s (%s) at position %d",
-                        session.title,
-                        video_id,
-                        position,
-                    )
-                    # 追加後に position が変わるため再取得
-                    existing_items = self._youtube_api.list_playlist_items(
-                        playlist_id=playlist_id,
-                    )
-            elif existing_item.position != position:
-                # 位置更新
-                operations.append(
-                    PlaylistVideoOperation(
-                        video_id=video_id,
-                        title=session.title,
-                        operation=PlaylistOperationType.REORDER,
-                        position=position,
-                        slot=session.slot,
-                    ),
+        if self._journal is not None:
+            with phase(name="journal.write"):
+                self._journal.finish(playlist_id=plan.playlist_id)
+
+        if verify:
+            self._verify(playlist_id=plan.playlist_id, state=state)
+
+    def _append_operations(
+        self,
+        plan: PlaylistSyncPlan,
+        state: PlaylistState,
+        *,
+        start: int,
+        completed: frozenset[int],
+    ) -> None:
+        """末尾に連続する追加 (plan.operations[start:]) を position を指定せずに行う
+
+        この時点でプレイリストは目標の並びの start 件目までと一致しているため、
+        残りはスケジュール順に末尾へ追加するだけでよく、後続アイテムのずれも起きない。
+        """
+        for index, operation in enumerate(plan.operations[start:], start=start):
+            if index in completed:
+                continue
+
+            if operation.video_id in state:
+                # 中断で完了を記録できなかった追加。移動として扱う
+                self._move(
+                    playlist_id=plan.playlist_id, state=state, operation=operation
                 )
-                reordered_count += 1
-                if not dry_run:
-                    self._youtube_api.update_playlist_item_position(
-                        playlist_item_id=existing_item.playlist_item_id,
-                        playlist_id=playlist_id,
-                        video_id=video_id,
-                        position=position,
-                    )
-                    logger.info(
-                        "Reordered in playlist: %s (%s) to position %d",
-                        session.title,
-                        video_id,
-                        position,
-                    )
-                    # 移動後に他の動画の position が変わるため再取得
-                    existing_items = self._youtube_api.list_playlist_items(
-                        playlist_id=playlist_id,
-                    )
             else:
-                # 変更なし
-                operations.append(
-                    PlaylistVideoOperation(
-                        video_id=video_id,
-                        title=session.title,
-                        operation=PlaylistOperationType.UNCHANGED,
-                        position=position,
-                        slot=session.slot,
-                    ),
+                added_item = self._youtube_api.add_to_playlist(
+                    playlist_id=plan.playlist_id,
+                    video_id=operation.video_id,
                 )
-                unchanged_count += 1
-
-            position += 1
-
-        # マッピングにない動画を末尾に移動。元の位置順でソート
-        unmapped_items = sorted(
-            [
-                item
-                for item in existing_items.values()
-                if item.video_id not in mapped_video_ids
-            ],
-            key=lambda item: item.position,
-        )
-
-        for item in unmapped_items:
-            video_id = item.video_id
-            if item.position != position:
-                operations.append(
-                    PlaylistVideoOperation(
-                        video_id=video_id,
-                        title=f"(unmapped: {video_id})",
-                        operation=PlaylistOperationType.MOVE_TO_END,
-                        position=position,
-                    ),
+                state.insert(item=added_item, position=len(state))
+                logger.info(
+                    "Appended to playlist: %s (%s)",
+                    operation.title,
+                    operation.video_id,
                 )
-                moved_to_end_count += 1
-                if not dry_run:
-                    self._youtube_api.update_playlist_item_position(
-                        playlist_item_id=item.playlist_item_id,
-                        playlist_id=playlist_id,
-                        video_id=video_id,
-                        position=position,
-                    )
-                    logger.info(
-                        "Moved to end: %s at position %d",
-                        video_id,
-                        position,
-                    )
+
+            self._record_completed(playlist_id=plan.playlist_id, index=index)
+
+    def _record_completed(self, playlist_id: str, index: int) -> None:
+        if self._journal is not None:
+            with phase(name="journal.write"):
+                self._journal.record_completed(playlist_id=playlist_id, index=index)
+
+    @staticmethod
+    def _plan(
+        mapped: dict[str, Session],
+        state: PlaylistState,
+        selected: frozenset[str] | None = None,
+    ) -> tuple[PlaylistVideoOperation, ...]:
+        """目標の並びにするための操作を、適用順 (目標の並び順) に返す
+
+        目標の並びは、セッション順の動画 (mapped)
+        + マッピングにない動画 (現在の位置順)。
+        相対順序が既に正しい最長部分列はそのまま残し、それ以外だけを追加・移動する。
+        selected 指定時は、その動画だけを目標の並びに合わせ、他は現在の位置に残す。
+        """
+        # マッピングにない動画は、現在の位置順のまま末尾に並べる
+        unmapped = [
+            video_id for video_id in state.video_ids() if video_id not in mapped
+        ]
+        target = [*mapped, *unmapped]
+
+        if selected is None:
+            keep = find_items_to_keep(current=state.video_ids(), target=target)
+        else:
+            moving = selected & mapped.keys()
+            target = restrict_target(
+                current=state.video_ids(),
+                target=target,
+                selected=moving,
+            )
+            keep = find_selected_items_to_keep(
+                current=state.video_ids(),
+                target=target,
+                selected=moving,
+            )
+
+        operations: list[PlaylistVideoOperation] = []
+        for position, video_id in enumerate(target):
+            mapped_session = mapped.get(video_id)
+
+            if video_id in keep:
+                operation_type = PlaylistOperationType.UNCHANGED
+            elif video_id not in state:
+                operation_type = PlaylistOperationType.ADD
+            elif mapped_session is not None:
+                operation_type = PlaylistOperationType.REORDER
             else:
-                # マッピングなしの動画がすでに正しい位置にある
-                operations.append(
-                    PlaylistVideoOperation(
-                        video_id=video_id,
-                        title=f"(unmapped: {video_id})",
-                        operation=PlaylistOperationType.UNCHANGED,
-                        position=position,
+                operation_type = PlaylistOperationType.MOVE_TO_END
+
+            operations.append(
+                PlaylistVideoOperation(
+                    video_id=video_id,
+                    title=(
+                        mapped_session.title
+                        if mapped_session is not None
+                        else f"(unmapped: {video_id})"
                     ),
+                    operation=operation_type,
+                    position=position,
+                    slot=mapped_session.slot if mapped_session is not None else None,
+                    after_video_id=target[position - 1] if position > 0 else None,
+                ),
+            )
+
+        return tuple(operations)
+
+    def _apply_operation(
+        self,
+        playlist_id: str,
+        state: PlaylistState,
+        operation: PlaylistVideoOperation,
+    ) -> None:
+        """1件の操作を実行し、ローカルの並びに反映する
+
+        目標の並び順に適用するため、直前に来る動画 (after_video_id) は
+        その時点で既に正しい相対位置にある。その直後に追加・移動する。
+        """
+        video_id = operation.video_id
+
+        match operation.operation:
+            case PlaylistOperationType.UNCHANGED:
+                return
+            case PlaylistOperationType.ADD if video_id not in state:
+                position = state.position_after(
+                    video_id=video_id,
+                    after_video_id=operation.after_video_id,
                 )
-                unchanged_count += 1
-            position += 1
+                added_item = self._youtube_api.add_to_playlist(
+                    playlist_id=playlist_id,
+                    video_id=video_id,
+                    position=position,
+                )
+                state.insert(item=added_item, position=position)
+                logger.info(
+                    "Added to playlist: %s (%s) at position %d",
+                    operation.title,
+                    video_id,
+                    position,
+                )
+            case (
+                PlaylistOperationType.ADD
+                | PlaylistOperationType.REORDER
+                | PlaylistOperationType.MOVE_TO_END
+            ):
+                # 追加済みの ADD は、中断で完了を記録できなかったもの。移動として扱う
+                self._move(playlist_id=playlist_id, state=state, operation=operation)
+            case _:
+                assert_never(operation.operation)
 
-        return PlaylistSyncResult(
-            is_dry_run=dry_run,
+    def _move(
+        self,
+        playlist_id: str,
+        state: PlaylistState,
+        operation: PlaylistVideoOperation,
+    ) -> None:
+        """既存のアイテムを直前に来る動画 (after_video_id) の直後に移動する"""
+        video_id = operation.video_id
+        item = state.get(video_id=video_id)
+        if item is None:
+            msg = f"Playlist item not found: {video_id}"
+            raise PlaylistStateMismatchError(msg)
+
+        position = state.position_after(
+            video_id=video_id,
+            after_video_id=operation.after_video_id,
+        )
+        self._youtube_api.update_playlist_item_position(
+            playlist_item_id=item.playlist_item_id,
             playlist_id=playlist_id,
-            added_count=added_count,
-            reordered_count=reordered_count,
-            unchanged_count=unchanged_count,
-            moved_to_end_count=moved_to_end_count,
-            operations=tuple(operations),
+            video_id=video_id,
+            position=position,
         )
+        state.move(video_id=video_id, position=position)
+        logger.info(
+            "Moved in playlist: %s (%s) to position %d",
+            operation.title,
+            video_id,
+            position,
+        )
+
+    def _verify(self, playlist_id: str, state: PlaylistState) -> None:
+        """プレイリストを再取得し、ローカルで追跡した並びと一致するか確認する"""
+        remote = PlaylistState(
+            items=self._youtube_api.fetch_playlist(playlist_id=playlist_id).items,
+        )
+
+        if remote.video_ids() != state.video_ids():
+            msg = f"Playlist order differs from the expected state: {playlist_id}"
+            raise PlaylistStateMismatchError(msg)
+
+        logger.info("Verified playlist order: %s", playlist_id)
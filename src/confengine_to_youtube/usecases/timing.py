@@ -0,0 +1,133 @@
+"""ユースケース実行中のフェーズごとの所要時間と呼び出し回数の計測
+
+execute() などの入口で measure_phases() を開き、その中で計測したい処理を
+phase() で囲む。計測中でなければ phase() は何もしないため、アダプターからも使える。
+計測先はコンテキスト変数で受け渡すので、別スレッドで計測する場合は
+contextvars.copy_context() でコンテキストを引き継ぐこと (run_pipeline などは対応済み)。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from confengine_to_youtube.usecases.dto import PhaseTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from confengine_to_youtube.usecases.dto import (
+        PlaylistItem,
+        PlaylistSnapshot,
+        VideoInfo,
+        VideoUpdateRequest,
+    )
+    from confengine_to_youtube.usecases.protocols import YouTubeApiProtocol
+
+_current_timer: ContextVar[PhaseTimer | None] = ContextVar(
+    "current_phase_timer",
+    default=None,
+)
+
+
+class PhaseTimer:
+    """フェーズごとの累計所要時間と回数を集計する (スレッドセーフ)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # 最初に記録された順を保つ
+        self._seconds: dict[str, float] = {}
+        self._calls: dict[str, int] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+    def phases(self) -> tuple[PhaseTiming, ...]:
+        with self._lock:
+            return tuple(
+                PhaseTiming(name=name, calls=self._calls[name], seconds=seconds)
+                for name, seconds in self._seconds.items()
+            )
+
+
+@contextmanager
+def measure_phases() -> Iterator[PhaseTimer]:
+    """このブロック内の phase() を新しい PhaseTimer に集計する"""
+    timer = PhaseTimer()
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """ブロックの所要時間を現在の PhaseTimer に記録する (計測中でなければ何もしない)"""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.record(name=name, seconds=time.perf_counter() - started)
+
+
+class TimedYouTubeApi:
+    """YouTube API の呼び出しごとに「youtube.<メソッド名>」フェーズを記録するラッパー"""
+
+    def __init__(self, youtube_api: YouTubeApiProtocol) -> None:
+        self._youtube_api = youtube_api
+
+    def get_videos_info(self, video_ids: Sequence[str]) -> dict[str, VideoInfo]:
+        with phase(name="youtube.get_videos_info"):
+            return self._youtube_api.get_videos_info(video_ids=video_ids)
+
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        with phase(name="youtube.update_video"):
+            return self._youtube_api.update_video(request=request)
+
+    def fetch_playlist(self, playlist_id: str) -> PlaylistSnapshot:
+        with phase(name="youtube.fetch_playlist"):
+            return self._youtube_api.fetch_playlist(playlist_id=playlist_id)
+
+    def add_to_playlist(
+        self,
+        playlist_id: str,
+        video_id: str,
+        position: int | None = None,
+    ) -> PlaylistItem:
+        with phase(name="youtube.add_to_playlist"):
+            if position is None:
+                return self._youtube_api.add_to_playlist(
+                    playlist_id=playlist_id,
+                    video_id=video_id,
+                )
+            return self._youtube_api.add_to_playlist(
+                playlist_id=playlist_id,
+                video_id=video_id,
+                position=position,
+            )
+
+    def update_playlist_item_position(
+        self,
+        playlist_item_id: str,
+        playlist_id: str,
+        video_id: str,
+        position: int,
+    ) -> None:
+        with phase(name="youtube.update_playlist_item_position"):
+            self._youtube_api.update_playlist_item_position(
+                playlist_item_id=playlist_item_id,
+                playlist_id=playlist_id,
+                video_id=video_id,
+                position=position,
+            )
@@ -3,238 +3,749 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from functools import cached_property
+from itertools import batched
 from typing import TYPE_CHECKING
 
 from returns.result import Failure, Success
 
-from confengine_to_youtube.domain.youtube_content_generator import (
-    YouTubeContentGenerator,
+from confengine_to_youtube.usecases.circuit_breaker import (
+    WriteCircuitBreaker,
+    WriteFailurePolicy,
+)
+from confengine_to_youtube.usecases.content_generation import (
+    ContentBatchGenerator,
+    ContentJob,
 )
 from confengine_to_youtube.usecases.dto import (
     SessionProcessError,
+    VideoFetchFailure,
+    VideoNotFound,
+    VideoSyncState,
     VideoUpdatePreview,
+    VideoUpdateRecord,
     VideoUpdateRequest,
     VideoUpdateResult,
+    VideoUpdateStatus,
+    VideoWriteFailure,
+)
+from confengine_to_youtube.usecases.errors import VideoFetchError, VideoUpdateError
+from confengine_to_youtube.usecases.pipeline import PipelineStage, run_pipeline
+from confengine_to_youtube.usecases.timing import (
+    TimedYouTubeApi,
+    measure_phases,
+    phase,
 )
 
 logger = logging.getLogger(name=__name__)
 
+# videos.list で1回に取得できる動画数の上限
+VIDEO_INFO_BATCH_SIZE = 50
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
+    from confengine_to_youtube.domain.errors import DomainError
     from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
     from confengine_to_youtube.domain.session import Session
+    from confengine_to_youtube.domain.session_selector import SessionSelector
     from confengine_to_youtube.domain.video_mapping import MappingConfig, VideoMapping
+    from confengine_to_youtube.usecases.content_generation import GeneratedContent
     from confengine_to_youtube.usecases.dto import VideoInfo
     from confengine_to_youtube.usecases.protocols import (
         ConfEngineApiProtocol,
         MappingFileReaderProtocol,
+        VideoStateStoreProtocol,
         YouTubeApiProtocol,
     )
 
 
+@dataclass(frozen=True)
+class _Target:
+    """更新対象のセッションとマッピング"""
+
+    session: Session
+    mapping: VideoMapping
+
+
+@dataclass(frozen=True)
+class _Pending:
+    """コンテンツを生成済みで、現在の動画情報との比較待ちのセッション"""
+
+    target: _Target
+    content: GeneratedContent
+
+
+@dataclass(frozen=True)
+class _Fetched:
+    """現在の動画情報を取得済みのセッション"""
+
+    pending: _Pending
+    video_info: VideoInfo
+
+    @cached_property
+    def preview(self) -> VideoUpdatePreview:
+        content = self.pending.content
+        return VideoUpdatePreview(
+            session_key=str(self.pending.target.session.slot),
+            video_id=self.pending.target.mapping.video_id,
+            current_title=self.video_info.title,
+            current_description=self.video_info.description,
+            new_title=(
+                content.title if content.title is not None else self.video_info.title
+            ),
+            new_description=(
+                content.description
+                if content.description is not None
+                else self.video_info.description
+            ),
+        )
+
+
+@dataclass
+class _Progress:
+    """パイプライン実行中の集計 (各フィールドを書き込むステージは1つだけ)
+
+    sink / preview_sink があれば、処理を終えたセッションごとに結果・プレビューを渡し、
+    プレビューは溜めない (件数とエラーだけを集計する)。
+    """
+
+    sink: Callable[[VideoUpdateRecord], None] | None = None
+    preview_sink: Callable[[VideoUpdatePreview], None] | None = None
+    breaker: WriteCircuitBreaker = field(
+        default_factory=lambda: WriteCircuitBreaker(policy=WriteFailurePolicy()),
+    )
+    previews: list[VideoUpdatePreview] = field(default_factory=list)
+    # エラーはステージごとに分けて記録し、実行後にセッション順にまとめる
+    generate_errors: list[SessionProcessError] = field(default_factory=list)
+    fetch_errors: list[SessionProcessError] = field(default_factory=list)
+    write_errors: list[SessionProcessError] = field(default_factory=list)
+    used_slots: set[ScheduleSlot] = field(default_factory=set)
+    changed_count: int = 0
+    unchanged_count: int = 0
+    preserved_count: int = 0
+    no_mapping_count: int = 0
+    state_skipped_count: int = 0
+    duplicate_count: int = 0
+    aborted_count: int = 0
+    # ブレーカーが開いた後に、動画情報を取得せずに打ち切った件数 (prefetch ステージ)
+    fetch_aborted_count: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    # sink は複数のステージのスレッドから呼ばれるため、呼び出しを直列化する
+    sink_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def emit(  # noqa: PLR0913
+        self,
+        session: Session,
+        video_id: str | None,
+        status: VideoUpdateStatus,
+        *,
+        preview: VideoUpdatePreview | None = None,
+        update_seconds: float | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        """1セッションの結果を sink に渡す (sink がなければ何もしない)"""
+        if self.sink is None:
+            return
+
+        record = VideoUpdateRecord(
+            session_key=str(session.slot),
+            video_id=video_id,
+            status=status,
+            elapsed_seconds=time.perf_counter() - self.started,
+            title_changed=preview is not None and preview.has_title_changes,
+            description_changed=(
+                preview is not None and preview.has_description_changes
+            ),
+            update_seconds=update_seconds,
+            error_message=error_message,
+        )
+        with self.sink_lock:
+            self.sink(record)
+
+    def errors(self, schedule: ConferenceSchedule) -> tuple[SessionProcessError, ...]:
+        """全ステージのエラーをセッション順に並べて返す"""
+        errors = [*self.generate_errors, *self.fetch_errors, *self.write_errors]
+        if not errors:
+            return ()
+
+        positions = {
+            str(session.slot): position
+            for position, session in enumerate(schedule.sessions)
+        }
+        return tuple(sorted(errors, key=lambda error: positions[error.session_key]))
+
+
+def _append_error(
+    errors: list[SessionProcessError],
+    session: Session,
+    mapping: VideoMapping,
+    error: DomainError | VideoNotFound | VideoFetchFailure | VideoWriteFailure,
+) -> None:
+    errors.append(
+        SessionProcessError(
+            session_key=str(session.slot),
+            video_id=mapping.video_id,
+            error=error,
+        ),
+    )
+    logger.warning(
+        "Failed to process session %s: %s",
+        session.title,
+        error.message,
+    )
+
+
+def _record_fetch_error(
+    target: _Target,
+    progress: _Progress,
+    error: VideoNotFound | VideoFetchFailure,
+) -> None:
+    """動画情報を取得できなかったセッションをエラーとして記録する (prefetch ステージ)"""
+    _append_error(
+        errors=progress.fetch_errors,
+        session=target.session,
+        mapping=target.mapping,
+        error=error,
+    )
+    progress.emit(
+        session=target.session,
+        video_id=target.mapping.video_id,
+        status=VideoUpdateStatus.FAILED,
+        error_message=error.message,
+    )
+
+
 class UpdateYouTubeDescriptionsUseCase:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         confengine_api: ConfEngineApiProtocol,
         mapping_reader: MappingFileReaderProtocol,
         youtube_api: YouTubeApiProtocol,
+        *,
+        state_store: VideoStateStoreProtocol | None = None,
+        state_ttl: timedelta | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(tz=UTC),
+        write_failure_policy: WriteFailurePolicy | None = None,
+        content_generator: Callable[[], ContentBatchGenerator] = ContentBatchGenerator,
     ) -> None:
         self._confengine_api = confengine_api
         self._mapping_reader = mapping_reader
-        self._youtube_api = youtube_api
-
-    def execute(
+        self._youtube_api = TimedYouTubeApi(youtube_api=youtube_api)
+        self._state_store = state_store
+        self._state_ttl = state_ttl
+        self._clock = clock
+        self._write_failure_policy = write_failure_policy or WriteFailurePolicy()
+        self._content_generator = content_generator
+
+    def execute(  # noqa: PLR0913
         self,
         mapping_file: Path,
         *,
         dry_run: bool = False,
+        verify_remote: bool = False,
+        sink: Callable[[VideoUpdateRecord], None] | None = None,
+        preview_sink: Callable[[VideoUpdatePreview], None] | None = None,
+        selector: SessionSelector | None = None,
     ) -> VideoUpdateResult:
-        mapping = self._mapping_reader.read(file_path=mapping_file)
-        schedule = self._confengine_api.fetch_schedule(conf_id=mapping.conf_id)
-        mapping_config = mapping.to_domain(timezone=schedule.timezone)
+        """マッピングされた動画のタイトル・descriptionを更新する
+
+        同期状態ストアがあれば、前回同期時と生成内容が同じ動画は YouTube API を
+        呼ばずにスキップする。verify_remote 指定時はスキップせず、YouTube側の
+        現在の内容と比較する (手動で編集された動画を元に戻したい場合など)。
+        sink を渡すと、処理を終えたセッションから順に結果を渡す。この場合
+        結果の previews は空になり、セッション数によらずメモリ使用量が一定になる。
+        sink が呼ばれる順序はセッション順とは限らない。
+        preview_sink を渡すと、差分を取った動画のプレビューをセッション順に1件ずつ
+        渡して捨てる (dry-run の表示用)。この場合も previews は空になる。
+        動画の更新の失敗はセッションごとのエラーとして記録して続けるが、
+        write_failure_policy の条件まで失敗が続いたら以降の更新を打ち切る
+        (結果の aborted が真になり、残りの動画は aborted_count に数える)。
+        selector を渡すと、条件に合うセッションだけを対象にする。絞り込みは
+        YouTube API を呼ぶ前に行うため、対象外の動画は取得も更新もしない。
+        同じ動画が複数のスロットにマッピングされている場合にどのセッションの
+        内容で更新するかは、絞り込む前のスケジュール全体で決める。
+        """
+        with measure_phases() as timer:
+            with phase(name="mapping.read"):
+                mapping = self._mapping_reader.read(file_path=mapping_file)
+            with phase(name="confengine.fetch_schedule"):
+                schedule = self._confengine_api.fetch_schedule(conf_id=mapping.conf_id)
+            mapping_config = mapping.to_domain(timezone=schedule.timezone)
+            first_slots = self._first_slots_by_video_id(
+                schedule=schedule,
+                mapping_config=mapping_config,
+            )
 
-        return self._execute(
-            schedule=schedule,
-            mapping_config=mapping_config,
-            dry_run=dry_run,
-        )
+            if selector is not None and not selector.is_empty:
+                with phase(name="select"):
+                    schedule, mapping_config = selector.select(
+                        schedule=schedule,
+                        mapping_config=mapping_config,
+                    )
+                if not schedule.sessions:
+                    logger.warning("No session matched the selection")
 
-    def _execute(
+            result = self._execute(
+                schedule=schedule,
+                mapping_config=mapping_config,
+                first_slots=first_slots,
+                dry_run=dry_run,
+                verify_remote=verify_remote,
+                sink=sink,
+                preview_sink=preview_sink,
+            )
+
+        return replace(result, phases=timer.phases())
+
+    def _execute(  # noqa: PLR0913
         self,
         schedule: ConferenceSchedule,
         mapping_config: MappingConfig,
+        first_slots: dict[str, ScheduleSlot],
         *,
         dry_run: bool,
+        verify_remote: bool,
+        sink: Callable[[VideoUpdateRecord], None] | None,
+        preview_sink: Callable[[VideoUpdatePreview], None] | None,
     ) -> VideoUpdateResult:
-        previews: list[VideoUpdatePreview] = []
-        errors: list[SessionProcessError] = []
-        changed_count = 0
-        unchanged_count = 0
-        preserved_count = 0
-        no_mapping_count = 0
-        used_slots: set[ScheduleSlot] = set()
+        """セッションを 解決→生成→取得→差分→適用 のパイプラインに流す
+
+        動画情報の取得は生成後に行うため、前回同期時と生成内容が同じ動画は
+        YouTube APIを参照せずにスキップできる。
+        """
+        progress = _Progress(
+            sink=sink,
+            preview_sink=preview_sink,
+            breaker=WriteCircuitBreaker(policy=self._write_failure_policy),
+        )
+
+        def resolve(sessions: Iterator[Session]) -> Iterator[_Target]:
+            return self._resolve(
+                sessions=sessions,
+                mapping_config=mapping_config,
+                first_slots=first_slots,
+                progress=progress,
+            )
+
+        def generate(targets: Iterator[_Target]) -> Iterator[_Pending]:
+            return self._generate(
+                targets=targets,
+                mapping_config=mapping_config,
+                progress=progress,
+                verify_remote=verify_remote,
+            )
+
+        def prefetch(pendings: Iterator[_Pending]) -> Iterator[_Fetched]:
+            return self._prefetch(pendings=pendings, progress=progress)
+
+        def diff(fetched: Iterator[_Fetched]) -> Iterator[_Fetched]:
+            return self._diff(fetched=fetched, progress=progress)
+
+        def apply(fetched: Iterator[_Fetched]) -> Iterator[_Fetched]:
+            return self._apply(fetched=fetched, dry_run=dry_run, progress=progress)
+
+        stage_stats = run_pipeline(
+            source=schedule.sessions,
+            stages=(
+                PipelineStage(name="resolve", func=resolve),
+                PipelineStage(name="generate", func=generate),
+                PipelineStage(name="prefetch", func=prefetch),
+                PipelineStage(name="diff", func=diff),
+                PipelineStage(name="apply", func=apply),
+            ),
+        )
+
+        unused_count = self._warn_unused_mappings(
+            mapping_config=mapping_config,
+            used_slots=progress.used_slots,
+        )
+
+        return VideoUpdateResult(
+            is_dry_run=dry_run,
+            previews=tuple(progress.previews),
+            changed_count=progress.changed_count,
+            unchanged_count=progress.unchanged_count,
+            preserved_count=progress.preserved_count,
+            no_mapping_count=progress.no_mapping_count,
+            unused_mappings_count=unused_count,
+            state_skipped_count=progress.state_skipped_count,
+            duplicate_count=progress.duplicate_count,
+            errors=progress.errors(schedule=schedule),
+            aborted=progress.breaker.is_open,
+            aborted_count=progress.aborted_count + progress.fetch_aborted_count,
+            stage_stats=stage_stats,
+        )
+
+    @staticmethod
+    def _first_slots_by_video_id(
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> dict[str, ScheduleSlot]:
+        """動画ごとに、その動画がマッピングされたセッション順で最初のスロット"""
+        first_slots: dict[str, ScheduleSlot] = {}
 
         for session in schedule.sessions:
             mapping = mapping_config.find_mapping(slot=session.slot)
+            if mapping is not None:
+                first_slots.setdefault(mapping.video_id, session.slot)
+
+        return first_slots
+
+    @staticmethod
+    def _resolve(
+        sessions: Iterator[Session],
+        mapping_config: MappingConfig,
+        first_slots: dict[str, ScheduleSlot],
+        progress: _Progress,
+    ) -> Iterator[_Target]:
+        """マッピングがあり、更新対象のフラグが立っているセッションを流す
+
+        同じ動画が複数のスロットにマッピングされている場合 (2コマ続きの
+        ワークショップを1本の動画にした場合など) は、スケジュール全体で最初の
+        セッション (first_slots) の内容で1回だけ取得・更新し、他のセッションは
+        絞り込みで選ばれていてもスキップする。
+        """
+        for session in sessions:
+            mapping = mapping_config.find_mapping(slot=session.slot)
 
             if mapping is None:
-                no_mapping_count += 1
+                progress.no_mapping_count += 1
+                progress.emit(
+                    session=session,
+                    video_id=None,
+                    status=VideoUpdateStatus.NO_MAPPING,
+                )
                 continue
 
-            used_slots.add(session.slot)
+            progress.used_slots.add(session.slot)
+
+            if (first_slot := first_slots[mapping.video_id]) != session.slot:
+                progress.duplicate_count += 1
+                progress.emit(
+                    session=session,
+                    video_id=mapping.video_id,
+                    status=VideoUpdateStatus.DUPLICATE,
+                )
+                logger.warning(
+                    "Video %s is also mapped to %s; using %s",
+                    mapping.video_id,
+                    session.slot,
+                    first_slot,
+                )
+                continue
 
             # 両方falseならスキップ (YouTube APIも呼ばない)
             if not mapping.update_title and not mapping.update_description:
-                preserved_count += 1
+                progress.preserved_count += 1
+                progress.emit(
+                    session=session,
+                    video_id=mapping.video_id,
+                    status=VideoUpdateStatus.PRESERVED,
+                )
                 continue
 
-            video_info = self._youtube_api.get_video_info(
-                video_id=mapping.video_id,
-            )
+            yield _Target(session=session, mapping=mapping)
 
-            new_title = self._resolve_title(
-                session=session,
-                mapping=mapping,
-                video_info=video_info,
-                errors=errors,
-            )
-            if new_title is None:
-                continue
+    def _generate(
+        self,
+        targets: Iterator[_Target],
+        mapping_config: MappingConfig,
+        progress: _Progress,
+        *,
+        verify_remote: bool,
+    ) -> Iterator[_Pending]:
+        """コンテンツを生成し、前回同期時から変わったものだけを流す
 
-            new_description = self._resolve_description(
-                session=session,
-                mapping=mapping,
-                mapping_config=mapping_config,
-                video_info=video_info,
-                errors=errors,
-            )
-            if new_description is None:
+        件数が多ければ ContentBatchGenerator がワーカーに分配して並列に生成する。
+        生成できたセッションから順に流し、生成結果は溜め込まない。
+        """
+        # 生成器に渡したが、まだ結果を受け取っていない対象。生成器の結果と同じ順に並ぶ
+        in_flight: deque[_Target] = deque()
+
+        def jobs() -> Iterator[ContentJob]:
+            for target in targets:
+                in_flight.append(target)
+                yield ContentJob(
+                    session=target.session,
+                    update_title=target.mapping.update_title,
+                    update_description=target.mapping.update_description,
+                    hashtags=mapping_config.hashtags,
+                    footer=mapping_config.footer,
+                )
+
+        with self._content_generator() as generator:
+            for result in generator.stream(jobs=jobs()):
+                target = in_flight.popleft()
+                match result:
+                    case Failure(error):
+                        _append_error(
+                            errors=progress.generate_errors,
+                            session=target.session,
+                            mapping=target.mapping,
+                            error=error,
+                        )
+                        progress.emit(
+                            session=target.session,
+                            video_id=target.mapping.video_id,
+                            status=VideoUpdateStatus.FAILED,
+                            error_message=error.message,
+                        )
+                    case Success(content):
+                        if verify_remote or not self._is_synced(
+                            video_id=target.mapping.video_id,
+                            content=content,
+                        ):
+                            yield _Pending(target=target, content=content)
+                            continue
+
+                        # 前回同期時と生成内容が同じなら YouTube API を呼ばない
+                        progress.state_skipped_count += 1
+                        progress.emit(
+                            session=target.session,
+                            video_id=target.mapping.video_id,
+                            status=VideoUpdateStatus.STATE_SKIPPED,
+                        )
+                        logger.info(
+                            "Skipped (unchanged since last sync): %s (%s)",
+                            target.session.title,
+                            target.mapping.video_id,
+                        )
+
+    def _prefetch(
+        self,
+        pendings: Iterator[_Pending],
+        progress: _Progress,
+    ) -> Iterator[_Fetched]:
+        """動画情報を VIDEO_INFO_BATCH_SIZE 件ずつまとめて取得する
+
+        YouTube に見つからなかった動画は、そのセッションのエラーとして記録して
+        流さない (同じバッチの他の動画は続けて処理する)。
+        取得の成否は書き込みと同じブレーカーに記録し、取得を拒否されたバッチの
+        セッションはエラーとする。ブレーカーが開いたら以降は取得せず、
+        残りのセッションを打ち切った件数に数える。
+        """
+        for batch in batched(pendings, VIDEO_INFO_BATCH_SIZE, strict=False):
+            if progress.breaker.is_open:
+                for pending in batch:
+                    progress.fetch_aborted_count += 1
+                    progress.emit(
+                        session=pending.target.session,
+                        video_id=pending.target.mapping.video_id,
+                        status=VideoUpdateStatus.ABORTED,
+                    )
                 continue
 
-            preview = VideoUpdatePreview(
-                session_key=str(session.slot),
-                video_id=mapping.video_id,
-                current_title=video_info.title,
-                current_description=video_info.description,
-                new_title=new_title,
-                new_description=new_description,
+            video_ids = list(
+                dict.fromkeys(pending.target.mapping.video_id for pending in batch),
             )
-            previews.append(preview)
-
-            if preview.has_changes:
-                if not dry_run:
-                    request = VideoUpdateRequest(
-                        video_id=mapping.video_id,
-                        title=new_title,
-                        description=new_description,
-                        category_id=video_info.category_id,
-                    )
-                    self._youtube_api.update_video(request=request)
-                    logger.info(
-                        "Updated: %s (%s)",
-                        session.title,
-                        mapping.video_id,
-                    )
-                changed_count += 1
-            else:
-                unchanged_count += 1
-                if not dry_run:
-                    logger.info(
-                        "Skipped (unchanged): %s (%s)",
-                        session.title,
-                        mapping.video_id,
+            try:
+                infos = self._youtube_api.get_videos_info(video_ids=video_ids)
+            except VideoFetchError as e:
+                self._record_fetch_failure(batch=batch, progress=progress, error=e)
+                continue
+            progress.breaker.record(succeeded=True)
+
+            for pending in batch:
+                target = pending.target
+                video_info = infos.get(target.mapping.video_id)
+
+                if video_info is None:
+                    _record_fetch_error(
+                        target=target,
+                        progress=progress,
+                        error=VideoNotFound(
+                            message=f"Video not found: {target.mapping.video_id}",
+                        ),
                     )
+                    continue
 
-        unused_count = self._warn_unused_mappings(
-            mapping_config=mapping_config,
-            used_slots=used_slots,
-        )
+                yield _Fetched(pending=pending, video_info=video_info)
 
-        return VideoUpdateResult(
-            is_dry_run=dry_run,
-            previews=tuple(previews),
-            changed_count=changed_count,
-            unchanged_count=unchanged_count,
-            preserved_count=preserved_count,
-            no_mapping_count=no_mapping_count,
-            unused_mappings_count=unused_count,
-            errors=tuple(errors),
-        )
+    @staticmethod
+    def _record_fetch_failure(
+        batch: tuple[_Pending, ...],
+        progress: _Progress,
+        error: VideoFetchError,
+    ) -> None:
+        failure = VideoFetchFailure(message=str(error))
+
+        for pending in batch:
+            _record_fetch_error(
+                target=pending.target,
+                progress=progress,
+                error=failure,
+            )
+
+        progress.breaker.record(succeeded=False)
+        if progress.breaker.is_open:
+            logger.error("Too many failed video requests; skipping remaining updates")
 
     @staticmethod
-    def _resolve_title(
-        session: Session,
-        mapping: VideoMapping,
-        video_info: VideoInfo,
-        errors: list[SessionProcessError],
-    ) -> str | None:
-        """タイトルを解決する。フラグtrueなら生成、falseならYouTube既存値を使用。
+    def _diff(fetched: Iterator[_Fetched], progress: _Progress) -> Iterator[_Fetched]:
+        """現在の内容と比較してプレビューを作る"""
+        for item in fetched:
+            if progress.preview_sink is not None:
+                progress.preview_sink(item.preview)
+            elif progress.sink is None:
+                progress.previews.append(item.preview)
+
+            yield item
+
+    def _apply(
+        self,
+        fetched: Iterator[_Fetched],
+        progress: _Progress,
+        *,
+        dry_run: bool,
+    ) -> Iterator[_Fetched]:
+        """変更のある動画を更新し、同期状態を保存する
 
-        生成に失敗した場合はerrorsに追加しNoneを返す。
+        更新に失敗した動画はエラーとして記録して次へ進む。失敗が続いて
+        ブレーカーが開いたら、以降の変更のある動画は更新せずに打ち切った件数に数える。
         """
-        if not mapping.update_title:
-            return video_info.title
-
-        title_result = YouTubeContentGenerator.generate_title(session=session)
-        match title_result:
-            case Failure(error):
-                errors.append(
-                    SessionProcessError(
-                        session_key=str(session.slot),
-                        video_id=mapping.video_id,
-                        error=error,
-                    ),
-                )
-                logger.warning(
-                    "Failed to process session %s: %s",
-                    session.title,
-                    error.message,
+        for item in fetched:
+            target = item.pending.target
+            writes = item.preview.has_changes and not dry_run
+
+            if writes and progress.breaker.is_open:
+                progress.aborted_count += 1
+                progress.emit(
+                    session=target.session,
+                    video_id=target.mapping.video_id,
+                    status=VideoUpdateStatus.ABORTED,
+                    preview=item.preview,
                 )
-                return None
-            case Success(generated_title):
-                return str(generated_title)
-        raise AssertionError  # pragma: no cover
+                continue
+
+            try:
+                update_seconds = None if dry_run else self._apply_one(item=item)
+            except VideoUpdateError as e:
+                self._record_write_failure(item=item, progress=progress, error=e)
+                continue
+
+            if writes:
+                progress.breaker.record(succeeded=True)
+            if item.preview.has_changes:
+                progress.changed_count += 1
+            else:
+                progress.unchanged_count += 1
+
+            progress.emit(
+                session=target.session,
+                video_id=target.mapping.video_id,
+                status=(
+                    VideoUpdateStatus.UPDATED
+                    if item.preview.has_changes
+                    else VideoUpdateStatus.UNCHANGED
+                ),
+                preview=item.preview,
+                update_seconds=update_seconds,
+            )
+            yield item
 
     @staticmethod
-    def _resolve_description(
-        session: Session,
-        mapping: VideoMapping,
-        mapping_config: MappingConfig,
-        video_info: VideoInfo,
-        errors: list[SessionProcessError],
-    ) -> str | None:
-        """descriptionを解決する。フラグtrueなら生成、falseならYouTube既存値を使用。
+    def _record_write_failure(
+        item: _Fetched,
+        progress: _Progress,
+        error: VideoUpdateError,
+    ) -> None:
+        target = item.pending.target
+        failure = VideoWriteFailure(message=str(error))
+
+        _append_error(
+            errors=progress.write_errors,
+            session=target.session,
+            mapping=target.mapping,
+            error=failure,
+        )
+        progress.emit(
+            session=target.session,
+            video_id=target.mapping.video_id,
+            status=VideoUpdateStatus.FAILED,
+            preview=item.preview,
+            error_message=failure.message,
+        )
+
+        progress.breaker.record(succeeded=False)
+        if progress.breaker.is_open:
+            logger.error("Too many failed video updates; skipping remaining updates")
+
+    def _apply_one(self, item: _Fetched) -> float | None:
+        """動画を更新し、更新にかかった秒数を返す (変更がなければ None)"""
+        session = item.pending.target.session
+        video_id = item.pending.target.mapping.video_id
+
+        update_seconds: float | None = None
+
+        if item.preview.has_changes:
+            request = VideoUpdateRequest(
+                video_id=video_id,
+                title=item.preview.new_title,
+                description=item.preview.new_description,
+                category_id=item.video_info.category_id,
+            )
+            started = time.perf_counter()
+            etag = self._youtube_api.update_video(request=request)
+            update_seconds = time.perf_counter() - started
+            logger.info("Updated: %s (%s)", session.title, video_id)
+        else:
+            etag = item.video_info.etag
+            logger.info("Skipped (unchanged): %s (%s)", session.title, video_id)
+
+        self._save_state(
+            video_id=video_id,
+            video_info=item.video_info,
+            content=item.pending.content,
+            etag=etag,
+        )
+
+        return update_seconds
+
+    def _is_synced(self, video_id: str, content: GeneratedContent) -> bool:
+        """前回同期時と同じ内容で、かつ同期状態が有効期限内かどうか
 
-        生成に失敗した場合はerrorsに追加しNoneを返す。
+        state_ttl が None の場合、同期状態に有効期限はない。
         """
-        if not mapping.update_description:
-            return video_info.description
+        if self._state_store is None:
+            return False
 
-        desc_result = YouTubeContentGenerator.generate_description(
-            session=session,
-            hashtags=mapping_config.hashtags,
-            footer=mapping_config.footer,
+        with phase(name="state.read"):
+            state = self._state_store.get(video_id=video_id)
+        if state is None or state.content_hash != content.content_hash:
+            return False
+
+        if self._state_ttl is None:
+            return True
+
+        return self._clock() - state.synced_at < self._state_ttl
+
+    def _save_state(
+        self,
+        video_id: str,
+        video_info: VideoInfo,
+        content: GeneratedContent,
+        etag: str | None,
+    ) -> None:
+        if self._state_store is None:
+            return
+
+        state = VideoSyncState(
+            video_id=video_id,
+            content_hash=content.content_hash,
+            category_id=video_info.category_id,
+            etag=etag,
+            synced_at=self._clock(),
         )
-        match desc_result:
-            case Failure(error):
-                errors.append(
-                    SessionProcessError(
-                        session_key=str(session.slot),
-                        video_id=mapping.video_id,
-                        error=error,
-                    ),
-                )
-                logger.warning(
-                    "Failed to process session %s: %s",
-                    session.title,
-                    error.message,
-                )
-                return None
-            case Success(generated_desc):
-                return str(generated_desc)
-        raise AssertionError  # pragma: no cover
+        with phase(name="state.write"):
+            self._state_store.save(state=state)
 
     def _warn_unused_mappings(
         self,
@@ -0,0 +1,55 @@
+"""コンテンツ一括生成のベンチマーク
+
+合成したセッションのタイトル・descriptionを、直列と ContentBatchGenerator による
+並列 (GILありならプロセスプール、GILなしならスレッド) で生成し、所要時間を比較する。
+"""
+
+import os
+import time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.usecases.content_generation import (
+    ContentBatchGenerator,
+    ContentJob,
+    generate_content,
+    is_free_threaded,
+)
+from tests.fakes.synthetic import synthetic_sessions
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("size", [1000, 10000])
+def test_content_generation_benchmark(jst: ZoneInfo, size: int) -> None:
+    """直列生成と並列生成の所要時間"""
+    jobs = [
+        ContentJob(
+            session=session,
+            update_title=True,
+            update_description=True,
+            hashtags=("#RSGT2026", "#agile"),
+            footer="カンファレンス公式サイト: https://example.com",
+        )
+        for session in synthetic_sessions(count=size, timezone=jst)
+    ]
+
+    started = time.perf_counter()
+    serial = [generate_content(job=job) for job in jobs]
+    serial_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ContentBatchGenerator(parallel_threshold=1) as generator:
+        parallel = generator.generate(jobs=jobs)
+    parallel_elapsed = time.perf_counter() - started
+
+    print(
+        f"\n[content-generation] size={size} workers={os.process_cpu_count()} "
+        f"free_threaded={is_free_threaded()} "
+        f"serial={serial_elapsed:.3f}s "
+        f"({serial_elapsed / size * 1e6:.1f}us/session) "
+        f"parallel={parallel_elapsed:.3f}s (including worker startup)",
+    )
+
+    assert parallel == serial
@@ -0,0 +1,63 @@
+"""セッションとマッピングの突き合わせのベンチマーク
+
+全セッションについてスロットからマッピングを引く処理を、索引を使う
+MappingConfig.find_mapping() と、マッピングを先頭から線形に探す方式で比較する。
+線形検索は全件では時間がかかりすぎるため、一部のセッションだけを引いて全件分に換算する。
+"""
+
+import time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.domain.video_mapping import MappingConfig, VideoMapping
+from tests.fakes.synthetic import synthetic_sessions, synthetic_video_id
+
+pytestmark = pytest.mark.benchmark
+
+# 線形検索で実際に引くセッション数。スケジュール全体から等間隔に選ぶ
+LINEAR_SAMPLE_SIZE = 200
+
+
+def _linear_find(config: MappingConfig, slot: ScheduleSlot) -> VideoMapping | None:
+    """索引を使わない以前の find_mapping()"""
+    for mapping in config.mappings:
+        if mapping.slot == slot:
+            return mapping
+    return None
+
+
+@pytest.mark.parametrize("size", [100, 1000, 10000])
+def test_mapping_lookup_benchmark(size: int) -> None:
+    """全セッションの突き合わせにかかる時間 (索引の構築を含む)"""
+    sessions = synthetic_sessions(count=size, timezone=ZoneInfo(key="Asia/Tokyo"))
+    slots = [session.slot for session in sessions]
+    config = MappingConfig(
+        conf_id="bench",
+        playlist_id="PLbench",
+        mappings=frozenset(
+            VideoMapping(slot=slot, video_id=synthetic_video_id(index=index))
+            for index, slot in enumerate(slots)
+        ),
+        hashtags=(),
+        footer="",
+    )
+
+    started = time.perf_counter()
+    indexed = [config.find_mapping(slot=slot) for slot in slots]
+    indexed_seconds = time.perf_counter() - started
+
+    sample = slots[:: max(1, size // LINEAR_SAMPLE_SIZE)]
+    started = time.perf_counter()
+    linear = [_linear_find(config=config, slot=slot) for slot in sample]
+    linear_seconds = (time.perf_counter() - started) * size / len(sample)
+
+    print(
+        f"\n[mapping-lookup] sessions={size} "
+        f"indexed={indexed_seconds * 1000:.2f}ms "
+        f"linear={linear_seconds * 1000:.1f}ms (estimated from {len(sample)}) "
+        f"speedup={linear_seconds / indexed_seconds:.0f}x",
+    )
+    assert all(mapping is not None for mapping in indexed)
+    assert linear == [config.find_mapping(slot=slot) for slot in sample]
@@ -0,0 +1,143 @@
+"""プレイリスト並べ替え計画のベンチマーク
+
+合成したプレイリストに対して、位置がずれたアイテムを先頭から順に全て動かす方式と、
+LIS を残して最小限だけ動かす方式の操作数 (追加 + 位置更新) を比較する。
+"""
+
+import random
+import time
+from collections.abc import Callable
+
+import pytest
+
+from confengine_to_youtube.usecases.dto import PlaylistItem
+from confengine_to_youtube.usecases.playlist_planner import find_items_to_keep
+from confengine_to_youtube.usecases.playlist_state import PlaylistState
+
+pytestmark = pytest.mark.benchmark
+
+Scenario = Callable[[int], tuple[list[str], list[str]]]
+
+
+def _video_ids(count: int) -> list[str]:
+    return [f"vid{i:07d}" for i in range(count)]
+
+
+def _insert_near_top(size: int) -> tuple[list[str], list[str]]:
+    target = _video_ids(count=size)
+    return [target[0], *target[2:]], target
+
+
+def _last_item_at_top(size: int) -> tuple[list[str], list[str]]:
+    target = _video_ids(count=size)
+    return [target[-1], *target[:-1]], target
+
+
+def _nearly_sorted(size: int) -> tuple[list[str], list[str]]:
+    target = _video_ids(count=size)
+    current = list(target)
+    rng = random.Random(x=size)  # noqa: S311
+    for _ in range(max(1, size // 50)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        current[i], current[j] = current[j], current[i]
+    return current, target
+
+
+def _shuffled(size: int) -> tuple[list[str], list[str]]:
+    target = _video_ids(count=size)
+    current = list(target)
+    random.Random(x=size).shuffle(current)  # noqa: S311
+    return current, target
+
+
+def _reversed(size: int) -> tuple[list[str], list[str]]:
+    target = _video_ids(count=size)
+    return target[::-1], target
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "insert_near_top": _insert_near_top,
+    "last_item_at_top": _last_item_at_top,
+    "nearly_sorted": _nearly_sorted,
+    "shuffled": _shuffled,
+    "reversed": _reversed,
+}
+
+
+def _state(current: list[str]) -> PlaylistState:
+    return PlaylistState(
+        items=[
+            PlaylistItem(video_id=video_id, playlist_item_id=video_id, position=i)
+            for i, video_id in enumerate(current)
+        ],
+    )
+
+
+def _naive_operation_count(current: list[str], target: list[str]) -> int:
+    """目標位置とずれたアイテムを先頭から順に全て動かす方式の操作数"""
+    state = _state(current=current)
+    count = 0
+    for position, video_id in enumerate(target):
+        item = state.get(video_id=video_id)
+        if item is None:
+            state.insert(
+                item=PlaylistItem(
+                    video_id=video_id,
+                    playlist_item_id=video_id,
+                    position=position,
+                ),
+                position=position,
+            )
+            count += 1
+        elif item.position != position:
+            state.move(video_id=video_id, position=position)
+            count += 1
+    return count
+
+
+def _minimal_operation_count(current: list[str], target: list[str]) -> int:
+    """LIS を残す方式の操作数 (適用結果が目標どおりになることも確認する)"""
+    state = _state(current=current)
+    keep = find_items_to_keep(current=current, target=target)
+    count = 0
+    for index, video_id in enumerate(target):
+        if video_id in keep:
+            continue
+        position = state.position_after(
+            video_id=video_id,
+            after_video_id=target[index - 1] if index > 0 else None,
+        )
+        if video_id in state:
+            state.move(video_id=video_id, position=position)
+        else:
+            state.insert(
+                item=PlaylistItem(
+                    video_id=video_id,
+                    playlist_item_id=video_id,
+                    position=position,
+                ),
+                position=position,
+            )
+        count += 1
+    assert list(state.video_ids()) == target
+    return count
+
+
+@pytest.mark.parametrize("size", [100, 1000, 5000])
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_playlist_planner_benchmark(size: int, scenario: str) -> None:
+    """シナリオごとの操作数と計画時間"""
+    current, target = SCENARIOS[scenario](size)
+
+    naive = _naive_operation_count(current=current, target=target)
+    started = time.perf_counter()
+    find_items_to_keep(current=current, target=target)
+    plan_seconds = time.perf_counter() - started
+    minimal = _minimal_operation_count(current=current, target=target)
+
+    print(
+        f"\n[playlist-planner] size={size} scenario={scenario} "
+        f"naive_ops={naive} minimal_ops={minimal} "
+        f"quota_saved={(naive - minimal) * 50} plan={plan_seconds * 1000:.1f}ms",
+    )
+    assert minimal <= naive
@@ -0,0 +1,101 @@
+"""ConferenceSchedule の索引を使った検索のベンチマーク
+
+合成した100,000セッションのスケジュールに対して、日付・URL・時間帯による検索を
+索引で行った場合と sessions を毎回走査した場合の所要時間を比較する。
+索引の構築時間は索引側に含める。
+"""
+
+import random
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
+from confengine_to_youtube.domain.session import Session
+from tests.fakes.synthetic import synthetic_sessions
+
+pytestmark = pytest.mark.benchmark
+
+SESSION_COUNT = 100_000
+QUERY_COUNT = 200
+WINDOW = timedelta(hours=1)
+
+type Query = Callable[[ConferenceSchedule, Session], object]
+
+
+def _indexed_date(schedule: ConferenceSchedule, session: Session) -> object:
+    return schedule.sessions_on(dates=[session.slot.timeslot.date()])
+
+
+def _scanned_date(schedule: ConferenceSchedule, session: Session) -> object:
+    day = session.slot.timeslot.date()
+    return [s for s in schedule.sessions if s.slot.timeslot.date() == day]
+
+
+def _indexed_url(schedule: ConferenceSchedule, session: Session) -> object:
+    return schedule.session_by_url(url=session.url)
+
+
+def _scanned_url(schedule: ConferenceSchedule, session: Session) -> object:
+    return next(s for s in schedule.sessions if s.url == session.url)
+
+
+def _indexed_between(schedule: ConferenceSchedule, session: Session) -> object:
+    start = session.slot.timeslot
+    return schedule.sessions_between(start=start, end=start + WINDOW)
+
+
+def _scanned_between(schedule: ConferenceSchedule, session: Session) -> object:
+    start = session.slot.timeslot
+    return sorted(
+        (s for s in schedule.sessions if start <= s.slot.timeslot < start + WINDOW),
+        key=lambda s: s.slot.timeslot,
+    )
+
+
+def _elapsed(
+    schedule: ConferenceSchedule,
+    sessions: list[Session],
+    query: Query,
+) -> float:
+    started = time.perf_counter()
+    for session in sessions:
+        query(schedule, session)
+    return time.perf_counter() - started
+
+
+@pytest.mark.parametrize(
+    ("name", "indexed", "scanned"),
+    [
+        ("date", _indexed_date, _scanned_date),
+        ("url", _indexed_url, _scanned_url),
+        ("between", _indexed_between, _scanned_between),
+    ],
+)
+def test_schedule_index_benchmark(
+    jst: ZoneInfo,
+    name: str,
+    indexed: Query,
+    scanned: Query,
+) -> None:
+    """索引と走査の所要時間 (QUERY_COUNT 回の検索、索引の構築を含む)"""
+    sessions = synthetic_sessions(count=SESSION_COUNT, timezone=jst)
+    schedule = ConferenceSchedule(conf_id="bench", timezone=jst, sessions=sessions)
+    rng = random.Random(x=0)  # noqa: S311
+    picked = [rng.choice(sessions) for _ in range(QUERY_COUNT)]
+
+    indexed_seconds = _elapsed(schedule=schedule, sessions=picked, query=indexed)
+    scanned_seconds = _elapsed(schedule=schedule, sessions=picked, query=scanned)
+
+    print(
+        f"\n[schedule-index] sessions={SESSION_COUNT} queries={QUERY_COUNT} "
+        f"{name}: indexed={indexed_seconds * 1000:.1f}ms "
+        f"scan={scanned_seconds * 1000:.0f}ms "
+        f"speedup={scanned_seconds / indexed_seconds:.0f}x",
+    )
+    assert [indexed(schedule, s) for s in picked[:5]] == [
+        scanned(schedule, s) for s in picked[:5]
+    ]
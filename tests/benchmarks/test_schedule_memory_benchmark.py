@@ -0,0 +1,103 @@
+"""スケジュールを保持するメモリ量のベンチマーク
+
+合成した100,000セッションのスケジュールとマッピングについて、1セッションあたりの
+メモリ量を tracemalloc で測る。__slots__ を持たない以前の dataclass と同じ
+フィールドのクラスでも同じものを組み立て、値オブジェクトの分だけを比較する。
+文字列や datetime はどちらも同じオブジェクトを共有するので差に含まれない。
+"""
+
+import gc
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.domain.session_abstract import SessionAbstract
+from confengine_to_youtube.domain.speaker import Speaker
+from confengine_to_youtube.domain.video_mapping import VideoMapping
+from tests.fakes.synthetic import synthetic_sessions, synthetic_video_id
+
+pytestmark = pytest.mark.benchmark
+
+SESSION_COUNT = 100_000
+
+SLOTTED = (Session, ScheduleSlot, Speaker, SessionAbstract, VideoMapping)
+
+
+def _without_slots(cls: type) -> type:
+    """同じフィールドを持ち、インスタンスごとに __dict__ を持つ dataclass"""
+    # 構築時に渡さない、キャッシュ用のフィールドは含めない
+    names = [f.name for f in fields(cls) if f.init]
+    return make_dataclass(cls.__name__, names, frozen=True)
+
+
+def _rebuild(sessions: tuple[Session, ...], classes: tuple[type, ...]) -> list[object]:
+    """セッションと対応するマッピングを、指定したクラスで組み立て直す"""
+    session_cls, slot_cls, speaker_cls, abstract_cls, mapping_cls = classes
+    rebuilt: list[object] = []
+
+    for index, session in enumerate(sessions):
+        slot = slot_cls(timeslot=session.slot.timeslot, room=session.slot.room)
+        rebuilt.append(
+            session_cls(
+                slot=slot,
+                title=session.title,
+                track=session.track,
+                speakers=tuple(
+                    speaker_cls(first_name=s.first_name, last_name=s.last_name)
+                    for s in session.speakers
+                ),
+                abstract=abstract_cls(content=session.abstract.content),
+                url=session.url,
+            ),
+        )
+        rebuilt.append(
+            mapping_cls(
+                slot=slot,
+                video_id=synthetic_video_id(index=index),
+                update_title=True,
+                update_description=True,
+            ),
+        )
+
+    return rebuilt
+
+
+def _bytes_per_session(
+    sessions: tuple[Session, ...],
+    classes: tuple[type, ...],
+) -> float:
+    """組み立て直したセッションとマッピングが増やしたメモリ量 (1セッションあたり)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        rebuilt = _rebuild(sessions=sessions, classes=classes)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(rebuilt) == 2 * len(sessions)
+    return (after - before) / len(sessions)
+
+
+def test_schedule_memory_benchmark(jst: ZoneInfo) -> None:
+    """1セッションあたりのメモリ量 (__slots__ なし / あり)"""
+    sessions = synthetic_sessions(count=SESSION_COUNT, timezone=jst)
+
+    unslotted = _bytes_per_session(
+        sessions=sessions,
+        classes=tuple(_without_slots(cls=cls) for cls in SLOTTED),
+    )
+    slotted = _bytes_per_session(sessions=sessions, classes=SLOTTED)
+
+    print(
+        f"\n[schedule-memory] sessions={SESSION_COUNT} "
+        f"dict={unslotted:.0f}B/session slots={slotted:.0f}B/session "
+        f"saved={1 - slotted / unslotted:.0%}",
+    )
+    assert not hasattr(sessions[0], "__dict__")
+    assert slotted < unslotted
@@ -0,0 +1,121 @@
+"""プレイリスト同期ユースケースのスケーリングベンチマーク
+
+合成したスケジュールとプレイリストに対して、HTTP を介さないインメモリの
+YouTube API で SyncPlaylistUseCase を実行し、シナリオごとの操作数 (追加 + 位置更新)・
+プレイリスト取得回数・クォータ消費量・所要時間を報告する。
+"""
+
+import math
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.usecases.sync_playlist import SyncPlaylistUseCase
+from tests.fakes.synthetic import (
+    synthetic_sessions,
+    synthetic_video_id,
+    write_synthetic_mapping_file,
+)
+from tests.fakes.youtube_api import InMemoryYouTubeApi
+from tests.fakes.youtube_backend import MAX_PAGE_SIZE, FakeYouTubeBackend
+from tests.integration.usecases.conftest import create_mock_confengine_api
+
+pytestmark = pytest.mark.benchmark
+
+PLAYLIST_ID = "PLbench"
+
+# セッション順の video_id から、同期前のプレイリストの並びを作る
+Scenario = Callable[[list[str]], list[str]]
+
+
+def _shuffled(target: list[str]) -> list[str]:
+    current = list(target)
+    random.Random(x=len(target)).shuffle(current)  # noqa: S311
+    return current
+
+
+def _reversed(target: list[str]) -> list[str]:
+    return target[::-1]
+
+
+def _nearly_sorted(target: list[str]) -> list[str]:
+    current = list(target)
+    rng = random.Random(x=len(target))  # noqa: S311
+    for _ in range(max(1, len(target) // 50)):
+        i, j = rng.randrange(len(target)), rng.randrange(len(target))
+        current[i], current[j] = current[j], current[i]
+    return current
+
+
+def _mostly_new(target: list[str]) -> list[str]:
+    # 1割だけ既にプレイリストにあり、残りは新規追加
+    return target[: len(target) // 10]
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "random": _shuffled,
+    "reversed": _reversed,
+    "nearly_sorted": _nearly_sorted,
+    "mostly_new": _mostly_new,
+}
+
+
+@pytest.mark.parametrize("size", [100, 1000, 5000])
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_sync_playlist_benchmark(
+    tmp_path: Path,
+    jst: ZoneInfo,
+    size: int,
+    scenario: str,
+) -> None:
+    """シナリオごとの操作数・取得回数・クォータ・所要時間"""
+    sessions = synthetic_sessions(count=size, timezone=jst)
+    target = [synthetic_video_id(index=index) for index in range(size)]
+    current = SCENARIOS[scenario](target)
+
+    backend = FakeYouTubeBackend()
+    for video_id in target:
+        backend.add_video(video_id=video_id)
+    backend.add_playlist(playlist_id=PLAYLIST_ID, video_ids=tuple(current))
+
+    usecase = SyncPlaylistUseCase(
+        confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+        mapping_reader=MappingFileReader(),
+        youtube_api=InMemoryYouTubeApi(backend=backend),
+    )
+    mapping_file = write_synthetic_mapping_file(
+        tmp_path=tmp_path,
+        sessions=sessions,
+        playlist_id=PLAYLIST_ID,
+    )
+
+    started = time.perf_counter()
+    usecase.execute(mapping_file=mapping_file, dry_run=False)
+    elapsed = time.perf_counter() - started
+
+    operations = (
+        backend.calls["playlistItems.insert"] + backend.calls["playlistItems.update"]
+    )
+    print(
+        f"\n[sync-playlist] size={size} scenario={scenario} "
+        f"ops={operations} "
+        f"(insert={backend.calls['playlistItems.insert']} "
+        f"update={backend.calls['playlistItems.update']}) "
+        f"list_calls={backend.calls['playlistItems.list']} "
+        f"quota={backend.quota_used} time={elapsed:.2f}s",
+    )
+
+    assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == target
+    # 取得は同期開始時の1回 (全ページ) だけ
+    assert backend.calls["playlistItems.list"] == max(
+        1,
+        math.ceil(len(current) / MAX_PAGE_SIZE),
+    )
+    # 新規の動画は1回ずつ追加するだけで、既存の動画は高々1回しか動かさない
+    assert backend.calls["playlistItems.insert"] == size - len(current)
+    assert backend.calls["playlistItems.update"] < len(current)
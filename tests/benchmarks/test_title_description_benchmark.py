@@ -0,0 +1,69 @@
+"""タイトル・description 生成のスループットのベンチマーク
+
+合成したセッションのタイトルと description を直列に生成し、
+1秒あたりのセッション数を測る。
+長いタイトルと多数のスピーカーを持つセッションでは、タイトル生成がスピーカーの
+表記をフルネーム・イニシャル・ラストネームの順にすべて試すため、別に測る。
+"""
+
+import time
+from dataclasses import replace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.domain.speaker import Speaker
+from confengine_to_youtube.domain.youtube_content_generator import (
+    YouTubeContentGenerator,
+)
+from tests.fakes.synthetic import synthetic_sessions
+
+pytestmark = pytest.mark.benchmark
+
+SESSION_COUNT = 10000
+HASHTAGS = ("#RSGT2026", "#agile")
+FOOTER = "カンファレンス公式サイト: https://example.com"
+
+
+def _crowded(session: Session) -> Session:
+    """どの表記でも100文字に収まらない、長いタイトルと多数のスピーカーのセッション"""
+    return replace(
+        session,
+        title=f"{session.title} " * 2,
+        speakers=tuple(
+            Speaker(first_name=f"Firstname{n} Middlename", last_name=f"Lastname{n}")
+            for n in range(6)
+        ),
+    )
+
+
+def _generate_all(sessions: tuple[Session, ...]) -> float:
+    """全セッションのタイトルと description を生成し、所要時間を返す"""
+    started = time.perf_counter()
+    for session in sessions:
+        YouTubeContentGenerator.generate_title(session=session).unwrap()
+        YouTubeContentGenerator.generate_description(
+            session=session,
+            hashtags=HASHTAGS,
+            footer=FOOTER,
+        ).unwrap()
+    return time.perf_counter() - started
+
+
+@pytest.mark.parametrize("crowded", [False, True], ids=["typical", "crowded"])
+def test_title_description_benchmark(jst: ZoneInfo, *, crowded: bool) -> None:
+    """タイトルと description の生成スループット"""
+    sessions = synthetic_sessions(count=SESSION_COUNT, timezone=jst)
+    if crowded:
+        sessions = tuple(_crowded(session=session) for session in sessions)
+
+    # 2周目は、dry-run のプレビュー後に更新する場合など、同じセッションから再び生成する
+    first = _generate_all(sessions=sessions)
+    second = _generate_all(sessions=sessions)
+
+    print(
+        f"\n[title-description] sessions={SESSION_COUNT} crowded={crowded} "
+        f"first={SESSION_COUNT / first:,.0f} sessions/s "
+        f"second={SESSION_COUNT / second:,.0f} sessions/s",
+    )
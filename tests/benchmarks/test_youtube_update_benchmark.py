@@ -0,0 +1,90 @@
+"""youtube-update 全体のオフラインベンチマーク
+
+フェイクYouTubeサーバー (レイテンシ付き) に対して説明文更新とプレイリスト同期を実行し、
+所要時間・API呼び出し回数・クォータ消費量を報告する。
+"""
+
+import time
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
+from confengine_to_youtube.usecases.sync_playlist import SyncPlaylistUseCase
+from confengine_to_youtube.usecases.update_youtube_descriptions import (
+    UpdateYouTubeDescriptionsUseCase,
+)
+from tests.fakes.synthetic import synthetic_video_id
+from tests.fakes.youtube_backend import FakeYouTubeBackend
+from tests.fakes.youtube_server import FakeYouTubeServer
+from tests.integration.usecases.conftest import (
+    create_mock_confengine_api,
+    create_synthetic_conference,
+)
+
+pytestmark = pytest.mark.benchmark
+
+PLAYLIST_ID = "PLbench"
+LATENCY_SECONDS = 0.005
+
+
+@pytest.mark.parametrize("session_count", [50, 200])
+@pytest.mark.parametrize("run", ["first", "steady"])
+def test_youtube_update_benchmark(
+    tmp_path: Path,
+    jst: ZoneInfo,
+    session_count: int,
+    run: str,
+) -> None:
+    """初回実行 (全更新) と定常実行 (変更なし) のコストを計測"""
+    conference = create_synthetic_conference(
+        tmp_path=tmp_path,
+        timezone=jst,
+        session_count=session_count,
+        playlist_id=PLAYLIST_ID,
+        backend=FakeYouTubeBackend(latency=LATENCY_SECONDS),
+        with_playlist=True,
+    )
+    mapping_file = conference.mapping_file
+    backend = conference.backend
+
+    with FakeYouTubeServer(backend=backend) as server:
+        gateway = YouTubeApiGateway.from_api_endpoint(api_endpoint=server.api_endpoint)
+        confengine_api = create_mock_confengine_api(
+            sessions=conference.sessions,
+            timezone=jst,
+        )
+        mapping_reader = MappingFileReader()
+        update_usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=gateway,
+        )
+        sync_usecase = SyncPlaylistUseCase(
+            confengine_api=confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=gateway,
+        )
+
+        def execute() -> float:
+            started = time.perf_counter()
+            update_usecase.execute(mapping_file=mapping_file, dry_run=False)
+            sync_usecase.execute(mapping_file=mapping_file, dry_run=False)
+            return time.perf_counter() - started
+
+        if run == "steady":
+            execute()
+            backend.reset_counters()
+
+        elapsed = execute()
+
+    print(
+        f"\n[youtube-update] sessions={session_count} run={run} "
+        f"wall={elapsed:.2f}s calls={backend.total_calls} "
+        f"quota={backend.quota_used} breakdown={dict(backend.calls)}",
+    )
+    assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+        synthetic_video_id(index=i) for i in range(session_count)
+    ]
@@ -0,0 +1,106 @@
+"""ベンチマーク・テスト用の合成スケジュールとマッピングファイル生成"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.domain.session_abstract import SessionAbstract
+from confengine_to_youtube.domain.speaker import Speaker
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from zoneinfo import ZoneInfo
+
+ROOMS = ("Hall A", "Hall B", "Hall C", "Hall D")
+TRACKS = ("Track 1", "Track 2", "Track 3")
+SLOTS_PER_DAY = 24
+SLOT_INTERVAL = timedelta(minutes=30)
+
+_ABSTRACT = (
+    "This talk explores how teams adopt agile practices at scale. "
+    "We share <b>lessons</b> learned from real projects, including "
+    "retrospectives, planning and continuous delivery. "
+) * 4
+
+
+def synthetic_video_id(index: int) -> str:
+    """index番目のセッションに対応する video_id"""
+    return f"vid{index:07d}"
+
+
+def synthetic_sessions(count: int, timezone: ZoneInfo) -> tuple[Session, ...]:
+    """日付→時間→ルーム順に並んだ合成セッションを生成
+
+    1日あたり len(ROOMS) * SLOTS_PER_DAY セッションで、必要な日数だけ続く。
+    """
+    first_slot = datetime(year=2026, month=1, day=7, hour=9, tzinfo=timezone)
+    sessions: list[Session] = []
+
+    for index in range(count):
+        slot_index, room_index = divmod(index, len(ROOMS))
+        day, slot_of_day = divmod(slot_index, SLOTS_PER_DAY)
+        timeslot = first_slot + timedelta(days=day) + SLOT_INTERVAL * slot_of_day
+
+        sessions.append(
+            Session(
+                slot=ScheduleSlot(timeslot=timeslot, room=ROOMS[room_index]),
+                title=f"Session {index}: Scaling Agile in Practice",
+                track=TRACKS[index % len(TRACKS)],
+                speakers=tuple(
+                    Speaker(first_name=f"First{index}-{n}", last_name=f"Last{n}")
+                    for n in range(1 + index % 2)
+                ),
+                abstract=SessionAbstract(content=_ABSTRACT),
+                url=f"https://example.com/session/{index}",
+            ),
+        )
+
+    return tuple(sessions)
+
+
+def synthetic_mapping_yaml(
+    sessions: tuple[Session, ...],
+    playlist_id: str,
+    conf_id: str = "test-conf",
+) -> str:
+    """全セッションを synthetic_video_id() にマッピングするYAMLを生成"""
+    lines = [
+        f"conf_id: {conf_id}",
+        f"playlist_id: {playlist_id}",
+        'hashtags: ["#Synthetic"]',
+        'footer: "Synthetic conference"',
+        "sessions:",
+    ]
+    nested: dict[str, dict[str, list[str]]] = {}
+
+    for index, session in enumerate(sessions):
+        timeslot = session.slot.timeslot
+        rooms = nested.setdefault(timeslot.date().isoformat(), {})
+        rooms.setdefault(session.slot.room, []).append(
+            f'      "{timeslot:%H:%M}": {{ video_id: "{synthetic_video_id(index)}" }}',
+        )
+
+    for day, rooms in nested.items():
+        lines.append(f'  "{day}":')
+        for room, entries in rooms.items():
+            lines.append(f'    "{room}":')
+            lines.extend(entries)
+
+    return "\n".join(lines) + "\n"
+
+
+def write_synthetic_mapping_file(
+    tmp_path: Path,
+    sessions: tuple[Session, ...],
+    playlist_id: str,
+) -> Path:
+    """合成マッピングファイルを書き出す"""
+    mapping_file = tmp_path / "mapping.yaml"
+    mapping_file.write_text(
+        data=synthetic_mapping_yaml(sessions=sessions, playlist_id=playlist_id),
+        encoding="utf-8",
+    )
+    return mapping_file
@@ -0,0 +1,146 @@
+"""FakeYouTubeBackend を直接呼び出す YouTubeApiProtocol 実装
+
+HTTP を経由しないため、大きなプレイリストでもユースケース自体のコスト
+(操作数・API呼び出し回数・計画時間) だけを素早く計測できる。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from confengine_to_youtube.adapters.youtube_schema import (
+    YouTubePlaylistItemInsertResponse,
+    YouTubePlaylistItemsListResponse,
+    YouTubeVideosListResponse,
+)
+from confengine_to_youtube.usecases.dto import (
+    PlaylistItem,
+    PlaylistSnapshot,
+    VideoInfo,
+)
+from confengine_to_youtube.usecases.errors import VideoFetchError, VideoUpdateError
+from tests.fakes.youtube_backend import FakeYouTubeError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from confengine_to_youtube.usecases.dto import VideoUpdateRequest
+    from tests.fakes.youtube_backend import FakeYouTubeBackend
+
+
+class InMemoryYouTubeApi:
+    """FakeYouTubeBackend に対する YouTubeApiProtocol の実装
+
+    呼び出し回数とクォータ消費量は backend に記録される。
+    """
+
+    def __init__(self, backend: FakeYouTubeBackend) -> None:
+        self.backend = backend
+
+    def get_videos_info(self, video_ids: Sequence[str]) -> dict[str, VideoInfo]:
+        try:
+            response = self.backend.videos_list(video_ids=list(video_ids))
+        except FakeYouTubeError as e:
+            msg = f"Failed to fetch {len(video_ids)} videos: HTTP {e.status} {e.reason}"
+            raise VideoFetchError(msg) from e
+        parsed = YouTubeVideosListResponse.model_validate(obj=response)
+        return {
+            item.id: VideoInfo(
+                video_id=item.id,
+                title=item.snippet.title,
+                description=item.snippet.description,
+                category_id=item.snippet.category_id,
+                etag=item.etag,
+            )
+            for item in parsed.items
+        }
+
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        try:
+            response = self.backend.videos_update(
+                body={
+                    "id": request.video_id,
+                    "snippet": {
+                        "title": request.title,
+                        "description": request.description,
+                        "categoryId": str(request.category_id),
+                    },
+                },
+            )
+        except FakeYouTubeError as e:
+            msg = (
+                f"Failed to update video {request.video_id}: HTTP {e.status} {e.reason}"
+            )
+            raise VideoUpdateError(msg) from e
+        return response.get("etag")
+
+    def fetch_playlist(self, playlist_id: str) -> PlaylistSnapshot:
+        page_etags: list[str | None] = []
+        items: list[PlaylistItem] = []
+        page_token: str | None = None
+
+        while True:
+            response = self.backend.playlist_items_list(
+                playlist_id=playlist_id,
+                max_results=50,
+                page_token=page_token,
+            )
+            page = YouTubePlaylistItemsListResponse.model_validate(obj=response)
+            page_etags.append(page.etag)
+            items.extend(
+                PlaylistItem(
+                    video_id=item.content_details.video_id,
+                    playlist_item_id=item.id,
+                    position=item.snippet.position,
+                )
+                for item in page.items
+            )
+
+            if not page.next_page_token:
+                break
+            page_token = page.next_page_token
+
+        etag = hashlib.sha256(json.dumps(obj=page_etags).encode()).hexdigest()
+        return PlaylistSnapshot(etag=etag, items=tuple(items))
+
+    def add_to_playlist(
+        self,
+        playlist_id: str,
+        video_id: str,
+        position: int | None = None,
+    ) -> PlaylistItem:
+        snippet: dict[str, object] = {
+            "playlistId": playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": video_id},
+        }
+        if position is not None:
+            snippet["position"] = position
+
+        response = self.backend.playlist_items_insert(body={"snippet": snippet})
+        parsed = YouTubePlaylistItemInsertResponse.model_validate(obj=response)
+
+        return PlaylistItem(
+            video_id=video_id,
+            playlist_item_id=parsed.id,
+            position=parsed.snippet.position,
+        )
+
+    def update_playlist_item_position(
+        self,
+        playlist_item_id: str,
+        playlist_id: str,
+        video_id: str,
+        position: int,
+    ) -> None:
+        self.backend.playlist_items_update(
+            body={
+                "id": playlist_item_id,
+                "snippet": {
+                    "playlistId": playlist_id,
+                    "position": position,
+                    "resourceId": {"kind": "youtube#video", "videoId": video_id},
+                },
+            },
+        )
@@ -0,0 +1,401 @@
+"""YouTube Data API v3 のインメモリ実装 (テスト・ベンチマーク用)
+
+videos.list / videos.update / playlistItems.list / insert / update について、
+position のシフト・ページネーション・ETag を実APIと同じ規則で再現し、
+呼び出し回数とクォータ消費量を記録する。
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Final
+
+# YouTube Data API v3 の1リクエストあたりのクォータコスト
+QUOTA_COSTS: Final[dict[str, int]] = {
+    "videos.list": 1,
+    "videos.update": 50,
+    "playlistItems.list": 1,
+    "playlistItems.insert": 50,
+    "playlistItems.update": 50,
+}
+
+MAX_PAGE_SIZE: Final = 50
+
+
+class FakeYouTubeError(Exception):
+    """APIエラーレスポンスに変換される例外"""
+
+    def __init__(self, status: int, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.message = message
+
+
+@dataclass
+class FakeVideo:
+    title: str
+    description: str
+    category_id: int = 28
+
+
+@dataclass(frozen=True)
+class FakePlaylistEntry:
+    playlist_item_id: str
+    video_id: str
+
+
+def compute_etag(payload: object) -> str:
+    """ペイロードから決定的なETagを計算"""
+    digest = hashlib.sha1(  # noqa: S324 - 識別子用途でありセキュリティ用途ではない
+        json.dumps(obj=payload, sort_keys=True, ensure_ascii=False).encode(),
+    ).digest()
+    return base64.urlsafe_b64encode(s=digest).decode().rstrip("=")
+
+
+class FakeYouTubeBackend:
+    """YouTube Data API の状態とセマンティクスを保持するインメモリバックエンド
+
+    スレッドセーフ。latency を指定すると各呼び出しでその秒数だけ待機する
+    (ロック外で待機するため、並行リクエストのレイテンシは重なり合う)。
+    quota_limit を指定すると、それを超える呼び出しは quotaExceeded (403) になる。
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        page_size: int = MAX_PAGE_SIZE,
+        quota_limit: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.page_size = page_size
+        self.quota_limit = quota_limit
+        self.videos: dict[str, FakeVideo] = {}
+        self.playlists: dict[str, list[FakePlaylistEntry]] = {}
+        self.calls: Counter[str] = Counter()
+        self.not_modified_count = 0
+        self._lock = threading.Lock()
+        self._next_item_number = 0
+
+    @property
+    def quota_used(self) -> int:
+        """消費したクォータの合計"""
+        return sum(QUOTA_COSTS[method] * count for method, count in self.calls.items())
+
+    @property
+    def total_calls(self) -> int:
+        """API呼び出しの合計回数"""
+        return sum(self.calls.values())
+
+    def reset_counters(self) -> None:
+        """呼び出し回数の記録をリセット"""
+        with self._lock:
+            self.calls.clear()
+            self.not_modified_count = 0
+
+    # テストデータ投入用
+
+    def add_video(
+        self,
+        video_id: str,
+        title: str = "",
+        description: str = "",
+        category_id: int = 28,
+    ) -> None:
+        with self._lock:
+            self.videos[video_id] = FakeVideo(
+                title=title or f"Title for {video_id}",
+                description=description,
+                category_id=category_id,
+            )
+
+    def add_playlist(self, playlist_id: str, video_ids: tuple[str, ...] = ()) -> None:
+        with self._lock:
+            self.playlists[playlist_id] = [
+                FakePlaylistEntry(
+                    playlist_item_id=self._new_item_id(),
+                    video_id=video_id,
+                )
+                for video_id in video_ids
+            ]
+
+    def playlist_video_ids(self, playlist_id: str) -> list[str]:
+        """プレイリスト内の video_id を position 順で取得"""
+        with self._lock:
+            return [entry.video_id for entry in self.playlists[playlist_id]]
+
+    # APIメソッド
+
+    def videos_list(
+        self,
+        video_ids: list[str],
+        if_none_match: str | None = None,
+    ) -> dict[str, Any] | None:
+        """videos.list (part=snippet)
+
+        if_none_match がレスポンスのETagと一致する場合は None (304) を返す。
+        """
+        self._simulate_latency()
+
+        with self._lock:
+            self._record(method="videos.list")
+            items = [
+                self._video_resource(video_id=video_id)
+                for video_id in video_ids
+                if video_id in self.videos
+            ]
+            return self._list_response(
+                kind="youtube#videoListResponse",
+                items=items,
+                extra={"pageInfo": {"totalResults": len(items)}},
+                if_none_match=if_none_match,
+            )
+
+    def videos_update(self, body: dict[str, Any]) -> dict[str, Any]:
+        """videos.update (part=snippet)"""
+        self._simulate_latency()
+
+        with self._lock:
+            self._record(method="videos.update")
+            video_id = body["id"]
+            snippet = body["snippet"]
+
+            if video_id not in self.videos:
+                raise FakeYouTubeError(
+                    status=404,
+                    reason="videoNotFound",
+                    message=f"Video not found: {video_id}",
+                )
+
+            if not snippet.get("title") or not snippet.get("categoryId"):
+                raise FakeYouTubeError(
+                    status=400,
+                    reason="invalidVideoMetadata",
+                    message="snippet.title and snippet.categoryId are required",
+                )
+
+            self.videos[video_id] = FakeVideo(
+                title=snippet["title"],
+                description=snippet.get("description", ""),
+                category_id=int(snippet["categoryId"]),
+            )
+            return self._video_resource(video_id=video_id)
+
+    def playlist_items_list(
+        self,
+        playlist_id: str,
+        max_results: int = 5,
+        page_token: str | None = None,
+        if_none_match: str | None = None,
+    ) -> dict[str, Any] | None:
+        """playlistItems.list (part=snippet,contentDetails)
+
+        if_none_match がレスポンスのETagと一致する場合は None (304) を返す。
+        """
+        self._simulate_latency()
+
+        with self._lock:
+            self._record(method="playlistItems.list")
+            entries = self._get_playlist(playlist_id=playlist_id)
+            page_size = min(max_results, self.page_size, MAX_PAGE_SIZE)
+            start = int(page_token) if page_token else 0
+            end = start + page_size
+
+            items = [
+                self._playlist_item_resource(
+                    playlist_id=playlist_id,
+                    entry=entry,
+                    position=position,
+                )
+                for position, entry in enumerate(
+                    iterable=entries[start:end],
+                    start=start,
+                )
+            ]
+            extra: dict[str, Any] = {
+                "pageInfo": {"totalResults": len(entries), "resultsPerPage": page_size},
+            }
+            if end < len(entries):
+                extra["nextPageToken"] = str(end)
+
+            return self._list_response(
+                kind="youtube#playlistItemListResponse",
+                items=items,
+                extra=extra,
+                if_none_match=if_none_match,
+            )
+
+    def playlist_items_insert(self, body: dict[str, Any]) -> dict[str, Any]:
+        """playlistItems.insert (part=snippet)
+
+        position 省略時は末尾に追加し、指定時はその位置以降のアイテムを後ろにずらす。
+        """
+        self._simulate_latency()
+
+        with self._lock:
+            self._record(method="playlistItems.insert")
+            snippet = body["snippet"]
+            playlist_id = snippet["playlistId"]
+            video_id = snippet["resourceId"]["videoId"]
+            entries = self._get_playlist(playlist_id=playlist_id)
+
+            if video_id not in self.videos:
+                raise FakeYouTubeError(
+                    status=404,
+                    reason="videoNotFound",
+                    message=f"Video not found: {video_id}",
+                )
+
+            position = snippet.get("position", len(entries))
+            self._validate_position(position=position, upper=len(entries))
+
+            entry = FakePlaylistEntry(
+                playlist_item_id=self._new_item_id(),
+                video_id=video_id,
+            )
+            entries.insert(position, entry)
+
+            return self._playlist_item_resource(
+                playlist_id=playlist_id,
+                entry=entry,
+                position=position,
+            )
+
+    def playlist_items_update(self, body: dict[str, Any]) -> dict[str, Any]:
+        """playlistItems.update (part=snippet)
+
+        アイテムを取り除いてから指定位置に挿入する (間のアイテムは1つずつずれる)。
+        """
+        self._simulate_latency()
+
+        with self._lock:
+            self._record(method="playlistItems.update")
+            playlist_item_id = body["id"]
+            snippet = body["snippet"]
+            entries = self._get_playlist(playlist_id=snippet["playlistId"])
+
+            current = next(
+                (
+                    index
+                    for index, entry in enumerate(entries)
+                    if entry.playlist_item_id == playlist_item_id
+                ),
+                None,
+            )
+            if current is None:
+                raise FakeYouTubeError(
+                    status=404,
+                    reason="playlistItemNotFound",
+                    message=f"Playlist item not found: {playlist_item_id}",
+                )
+
+            position = snippet.get("position", current)
+            self._validate_position(position=position, upper=len(entries) - 1)
+
+            entry = entries.pop(current)
+            entries.insert(position, entry)
+
+            return self._playlist_item_resource(
+                playlist_id=snippet["playlistId"],
+                entry=entry,
+                position=position,
+            )
+
+    # 内部ヘルパー
+
+    def _simulate_latency(self) -> None:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def _record(self, method: str) -> None:
+        if (
+            self.quota_limit is not None
+            and self.quota_used + QUOTA_COSTS[method] > self.quota_limit
+        ):
+            raise FakeYouTubeError(
+                status=403,
+                reason="quotaExceeded",
+                message="The request cannot be completed because you have exceeded "
+                "your quota.",
+            )
+
+        self.calls[method] += 1
+
+    def _new_item_id(self) -> str:
+        self._next_item_number += 1
+        return f"PLI{self._next_item_number:08d}"
+
+    def _get_playlist(self, playlist_id: str) -> list[FakePlaylistEntry]:
+        entries = self.playlists.get(playlist_id)
+        if entries is None:
+            raise FakeYouTubeError(
+                status=404,
+                reason="playlistNotFound",
+                message=f"Playlist not found: {playlist_id}",
+            )
+        return entries
+
+    @staticmethod
+    def _validate_position(position: int, upper: int) -> None:
+        if not 0 <= position <= upper:
+            raise FakeYouTubeError(
+                status=400,
+                reason="invalidPlaylistItemPosition",
+                message=f"Invalid playlist item position: {position}",
+            )
+
+    def _video_resource(self, video_id: str) -> dict[str, Any]:
+        video = self.videos[video_id]
+        snippet = {
+            "title": video.title,
+            "description": video.description,
+            "categoryId": str(video.category_id),
+        }
+        return {
+            "kind": "youtube#video",
+            "etag": compute_etag(payload=[video_id, snippet]),
+            "id": video_id,
+            "snippet": snippet,
+        }
+
+    @staticmethod
+    def _playlist_item_resource(
+        playlist_id: str,
+        entry: FakePlaylistEntry,
+        position: int,
+    ) -> dict[str, Any]:
+        snippet = {
+            "playlistId": playlist_id,
+            "position": position,
+            "resourceId": {"kind": "youtube#video", "videoId": entry.video_id},
+        }
+        return {
+            "kind": "youtube#playlistItem",
+            "etag": compute_etag(payload=[entry.playlist_item_id, snippet]),
+            "id": entry.playlist_item_id,
+            "snippet": snippet,
+            "contentDetails": {"videoId": entry.video_id},
+        }
+
+    def _list_response(
+        self,
+        kind: str,
+        items: list[dict[str, Any]],
+        extra: dict[str, Any],
+        if_none_match: str | None,
+    ) -> dict[str, Any] | None:
+        payload: dict[str, Any] = {"kind": kind, "items": items, **extra}
+        etag = compute_etag(payload=payload)
+
+        if if_none_match == etag:
+            self.not_modified_count += 1
+            return None
+
+        return {"etag": etag, **payload}
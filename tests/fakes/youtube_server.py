@@ -0,0 +1,167 @@
+"""FakeYouTubeBackend を HTTP で公開するローカルサーバー
+
+YouTubeApiGateway.from_api_endpoint() に api_endpoint を渡すことで、
+googleapiclient を含む実際の通信経路をオフラインで動かせる。
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+from tests.fakes.youtube_backend import FakeYouTubeError
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from tests.fakes.youtube_backend import FakeYouTubeBackend
+
+_API_PREFIX = "/youtube/v3/"
+
+
+class _FakeYouTubeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, backend: FakeYouTubeBackend) -> None:
+        super().__init__(
+            server_address=("127.0.0.1", 0),
+            RequestHandlerClass=_FakeYouTubeRequestHandler,
+        )
+        self.backend = backend
+
+
+class _FakeYouTubeRequestHandler(BaseHTTPRequestHandler):
+    server: _FakeYouTubeHTTPServer
+    # googleapiclient (httplib2) は keep-alive で接続を再利用する
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._dispatch(method="GET")
+
+    def do_POST(self) -> None:
+        self._dispatch(method="POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch(method="PUT")
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """アクセスログを出力しない"""
+
+    def _dispatch(self, method: str) -> None:
+        if_none_match = self.headers.get("If-None-Match")
+
+        try:
+            response = self._call_backend(method=method, if_none_match=if_none_match)
+        except FakeYouTubeError as e:
+            self._send_json(
+                status=e.status,
+                payload={
+                    "error": {
+                        "code": e.status,
+                        "message": e.message,
+                        "errors": [{"reason": e.reason, "message": e.message}],
+                    },
+                },
+            )
+            return
+
+        if response is None:
+            self.send_response(code=HTTPStatus.NOT_MODIFIED)
+            self.send_header(keyword="ETag", value=if_none_match or "")
+            self.send_header(keyword="Content-Length", value="0")
+            self.end_headers()
+            return
+
+        self._send_json(status=HTTPStatus.OK, payload=response)
+
+    def _call_backend(
+        self,
+        method: str,
+        if_none_match: str | None,
+    ) -> dict[str, Any] | None:
+        url = urlsplit(url=self.path)
+        resource = url.path.removeprefix(_API_PREFIX)
+        query = {key: values[0] for key, values in parse_qs(qs=url.query).items()}
+        backend = self.server.backend
+
+        match (method, resource):
+            case ("GET", "videos"):
+                return backend.videos_list(
+                    video_ids=query.get("id", "").split(","),
+                    if_none_match=if_none_match,
+                )
+            case ("PUT", "videos"):
+                return backend.videos_update(body=self._read_body())
+            case ("GET", "playlistItems"):
+                return backend.playlist_items_list(
+                    playlist_id=query["playlistId"],
+                    max_results=int(query.get("maxResults", "5")),
+                    page_token=query.get("pageToken"),
+                    if_none_match=if_none_match,
+                )
+            case ("POST", "playlistItems"):
+                return backend.playlist_items_insert(body=self._read_body())
+            case ("PUT", "playlistItems"):
+                return backend.playlist_items_update(body=self._read_body())
+            case _:
+                raise FakeYouTubeError(
+                    status=HTTPStatus.NOT_FOUND,
+                    reason="notFound",
+                    message=f"Unsupported endpoint: {method} {url.path}",
+                )
+
+    def _read_body(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length", "0"))
+        body: dict[str, Any] = json.loads(s=self.rfile.read(length) or b"{}")
+        return body
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(obj=payload).encode()
+        self.send_response(code=status)
+        self.send_header(keyword="Content-Type", value="application/json")
+        self.send_header(keyword="Content-Length", value=str(len(data)))
+        if "etag" in payload:
+            self.send_header(keyword="ETag", value=payload["etag"])
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeYouTubeServer:
+    """FakeYouTubeBackend をバックグラウンドスレッドで提供するHTTPサーバー
+
+    with 文で起動・停止する。
+    """
+
+    def __init__(self, backend: FakeYouTubeBackend) -> None:
+        self.backend = backend
+        self._server = _FakeYouTubeHTTPServer(backend=backend)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="fake-youtube-server",
+            daemon=True,
+        )
+
+    @property
+    def api_endpoint(self) -> str:
+        """YouTubeApiGateway.from_api_endpoint() に渡すエンドポイント"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def __enter__(self) -> Self:  # noqa: D105
+        self._thread.start()
+        return self
+
+    def __exit__(  # noqa: D105
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -400,3 +400,55 @@ sessions:
         assert video_mapping is not None
         assert video_mapping.update_title is True
         assert video_mapping.update_description is True
+
+    def test_read_with_day_and_track_playlists(
+        self,
+        tmp_path: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """日付・トラックごとのプレイリストを読み込める"""
+        yaml_content = """
+conf_id: test-conf
+playlist_id: "PLtest123"
+playlists:
+  by_day:
+    2026-01-07: "PLday1"
+  by_track:
+    "Track 1": "PLtrack1"
+sessions:
+  2026-01-07:
+    Hall A:
+      "10:00":
+        video_id: "abc123"
+"""
+        yaml_file = write_yaml_file(
+            tmp_path=tmp_path,
+            content=yaml_content,
+            filename="with_playlists.yaml",
+        )
+
+        reader = MappingFileReader()
+        mapping = reader.read(file_path=yaml_file)
+        config = mapping.to_domain(timezone=jst)
+
+        assert config.playlist_ids == ("PLtest123", "PLday1", "PLtrack1")
+        assert config.day_playlist_ids == {
+            datetime(year=2026, month=1, day=7, tzinfo=jst).date(): "PLday1",
+        }
+        assert config.track_playlist_ids == {"Track 1": "PLtrack1"}
+
+    def test_read_without_playlists_defaults_to_main_playlist_only(
+        self,
+        tmp_path: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """playlistsがなければ playlist_id だけが同期対象になる"""
+        yaml_file = write_yaml_file(
+            tmp_path=tmp_path,
+            content=self._YAML_CONTENT,
+            filename="without_playlists.yaml",
+        )
+
+        config = MappingFileReader().read(file_path=yaml_file).to_domain(timezone=jst)
+
+        assert config.playlist_ids == ("PLtest123",)
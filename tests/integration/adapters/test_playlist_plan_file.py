@@ -0,0 +1,92 @@
+"""PlaylistPlanFile のテスト"""
+
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.adapters.playlist_plan_file import PlaylistPlanFile
+from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.usecases.dto import (
+    PlaylistOperationType,
+    PlaylistSyncPlan,
+    PlaylistVideoOperation,
+)
+from confengine_to_youtube.usecases.errors import PlaylistPlanFileError
+
+
+class TestPlaylistPlanFile:
+    """PlaylistPlanFile のテスト"""
+
+    @pytest.fixture
+    def plan(self, jst: ZoneInfo) -> PlaylistSyncPlan:
+        return PlaylistSyncPlan(
+            playlist_id="PL1",
+            playlist_etag="etag-1",
+            operations=(
+                PlaylistVideoOperation(
+                    video_id="video1",
+                    title="Session 1",
+                    operation=PlaylistOperationType.UNCHANGED,
+                    position=0,
+                    slot=ScheduleSlot(
+                        timeslot=datetime(
+                            year=2026,
+                            month=1,
+                            day=7,
+                            hour=10,
+                            tzinfo=jst,
+                        ),
+                        room="Hall A",
+                    ),
+                ),
+                PlaylistVideoOperation(
+                    video_id="unmapped",
+                    title="(unmapped: unmapped)",
+                    operation=PlaylistOperationType.MOVE_TO_END,
+                    position=1,
+                    after_video_id="video1",
+                ),
+            ),
+        )
+
+    def test_write_and_read(self, tmp_path: Path, plan: PlaylistSyncPlan) -> None:
+        """保存した計画を読み込むと元の計画と一致する"""
+        plan_file = PlaylistPlanFile()
+        file_path = tmp_path / "plan.json"
+        day_plan = PlaylistSyncPlan(
+            playlist_id="PL-day1",
+            playlist_etag="etag-2",
+            operations=plan.operations[:1],
+        )
+
+        plan_file.write(plans=(plan, day_plan), file_path=file_path)
+
+        assert plan_file.read(file_path=file_path) == (plan, day_plan)
+
+    def test_read_missing_file(self, tmp_path: Path) -> None:
+        """存在しないファイルは PlaylistPlanFileError"""
+        with pytest.raises(
+            expected_exception=PlaylistPlanFileError,
+            match=r"^Plan file not found: ",
+        ):
+            PlaylistPlanFile().read(file_path=tmp_path / "missing.json")
+
+    def test_read_invalid_operation(self, tmp_path: Path) -> None:
+        """不明な操作を含むファイルは PlaylistPlanFileError"""
+        file_path = tmp_path / "plan.json"
+        file_path.write_text(
+            data=(
+                '{"plans": [{"playlist_id": "PL1", "playlist_etag": "e", '
+                '"operations": [{"video_id": "v", "title": "t", '
+                '"operation": "DELETE", "position": 0}]}]}'
+            ),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(
+            expected_exception=PlaylistPlanFileError,
+            match=r"^Invalid plan file format in ",
+        ):
+            PlaylistPlanFile().read(file_path=file_path)
@@ -0,0 +1,107 @@
+"""JsonlPlaylistSyncJournal のテスト"""
+
+from pathlib import Path
+
+import pytest
+
+from confengine_to_youtube.adapters.playlist_sync_journal import (
+    JsonlPlaylistSyncJournal,
+)
+from confengine_to_youtube.usecases.dto import (
+    PlaylistOperationType,
+    PlaylistSyncPlan,
+    PlaylistVideoOperation,
+)
+
+
+class TestJsonlPlaylistSyncJournal:
+    """JsonlPlaylistSyncJournal のテスト"""
+
+    @pytest.fixture
+    def journal(self, tmp_path: Path) -> JsonlPlaylistSyncJournal:
+        return JsonlPlaylistSyncJournal(directory=tmp_path / "journal")
+
+    @pytest.fixture
+    def plan(self) -> PlaylistSyncPlan:
+        return PlaylistSyncPlan(
+            playlist_id="PL1",
+            playlist_etag="etag-1",
+            operations=tuple(
+                PlaylistVideoOperation(
+                    video_id=f"video{i}",
+                    title=f"Session {i}",
+                    operation=PlaylistOperationType.ADD,
+                    position=i,
+                    after_video_id=f"video{i - 1}" if i > 0 else None,
+                )
+                for i in range(3)
+            ),
+        )
+
+    def test_load_returns_none_without_journal(
+        self,
+        journal: JsonlPlaylistSyncJournal,
+    ) -> None:
+        """ジャーナルがなければ None"""
+        assert journal.load(playlist_id="PL1") is None
+
+    def test_load_returns_plan_and_completed_operations(
+        self,
+        journal: JsonlPlaylistSyncJournal,
+        plan: PlaylistSyncPlan,
+    ) -> None:
+        """未完了の計画と、完了を記録した操作を復元する"""
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id="PL1", index=0)
+        journal.record_completed(playlist_id="PL1", index=1)
+
+        progress = journal.load(playlist_id="PL1")
+
+        assert progress is not None
+        assert progress.plan == plan
+        assert progress.completed == {0, 1}
+
+    def test_finished_plan_is_not_resumed(
+        self,
+        journal: JsonlPlaylistSyncJournal,
+        plan: PlaylistSyncPlan,
+    ) -> None:
+        """全体の完了を記録した計画は再開対象にならない"""
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id="PL1", index=0)
+        journal.finish(playlist_id="PL1")
+
+        assert journal.load(playlist_id="PL1") is None
+
+    def test_start_discards_previous_progress(
+        self,
+        journal: JsonlPlaylistSyncJournal,
+        plan: PlaylistSyncPlan,
+    ) -> None:
+        """新しい計画の開始で以前の進捗は破棄される"""
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id="PL1", index=0)
+        journal.start(plan=plan)
+
+        progress = journal.load(playlist_id="PL1")
+
+        assert progress is not None
+        assert progress.completed == frozenset()
+
+    def test_broken_last_line_is_ignored(
+        self,
+        journal: JsonlPlaylistSyncJournal,
+        plan: PlaylistSyncPlan,
+        tmp_path: Path,
+    ) -> None:
+        """書き込み途中で中断した最終行は読み飛ばす"""
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id="PL1", index=0)
+        file_path = tmp_path / "journal" / "playlist_sync_PL1.jsonl"
+        with file_path.open(mode="a", encoding="utf-8") as f:
+            f.write('{"type": "compl')
+
+        progress = journal.load(playlist_id="PL1")
+
+        assert progress is not None
+        assert progress.completed == {0}
@@ -0,0 +1,107 @@
+"""SqliteVideoStateStore のテスト"""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from confengine_to_youtube.adapters.video_state_store import SqliteVideoStateStore
+from confengine_to_youtube.usecases.dto import VideoSyncState
+
+
+class TestSqliteVideoStateStore:
+    """SqliteVideoStateStore のテスト"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path: Path) -> Path:
+        return tmp_path / "workspace" / "state.sqlite3"
+
+    @pytest.fixture
+    def state(self) -> VideoSyncState:
+        return VideoSyncState(
+            video_id="video1",
+            content_hash="hash1",
+            category_id=28,
+            etag="etag1",
+            synced_at=datetime(year=2026, month=1, day=7, hour=10, tzinfo=UTC),
+        )
+
+    def test_get_returns_none_for_unknown_video(self, db_path: Path) -> None:
+        """未登録の動画はNone"""
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            assert store.get(video_id="unknown") is None
+
+    def test_save_and_get(self, db_path: Path, state: VideoSyncState) -> None:
+        """保存した状態を取得できる"""
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            store.save(state=state)
+
+            assert store.get(video_id="video1") == state
+
+    def test_save_replaces_existing_state(
+        self,
+        db_path: Path,
+        state: VideoSyncState,
+    ) -> None:
+        """同じ動画の状態は上書きされる"""
+        updated = VideoSyncState(
+            video_id="video1",
+            content_hash="hash2",
+            category_id=22,
+            etag=None,
+            synced_at=datetime(year=2026, month=1, day=8, tzinfo=UTC),
+        )
+
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            store.save(state=state)
+            store.save(state=updated)
+
+            assert store.get(video_id="video1") == updated
+
+    def test_state_persists_across_connections(
+        self,
+        db_path: Path,
+        state: VideoSyncState,
+    ) -> None:
+        """別の接続 (次回実行) からも参照できる"""
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            store.save(state=state)
+
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            assert store.get(video_id="video1") == state
+
+    def test_saved_states_are_written_in_batches(
+        self,
+        db_path: Path,
+        state: VideoSyncState,
+    ) -> None:
+        """保存した状態は flush_row_count 件ごとにまとめて書き込まれる"""
+        second = replace(state, video_id="video2")
+
+        with (
+            SqliteVideoStateStore(db_path=db_path, flush_row_count=2) as store,
+            SqliteVideoStateStore(db_path=db_path) as reader,
+        ):
+            store.save(state=state)
+
+            assert reader.get(video_id="video1") is None
+
+            store.save(state=second)
+
+            assert reader.get(video_id="video1") == state
+            assert reader.get(video_id="video2") == second
+
+    def test_pending_state_is_visible_and_flushed_on_close(
+        self,
+        db_path: Path,
+        state: VideoSyncState,
+    ) -> None:
+        """書き込む前の状態も参照でき、close() で書き込まれる"""
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            store.save(state=state)
+
+            assert store.get(video_id="video1") == state
+
+        with SqliteVideoStateStore(db_path=db_path) as store:
+            assert store.get(video_id="video1") == state
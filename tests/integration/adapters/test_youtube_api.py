@@ -3,10 +3,12 @@
 from unittest.mock import MagicMock
 
 import pytest
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
 
 from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
 from confengine_to_youtube.usecases.dto import VideoUpdateRequest
-from confengine_to_youtube.usecases.errors import VideoNotFoundError
 
 
 class TestYouTubeApiGateway:
@@ -22,7 +24,7 @@ class TestYouTubeApiGateway:
         """テスト用のgateway"""
         return YouTubeApiGateway(youtube=mock_youtube)
 
-    def test_get_video_info_success(
+    def test_get_videos_info_success(
         self,
         gateway: YouTubeApiGateway,
         mock_youtube: MagicMock,
@@ -41,7 +43,7 @@ class TestYouTubeApiGateway:
             ],
         }
 
-        result = gateway.get_video_info(video_id="abc123")
+        result = gateway.get_videos_info(video_ids=["abc123"])["abc123"]
 
         assert result.video_id == "abc123"
         assert result.title == "Test Video"
@@ -53,21 +55,17 @@ class TestYouTubeApiGateway:
         )
         mock_youtube.videos.return_value.list.return_value.execute.assert_called_once()
 
-    def test_get_video_info_not_found(
+    def test_get_videos_info_not_found(
         self,
         gateway: YouTubeApiGateway,
         mock_youtube: MagicMock,
     ) -> None:
-        """動画が見つからない場合は例外"""
+        """動画が見つからない場合は空の結果"""
         mock_youtube.videos.return_value.list.return_value.execute.return_value = {
             "items": [],
         }
 
-        with pytest.raises(
-            expected_exception=VideoNotFoundError,
-            match=r"^Video not found: nonexistent$",
-        ):
-            gateway.get_video_info(video_id="nonexistent")
+        assert gateway.get_videos_info(video_ids=["nonexistent"]) == {}
 
     def test_update_video(
         self,
@@ -82,8 +80,14 @@ class TestYouTubeApiGateway:
             category_id=28,
         )
 
-        gateway.update_video(request=request)
+        mock_youtube.videos.return_value.update.return_value.execute.return_value = {
+            "id": "abc123",
+            "etag": "new-etag",
+        }
+
+        etag = gateway.update_video(request=request)
 
+        assert etag == "new-etag"
         mock_youtube.videos.return_value.update.assert_called_once_with(
             part="snippet",
             body={
@@ -96,3 +100,33 @@ class TestYouTubeApiGateway:
             },
         )
         mock_youtube.videos.return_value.update.return_value.execute.assert_called_once()
+
+
+class TestYouTubeApiGatewayTransport:
+    """スレッドごとのトランスポートの設定"""
+
+    def test_endpoint_transport_has_timeout(self) -> None:
+        """エンドポイント指定時のトランスポートはタイムアウトを持ち、308を辿らない"""
+        gateway = YouTubeApiGateway.from_api_endpoint(
+            api_endpoint="http://127.0.0.1:1",
+        )
+
+        http = gateway._thread_http()
+
+        assert http is not None
+        assert http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in http.redirect_codes
+
+    def test_authorized_transport_has_timeout(self) -> None:
+        """認証付きのトランスポートも、内側の接続にタイムアウトを持つ"""
+        auth_provider = MagicMock()
+        auth_provider.get_credentials.return_value = Credentials(  # type: ignore[no-untyped-call]
+            token="access-token",  # noqa: S106
+        )
+        gateway = YouTubeApiGateway.from_auth_provider(auth_provider=auth_provider)
+
+        http = gateway._thread_http()
+
+        assert isinstance(http, AuthorizedHttp)
+        assert http.http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in http.http.redirect_codes
@@ -0,0 +1,323 @@
+"""フェイクYouTubeサーバーに対する YouTubeApiGateway のテスト
+
+googleapiclient を含む実際のHTTP通信経路で、呼び出し回数とセマンティクスを検証する。
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
+from confengine_to_youtube.adapters.youtube_etag_cache import YouTubeEtagCache
+from confengine_to_youtube.usecases.dto import VideoUpdateRequest
+from confengine_to_youtube.usecases.errors import VideoFetchError, VideoUpdateError
+from tests.fakes.youtube_backend import FakeYouTubeBackend
+from tests.fakes.youtube_server import FakeYouTubeServer
+
+
+class TestYouTubeApiGatewayWithFakeServer:
+    """フェイクサーバー経由の YouTubeApiGateway のテスト"""
+
+    @pytest.fixture
+    def backend(self) -> FakeYouTubeBackend:
+        backend = FakeYouTubeBackend(page_size=2)
+        for video_id in ("v1", "v2", "v3", "v4", "v5"):
+            backend.add_video(video_id=video_id, description=f"desc {video_id}")
+        backend.add_playlist(playlist_id="PL1", video_ids=("v1", "v2", "v3"))
+        return backend
+
+    @pytest.fixture
+    def gateway(self, backend: FakeYouTubeBackend) -> Iterator[YouTubeApiGateway]:
+        with FakeYouTubeServer(backend=backend) as server:
+            yield YouTubeApiGateway.from_api_endpoint(api_endpoint=server.api_endpoint)
+
+    def test_get_video_info(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """動画情報を1回のvideos.listで取得できる"""
+        result = gateway.get_videos_info(video_ids=["v1"])["v1"]
+
+        assert result.video_id == "v1"
+        assert result.title == "Title for v1"
+        assert result.description == "desc v1"
+        assert result.category_id == 28
+        assert backend.calls == {"videos.list": 1}
+        assert backend.quota_used == 1
+
+    def test_get_videos_info_in_one_request(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """複数の動画情報を1回のvideos.listでまとめて取得できる"""
+        result = gateway.get_videos_info(video_ids=["v3", "v1", "v2"])
+
+        assert {video_id: info.title for video_id, info in result.items()} == {
+            "v1": "Title for v1",
+            "v2": "Title for v2",
+            "v3": "Title for v3",
+        }
+        assert backend.calls == {"videos.list": 1}
+        assert backend.quota_used == 1
+
+    def test_get_videos_info_omits_missing_videos(
+        self,
+        gateway: YouTubeApiGateway,
+    ) -> None:
+        """存在しない動画は結果に含めず、見つかった動画だけを返す"""
+        result = gateway.get_videos_info(video_ids=["v1", "missing"])
+
+        assert list(result) == ["v1"]
+
+    def test_get_videos_info_rejected(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """拒否された取得は VideoFetchError になる"""
+        backend.quota_limit = 0
+
+        with pytest.raises(VideoFetchError, match="HTTP 403"):
+            gateway.get_videos_info(video_ids=["v1", "v2"])
+
+    def test_update_video(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """動画の更新がサーバー側に反映され、50ユニット消費する"""
+        gateway.update_video(
+            request=VideoUpdateRequest(
+                video_id="v1",
+                title="New Title",
+                description="New Description",
+                category_id=22,
+            ),
+        )
+
+        assert backend.videos["v1"].title == "New Title"
+        assert backend.videos["v1"].description == "New Description"
+        assert backend.videos["v1"].category_id == 22
+        assert backend.quota_used == 50
+
+    def test_update_video_rejected(self, gateway: YouTubeApiGateway) -> None:
+        """拒否された更新は VideoUpdateError になる"""
+        with pytest.raises(VideoUpdateError, match="v404: HTTP 404"):
+            gateway.update_video(
+                request=VideoUpdateRequest(
+                    video_id="v404",
+                    title="New Title",
+                    description="New Description",
+                    category_id=22,
+                ),
+            )
+
+    def test_fetch_playlist_follows_pagination(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """全ページを辿ってプレイリスト順にアイテムを取得する"""
+        backend.add_playlist(
+            playlist_id="PL2", video_ids=("v5", "v4", "v3", "v2", "v1")
+        )
+
+        result = gateway.fetch_playlist(playlist_id="PL2")
+
+        assert [(item.video_id, item.position) for item in result.items] == [
+            ("v5", 0),
+            ("v4", 1),
+            ("v3", 2),
+            ("v2", 3),
+            ("v1", 4),
+        ]
+        # page_size=2 なので5件は3ページ
+        assert backend.calls == {"playlistItems.list": 3}
+
+    def test_fetch_playlist_etag_changes_with_playlist(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """プレイリストのETagは変更がなければ同じで、変更されると変わる"""
+        first = gateway.fetch_playlist(playlist_id="PL1")
+        second = gateway.fetch_playlist(playlist_id="PL1")
+        gateway.add_to_playlist(playlist_id="PL1", video_id="v4", position=0)
+        third = gateway.fetch_playlist(playlist_id="PL1")
+
+        assert [item.video_id for item in first.items] == ["v1", "v2", "v3"]
+        assert second.etag == first.etag
+        assert third.etag != first.etag
+        assert backend.calls["playlistItems.list"] == 6
+
+    def test_add_to_playlist_shifts_following_items(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """position指定の挿入で後続アイテムが後ろにずれる"""
+        added = gateway.add_to_playlist(playlist_id="PL1", video_id="v4", position=1)
+
+        assert added.video_id == "v4"
+        assert added.position == 1
+
+        assert backend.playlist_video_ids(playlist_id="PL1") == [
+            "v1",
+            "v4",
+            "v2",
+            "v3",
+        ]
+
+    def test_update_playlist_item_position_shifts_items_between(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """位置更新で間にあるアイテムが1つずつずれる"""
+        items = gateway.fetch_playlist(playlist_id="PL1").items
+
+        gateway.update_playlist_item_position(
+            playlist_item_id=items[2].playlist_item_id,
+            playlist_id="PL1",
+            video_id="v3",
+            position=0,
+        )
+
+        assert backend.playlist_video_ids(playlist_id="PL1") == ["v3", "v1", "v2"]
+
+    def test_invalid_position_is_rejected(self, gateway: YouTubeApiGateway) -> None:
+        """プレイリストの長さを超える position は400エラー"""
+        with pytest.raises(HttpError) as exc_info:
+            gateway.add_to_playlist(playlist_id="PL1", video_id="v4", position=10)
+
+        assert exc_info.value.resp.status == 400
+
+
+class TestYouTubeApiGatewayEtagWithFakeServer:
+    """ETagによる条件付きリクエストのテスト"""
+
+    @pytest.fixture
+    def backend(self) -> FakeYouTubeBackend:
+        backend = FakeYouTubeBackend(page_size=2)
+        for video_id in ("v1", "v2", "v3"):
+            backend.add_video(video_id=video_id)
+        backend.add_playlist(playlist_id="PL1", video_ids=("v1", "v2", "v3"))
+        return backend
+
+    @pytest.fixture
+    def server(self, backend: FakeYouTubeBackend) -> Iterator[FakeYouTubeServer]:
+        with FakeYouTubeServer(backend=backend) as server:
+            yield server
+
+    @pytest.fixture
+    def etag_cache(self, tmp_path: Path) -> YouTubeEtagCache:
+        return YouTubeEtagCache(file_path=tmp_path / "etags.json")
+
+    @pytest.fixture
+    def gateway(
+        self,
+        server: FakeYouTubeServer,
+        etag_cache: YouTubeEtagCache,
+    ) -> YouTubeApiGateway:
+        return YouTubeApiGateway.from_api_endpoint(
+            api_endpoint=server.api_endpoint,
+            etag_cache=etag_cache,
+        )
+
+    def test_unchanged_video_is_served_from_cache(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """2回目の取得は304となり、キャッシュ済みの内容を返す"""
+        first = gateway.get_videos_info(video_ids=["v1"])
+        second = gateway.get_videos_info(video_ids=["v1"])
+
+        assert second == first
+        assert first["v1"].etag is not None
+        assert backend.not_modified_count == 1
+
+    def test_same_videos_in_another_order_are_served_from_cache(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """同じ動画の組なら、渡す順序が変わってもキャッシュを使う"""
+        first = gateway.get_videos_info(video_ids=["v2", "v1"])
+        second = gateway.get_videos_info(video_ids=["v1", "v2", "v1"])
+
+        assert second == first
+        assert backend.not_modified_count == 1
+
+    def test_updated_video_is_fetched_again(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """更新後は新しい内容を取得する"""
+        (before,) = gateway.get_videos_info(video_ids=["v1"]).values()
+        gateway.update_video(
+            request=VideoUpdateRequest(
+                video_id="v1",
+                title="Changed",
+                description="",
+                category_id=before.category_id,
+            ),
+        )
+
+        (after,) = gateway.get_videos_info(video_ids=["v1"]).values()
+
+        assert after.title == "Changed"
+        assert after.etag != before.etag
+        assert backend.not_modified_count == 0
+
+    def test_unchanged_playlist_pages_are_served_from_cache(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """変更のないプレイリストは全ページ304で再取得できる"""
+        first = gateway.fetch_playlist(playlist_id="PL1")
+        second = gateway.fetch_playlist(playlist_id="PL1")
+
+        assert second == first
+        assert backend.not_modified_count == 2
+
+    def test_changed_playlist_is_fetched_again(
+        self,
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """プレイリストが変わればETagが一致せず新しい内容を取得する"""
+        gateway.fetch_playlist(playlist_id="PL1")
+        backend.add_video(video_id="v4")
+        gateway.add_to_playlist(playlist_id="PL1", video_id="v4", position=0)
+
+        result = gateway.fetch_playlist(playlist_id="PL1")
+
+        assert [item.video_id for item in result.items] == ["v4", "v1", "v2", "v3"]
+
+    def test_persisted_cache_is_reused_by_new_gateway(
+        self,
+        gateway: YouTubeApiGateway,
+        server: FakeYouTubeServer,
+        etag_cache: YouTubeEtagCache,
+        backend: FakeYouTubeBackend,
+        tmp_path: Path,
+    ) -> None:
+        """保存したETagは次回実行 (新しいgateway) でも使われる"""
+        gateway.get_videos_info(video_ids=["v2"])
+        etag_cache.save()
+
+        new_gateway = YouTubeApiGateway.from_api_endpoint(
+            api_endpoint=server.api_endpoint,
+            etag_cache=YouTubeEtagCache(file_path=tmp_path / "etags.json"),
+        )
+        result = new_gateway.get_videos_info(video_ids=["v2"])
+
+        assert list(result) == ["v2"]
+        assert backend.not_modified_count == 1
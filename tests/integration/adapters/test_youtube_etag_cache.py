@@ -0,0 +1,115 @@
+"""YouTubeEtagCache のテスト"""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from confengine_to_youtube.adapters.youtube_etag_cache import YouTubeEtagCache
+
+
+class TestYouTubeEtagCache:
+    """YouTubeEtagCache のテスト"""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path: Path) -> Path:
+        return tmp_path / "state" / "etags.json"
+
+    def test_get_returns_none_when_file_not_exists(self, cache_path: Path) -> None:
+        """ファイルがなければ空のキャッシュとして扱う"""
+        cache = YouTubeEtagCache(file_path=cache_path)
+
+        assert cache.get(key="videos.list:v1") is None
+
+    def test_save_and_reload(self, cache_path: Path) -> None:
+        """保存したETagとレスポンスを再読み込みできる"""
+        cache = YouTubeEtagCache(file_path=cache_path)
+        cache.put(key="videos.list:v1", etag="etag-1", response={"items": [1]})
+        cache.save()
+
+        reloaded = YouTubeEtagCache(file_path=cache_path)
+        cached = reloaded.get(key="videos.list:v1")
+
+        assert cached is not None
+        assert cached.etag == "etag-1"
+        assert cached.response == {"items": [1]}
+
+    def test_save_skips_when_unchanged(self, cache_path: Path) -> None:
+        """変更がなければファイルを書き出さない"""
+        cache = YouTubeEtagCache(file_path=cache_path)
+
+        cache.save()
+
+        assert not cache_path.exists()
+
+    def test_save_drops_entries_not_used_in_the_run(self, cache_path: Path) -> None:
+        """前回の実行で保存し、今回の実行で使わなかったエントリは保存時に捨てる"""
+        previous = YouTubeEtagCache(file_path=cache_path)
+        previous.put(key="videos.list:v1,v2", etag="etag-1", response={})
+        previous.put(key="videos.list:v3", etag="etag-3", response={})
+        previous.put(key="playlistItems.list:PL1:", etag="etag-p", response={})
+        previous.save()
+
+        cache = YouTubeEtagCache(file_path=cache_path)
+        assert cache.get(key="videos.list:v3") is not None
+        cache.put(key="videos.list:v1", etag="etag-1", response={})
+        cache.save()
+
+        reloaded = YouTubeEtagCache(file_path=cache_path)
+        assert reloaded.get(key="videos.list:v1,v2") is None
+        assert reloaded.get(key="videos.list:v1") is not None
+        assert reloaded.get(key="videos.list:v3") is not None
+        # 今回問い合わせなかったプレイリストのページは残す
+        assert reloaded.get(key="playlistItems.list:PL1:") is not None
+
+    def test_save_drops_only_pages_of_queried_playlists(
+        self,
+        cache_path: Path,
+    ) -> None:
+        """問い合わせたプレイリストの使わなかったページだけを捨てる"""
+        previous = YouTubeEtagCache(file_path=cache_path)
+        previous.put(key="playlistItems.list:PL1:", etag="etag-1", response={})
+        previous.put(key="playlistItems.list:PL1:page2", etag="etag-2", response={})
+        previous.put(key="playlistItems.list:PL2:", etag="etag-3", response={})
+        previous.save()
+
+        cache = YouTubeEtagCache(file_path=cache_path)
+        cache.put(key="playlistItems.list:PL1:", etag="etag-4", response={})
+        cache.save()
+
+        reloaded = YouTubeEtagCache(file_path=cache_path)
+        assert reloaded.get(key="playlistItems.list:PL1:page2") is None
+        assert reloaded.get(key="playlistItems.list:PL2:") is not None
+
+    def test_save_keeps_entries_when_nothing_was_used(self, cache_path: Path) -> None:
+        """1件も使わなかった実行ではエントリを捨てない"""
+        previous = YouTubeEtagCache(file_path=cache_path)
+        previous.put(key="videos.list:v1", etag="etag-1", response={})
+        previous.save()
+
+        YouTubeEtagCache(file_path=cache_path).save()
+
+        assert YouTubeEtagCache(file_path=cache_path).get(key="videos.list:v1")
+
+    def test_in_memory_cache_without_file(self) -> None:
+        """file_path なしでもメモリ上で動作する"""
+        cache = YouTubeEtagCache()
+        cache.put(key="k", etag="e", response={})
+        cache.save()
+
+        assert cache.get(key="k") is not None
+
+    def test_corrupted_file_is_ignored(
+        self,
+        cache_path: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """壊れたキャッシュファイルは警告して無視する"""
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(data="{not json", encoding="utf-8")
+
+        with caplog.at_level(level=logging.WARNING):
+            cache = YouTubeEtagCache(file_path=cache_path)
+
+        assert cache.get(key="k") is None
+        assert "Ignoring corrupted ETag cache" in caplog.text
@@ -1,11 +1,21 @@
 """usecases テスト用の共通フィクスチャ"""
 
+from dataclasses import dataclass
+from pathlib import Path
 from unittest.mock import create_autospec
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
 from confengine_to_youtube.domain.session import Session
 from confengine_to_youtube.usecases.protocols import ConfEngineApiProtocol
+from tests.fakes.synthetic import (
+    synthetic_sessions,
+    synthetic_video_id,
+    write_synthetic_mapping_file,
+)
+from tests.fakes.youtube_backend import FakeYouTubeBackend
 
 
 def create_mock_confengine_api(
@@ -21,3 +31,80 @@ def create_mock_confengine_api(
         sessions=sessions,
     )
     return mock  # type: ignore[no-any-return]
+
+
+@dataclass(frozen=True)
+class SyntheticConference:
+    """合成セッションと、そのマッピングファイルと、全動画を登録したバックエンド"""
+
+    sessions: tuple[Session, ...]
+    mapping_file: Path
+    backend: FakeYouTubeBackend
+
+
+def create_synthetic_conference(  # noqa: PLR0913
+    tmp_path: Path,
+    timezone: ZoneInfo,
+    session_count: int = 20,
+    playlist_id: str = "PLsynthetic",
+    backend: FakeYouTubeBackend | None = None,
+    *,
+    with_playlist: bool = False,
+) -> SyntheticConference:
+    """合成カンファレンスを作成するヘルパー
+
+    全セッションを synthetic_video_id() にマッピングしたファイルを tmp_path に書き出し、
+    その動画を backend (省略時は新しいバックエンド) に登録する。
+    with_playlist を指定すると、空のプレイリストも登録する。
+    """
+    sessions = synthetic_sessions(count=session_count, timezone=timezone)
+    mapping_file = write_synthetic_mapping_file(
+        tmp_path=tmp_path,
+        sessions=sessions,
+        playlist_id=playlist_id,
+    )
+    if backend is None:
+        backend = FakeYouTubeBackend()
+    for index in range(session_count):
+        backend.add_video(video_id=synthetic_video_id(index=index))
+    if with_playlist:
+        backend.add_playlist(playlist_id=playlist_id)
+
+    return SyntheticConference(
+        sessions=sessions,
+        mapping_file=mapping_file,
+        backend=backend,
+    )
+
+
+@pytest.fixture
+def synthetic_conference(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    jst: ZoneInfo,
+) -> SyntheticConference:
+    """合成カンファレンス
+
+    件数などを変える場合は、create_synthetic_conference のキーワード引数の dict を
+    parametrize の indirect パラメータとして渡す。
+    """
+    return create_synthetic_conference(
+        tmp_path=tmp_path,
+        timezone=jst,
+        **getattr(request, "param", {}),
+    )
+
+
+@pytest.fixture
+def sessions(synthetic_conference: SyntheticConference) -> tuple[Session, ...]:
+    return synthetic_conference.sessions
+
+
+@pytest.fixture
+def mapping_file(synthetic_conference: SyntheticConference) -> Path:
+    return synthetic_conference.mapping_file
+
+
+@pytest.fixture
+def backend(synthetic_conference: SyntheticConference) -> FakeYouTubeBackend:
+    return synthetic_conference.backend
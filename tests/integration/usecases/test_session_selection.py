@@ -0,0 +1,146 @@
+"""対象セッションを絞り込んだ実行のテスト"""
+
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.domain.session_selector import SessionSelector
+from confengine_to_youtube.usecases.dto import PlaylistOperationType
+from confengine_to_youtube.usecases.sync_playlist import SyncPlaylistUseCase
+from confengine_to_youtube.usecases.update_youtube_descriptions import (
+    UpdateYouTubeDescriptionsUseCase,
+)
+from tests.fakes.synthetic import synthetic_mapping_yaml, synthetic_video_id
+from tests.fakes.youtube_api import InMemoryYouTubeApi
+from tests.fakes.youtube_backend import FakeYouTubeBackend
+from tests.integration.usecases.conftest import create_mock_confengine_api
+
+# 1日目の2コマ分 (4部屋)。トラックは番号順に Track 1, 2, 3 の繰り返し
+SESSION_COUNT = 8
+TRACK_PLAYLISTS = {"Track 1": "PLtrack1", "Track 2": "PLtrack2", "Track 3": "PLtrack3"}
+
+
+pytestmark = pytest.mark.parametrize(
+    "synthetic_conference",
+    [{"session_count": SESSION_COUNT}],
+    indirect=True,
+)
+
+
+@pytest.fixture
+def mapping_file(tmp_path: Path, sessions: tuple[Session, ...]) -> Path:
+    """全セッション用とトラックごとのプレイリストを持つマッピングファイル"""
+    lines = [
+        synthetic_mapping_yaml(sessions=sessions, playlist_id="PLall"),
+        "playlists:",
+        "  by_track:",
+        *(
+            f'    "{track}": {playlist_id}'
+            for track, playlist_id in TRACK_PLAYLISTS.items()
+        ),
+    ]
+    mapping_file = tmp_path / "mapping_by_track.yaml"
+    mapping_file.write_text(data="\n".join(lines) + "\n", encoding="utf-8")
+    return mapping_file
+
+
+class TestUpdateWithSelector:
+    """UpdateYouTubeDescriptionsUseCase の絞り込み"""
+
+    def test_updates_only_selected_sessions(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """条件に合うセッションの動画だけを取得・更新する"""
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=InMemoryYouTubeApi(backend=backend),
+        )
+
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            selector=SessionSelector(rooms=frozenset({"Hall B"})),
+        )
+
+        assert result.changed_count == 2
+        assert result.unused_mappings_count == 0
+        assert backend.calls["videos.update"] == 2
+        updated = {
+            video_id
+            for video_id, video in backend.videos.items()
+            if video.title != f"Title for {video_id}"
+        }
+        assert updated == {synthetic_video_id(index=1), synthetic_video_id(index=5)}
+        calls = {timing.name: timing.calls for timing in result.phases}
+        assert calls["select"] == 1
+
+
+class TestSyncPlaylistWithSelector:
+    """SyncPlaylistUseCase の絞り込み"""
+
+    @pytest.fixture
+    def usecase(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> SyncPlaylistUseCase:
+        return SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=InMemoryYouTubeApi(backend=backend),
+        )
+
+    def test_moves_only_selected_video(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        backend: FakeYouTubeBackend,
+    ) -> None:
+        """対象の動画だけを追加・移動し、対象外の動画は今の位置のまま残す"""
+        video = [synthetic_video_id(index=index) for index in range(SESSION_COUNT)]
+        # video[1] が末尾にずれ、対象外の video[3] と video[4] も入れ替わっている
+        backend.add_playlist(
+            playlist_id="PLall",
+            video_ids=(video[0], video[2], video[4], video[3], *video[5:], video[1]),
+        )
+        for playlist_id in TRACK_PLAYLISTS.values():
+            backend.add_playlist(playlist_id=playlist_id)
+
+        results = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            selector=SessionSelector(video_ids=frozenset({video[1]})),
+        )
+
+        # video[1] (Track 2) を含まないプレイリストは取得もしない
+        assert [result.playlist_id for result in results] == ["PLall", "PLtrack2"]
+        assert backend.calls["playlistItems.list"] == 2
+        assert backend.playlist_video_ids(playlist_id="PLall") == [
+            video[0],
+            video[1],
+            video[2],
+            video[4],
+            video[3],
+            *video[5:],
+        ]
+        # 同じトラックの他の動画はまだ追加しない
+        assert backend.playlist_video_ids(playlist_id="PLtrack2") == [video[1]]
+        assert backend.playlist_video_ids(playlist_id="PLtrack1") == []
+
+        all_result, track_result = results
+        assert all_result.reordered_count == 1
+        assert all_result.unchanged_count == SESSION_COUNT - 1
+        assert track_result.added_count == 1
+        assert [op.operation for op in track_result.operations] == [
+            PlaylistOperationType.ADD,
+        ]
@@ -7,13 +7,17 @@ import pytest
 from googleapiclient.errors import HttpError
 
 from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.adapters.playlist_sync_journal import (
+    JsonlPlaylistSyncJournal,
+)
 from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
 from confengine_to_youtube.domain.session import Session
 from confengine_to_youtube.usecases.dto import (
     PlaylistItem,
     PlaylistOperationType,
-    VideoInfo,
+    PlaylistSnapshot,
 )
+from confengine_to_youtube.usecases.errors import PlaylistStateMismatchError
 from confengine_to_youtube.usecases.protocols import (
     ConfEngineApiProtocol,
     YouTubeApiProtocol,
@@ -23,6 +27,10 @@ from tests.conftest import create_session, write_yaml_file
 from tests.integration.usecases.conftest import create_mock_confengine_api
 
 
+def _snapshot(*items: PlaylistItem, etag: str = "etag-1") -> PlaylistSnapshot:
+    return PlaylistSnapshot(etag=etag, items=items)
+
+
 class TestSyncPlaylistUseCase:
     """SyncPlaylistUseCase のテスト"""
 
@@ -93,14 +101,14 @@ sessions:
     def mock_youtube_api(self) -> YouTubeApiProtocol:
         """モックYouTube API"""
         mock = create_autospec(YouTubeApiGateway, spec_set=True)
-        mock.get_video_info.side_effect = lambda video_id: VideoInfo(
-            video_id=video_id,
-            title=f"Title for {video_id}",
-            description=f"Description for {video_id}",
-            category_id=28,
-        )
         # デフォルトでは空のプレイリストを返す
-        mock.list_playlist_items.return_value = {}
+        mock.fetch_playlist.return_value = _snapshot()
+        mock.add_to_playlist.side_effect = lambda **kwargs: PlaylistItem(
+            video_id=kwargs["video_id"],
+            playlist_item_id=f"item-{kwargs['video_id']}",
+            # position 省略時は末尾への追加だが、呼び出し側は position を参照しない
+            position=kwargs.get("position", 0),
+        )
         return mock  # type: ignore[no-any-return]
 
     @pytest.fixture
@@ -122,7 +130,7 @@ sessions:
         mapping_file: Path,
     ) -> None:
         """dry-runモードでプレイリストへの追加をプレビュー"""
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=True,
         )
@@ -149,27 +157,45 @@ sessions:
         mock_youtube_api: YouTubeApiProtocol,
     ) -> None:
         """実際にプレイリストに動画を追加"""
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=False,
         )
 
         assert result.added_count == 2
 
-        # add_to_playlist が正しい引数で呼ばれたことを確認
+        # 空のプレイリストへは position を指定せず、スケジュール順に末尾へ追加する
         assert mock_youtube_api.add_to_playlist.call_args_list == [  # type: ignore[attr-defined]
             call(
                 playlist_id="PLxxxxxxxxxxxxxxxx",
                 video_id="video1",
-                position=0,
             ),
             call(
                 playlist_id="PLxxxxxxxxxxxxxxxx",
                 video_id="video2",
-                position=1,
             ),
         ]
 
+    def test_sync_playlist_reports_phase_timings(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+    ) -> None:
+        """実行全体のフェーズごとの呼び出し回数を結果に含める"""
+        (result,) = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+        )
+
+        calls = {timing.name: timing.calls for timing in result.phases}
+        assert calls == {
+            "mapping.read": 1,
+            "confengine.fetch_schedule": 1,
+            "youtube.fetch_playlist": 1,
+            "plan": 1,
+            "youtube.add_to_playlist": 2,
+        }
+
     def test_sync_playlist_reorders_videos(
         self,
         usecase: SyncPlaylistUseCase,
@@ -178,34 +204,30 @@ sessions:
     ) -> None:
         """プレイリスト内の動画の順番を更新"""
         # プレイリストに既に動画があるが順番が違う場合
-        mock_youtube_api.list_playlist_items.return_value = {  # type: ignore[attr-defined]
-            "video1": PlaylistItem(
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(
                 video_id="video1",
                 playlist_item_id="item1",
                 position=1,  # 間違った位置
             ),
-            "video2": PlaylistItem(
+            PlaylistItem(
                 video_id="video2",
                 playlist_item_id="item2",
                 position=0,  # 間違った位置
             ),
-        }
+        )
 
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=False,
         )
 
-        assert result.reordered_count == 2
+        # video2 を video1 の後ろに移動するだけで正しい順番になる
+        assert result.reordered_count == 1
+        assert result.unchanged_count == 1
 
         # update_playlist_item_position が正しい引数で呼ばれたことを確認
         assert mock_youtube_api.update_playlist_item_position.call_args_list == [  # type: ignore[attr-defined]
-            call(
-                playlist_item_id="item1",
-                playlist_id="PLxxxxxxxxxxxxxxxx",
-                video_id="video1",
-                position=0,
-            ),
             call(
                 playlist_item_id="item2",
                 playlist_id="PLxxxxxxxxxxxxxxxx",
@@ -213,6 +235,197 @@ sessions:
                 position=1,
             ),
         ]
+        # プレイリストの取得は最初の1回だけ
+        mock_youtube_api.fetch_playlist.assert_called_once()  # type: ignore[attr-defined]
+
+    def test_sync_playlist_verifies_order_after_writes(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """確認を指定した場合は、書き込み後に1回だけ再取得して並びを確認する"""
+        mock_youtube_api.fetch_playlist.side_effect = [  # type: ignore[attr-defined]
+            _snapshot(),
+            _snapshot(
+                PlaylistItem(
+                    video_id="video1",
+                    playlist_item_id="item-video1",
+                    position=0,
+                ),
+                PlaylistItem(
+                    video_id="video2",
+                    playlist_item_id="item-video2",
+                    position=1,
+                ),
+            ),
+        ]
+
+        (result,) = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            verify=True,
+        )
+
+        assert result.added_count == 2
+        assert mock_youtube_api.fetch_playlist.call_count == 2  # type: ignore[attr-defined]
+
+    def test_sync_playlist_raises_error_when_verification_fails(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """再取得した並びがローカルの想定と異なる場合はエラー"""
+        mock_youtube_api.fetch_playlist.side_effect = [  # type: ignore[attr-defined]
+            _snapshot(),
+            _snapshot(
+                PlaylistItem(
+                    video_id="video2",
+                    playlist_item_id="item-video2",
+                    position=0,
+                ),
+                PlaylistItem(
+                    video_id="video1",
+                    playlist_item_id="item-video1",
+                    position=1,
+                ),
+            ),
+        ]
+
+        with pytest.raises(
+            expected_exception=PlaylistStateMismatchError,
+            match=(
+                r"^Playlist order differs from the expected state: PLxxxxxxxxxxxxxxxx$"
+            ),
+        ):
+            usecase.execute(
+                mapping_file=mapping_file,
+                dry_run=False,
+                verify=True,
+            )
+
+    def test_plan_does_not_modify_playlist(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """計画だけを立て、計画時点のETagを記録する"""
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+
+        assert plan.playlist_id == "PLxxxxxxxxxxxxxxxx"
+        assert plan.playlist_etag == "etag-1"
+        assert [op.operation for op in plan.operations] == [
+            PlaylistOperationType.ADD,
+            PlaylistOperationType.ADD,
+        ]
+        mock_youtube_api.add_to_playlist.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_apply_saved_plan(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """保存済みの計画は、1回の取得でETagを確認してから適用する"""
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+        mock_youtube_api.fetch_playlist.reset_mock()  # type: ignore[attr-defined]
+
+        (result,) = usecase.apply(plans=[plan])
+
+        assert result.is_dry_run is False
+        assert result.added_count == 2
+        mock_youtube_api.fetch_playlist.assert_called_once_with(  # type: ignore[attr-defined]
+            playlist_id="PLxxxxxxxxxxxxxxxx",
+        )
+        assert mock_youtube_api.add_to_playlist.call_count == 2  # type: ignore[attr-defined]
+
+    def test_apply_rejects_plan_for_changed_playlist(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """計画時点からプレイリストが変わっていれば適用しない"""
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(etag="etag-2")  # type: ignore[attr-defined]
+
+        with pytest.raises(
+            expected_exception=PlaylistStateMismatchError,
+            match=(
+                r"^Playlist has changed since the plan was created: PLxxxxxxxxxxxxxxxx$"
+            ),
+        ):
+            usecase.apply(plans=[plan])
+
+        mock_youtube_api.add_to_playlist.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_resume_applies_only_remaining_operations(
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        mapping_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """ジャーナルに完了が記録された操作は再開時に繰り返さない"""
+        journal = JsonlPlaylistSyncJournal(directory=tmp_path / "journal")
+        usecase = SyncPlaylistUseCase(
+            confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=mock_youtube_api,
+            journal=journal,
+        )
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id=plan.playlist_id, index=0)
+        # 1件目の追加だけが反映された状態
+        mock_youtube_api.fetch_playlist.reset_mock()  # type: ignore[attr-defined]
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(video_id="video1", playlist_item_id="item1", position=0),
+            etag="etag-2",
+        )
+
+        usecase.execute(mapping_file=mapping_file, dry_run=False, resume=True)
+
+        mock_youtube_api.add_to_playlist.assert_called_once_with(  # type: ignore[attr-defined]
+            playlist_id="PLxxxxxxxxxxxxxxxx",
+            video_id="video2",
+        )
+        mock_youtube_api.fetch_playlist.assert_called_once()  # type: ignore[attr-defined]
+        assert journal.load(playlist_id=plan.playlist_id) is None
+
+    def test_resume_rejects_playlist_changed_after_interruption(
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        mapping_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """完了済みの操作がプレイリストに見当たらなければ再開しない"""
+        journal = JsonlPlaylistSyncJournal(directory=tmp_path / "journal")
+        usecase = SyncPlaylistUseCase(
+            confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=mock_youtube_api,
+            journal=journal,
+        )
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+        journal.start(plan=plan)
+        journal.record_completed(playlist_id=plan.playlist_id, index=0)
+
+        with pytest.raises(
+            expected_exception=PlaylistStateMismatchError,
+            match=(
+                r"^Playlist has changed since the sync was interrupted: "
+                r"PLxxxxxxxxxxxxxxxx$"
+            ),
+        ):
+            usecase.execute(mapping_file=mapping_file, dry_run=False, resume=True)
+
+        mock_youtube_api.add_to_playlist.assert_not_called()  # type: ignore[attr-defined]
 
     def test_sync_playlist_unchanged_videos(
         self,
@@ -222,20 +435,20 @@ sessions:
     ) -> None:
         """正しい順番の動画は変更しない"""
         # プレイリストに既に正しい順番で動画がある
-        mock_youtube_api.list_playlist_items.return_value = {  # type: ignore[attr-defined]
-            "video1": PlaylistItem(
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(
                 video_id="video1",
                 playlist_item_id="item1",
                 position=0,
             ),
-            "video2": PlaylistItem(
+            PlaylistItem(
                 video_id="video2",
                 playlist_item_id="item2",
                 position=1,
             ),
-        }
+        )
 
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=False,
         )
@@ -256,25 +469,25 @@ sessions:
     ) -> None:
         """マッピングにない動画を末尾に移動"""
         # プレイリストにマッピングにない動画がある
-        mock_youtube_api.list_playlist_items.return_value = {  # type: ignore[attr-defined]
-            "video1": PlaylistItem(
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(
                 video_id="video1",
                 playlist_item_id="item1",
                 position=0,
             ),
-            "video2": PlaylistItem(
+            PlaylistItem(
                 video_id="video2",
                 playlist_item_id="item2",
                 position=1,
             ),
-            "unmapped_video": PlaylistItem(
+            PlaylistItem(
                 video_id="unmapped_video",
                 playlist_item_id="item_unmapped",
                 position=0,  # 先頭にあるが末尾に移動されるべき
             ),
-        }
+        )
 
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=True,
         )
@@ -289,6 +502,71 @@ sessions:
         assert move_ops[0].video_id == "unmapped_video"
         assert move_ops[0].position == 2  # 末尾 (0, 1 の後)
 
+    def test_sync_playlist_moves_only_unmapped_video_at_top(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """先頭のマッピングなし動画だけを移動し、マッピング済み動画は動かさない"""
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(
+                video_id="unmapped_video",
+                playlist_item_id="item_unmapped",
+                position=0,
+            ),
+            PlaylistItem(
+                video_id="video1",
+                playlist_item_id="item1",
+                position=1,
+            ),
+            PlaylistItem(
+                video_id="video2",
+                playlist_item_id="item2",
+                position=2,
+            ),
+        )
+
+        (result,) = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+        )
+
+        assert result.moved_to_end_count == 1
+        assert result.reordered_count == 0
+        assert result.unchanged_count == 2
+        assert mock_youtube_api.update_playlist_item_position.call_args_list == [  # type: ignore[attr-defined]
+            call(
+                playlist_item_id="item_unmapped",
+                playlist_id="PLxxxxxxxxxxxxxxxx",
+                video_id="unmapped_video",
+                position=2,
+            ),
+        ]
+
+    def test_sync_playlist_keeps_unmapped_tail_in_place(
+        self,
+        usecase: SyncPlaylistUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """末尾にまとまったマッピングなし動画は、前の並べ替えがあっても移動しない"""
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(video_id="video2", playlist_item_id="item2", position=0),
+            PlaylistItem(video_id="video1", playlist_item_id="item1", position=1),
+            PlaylistItem(video_id="unmapped_b", playlist_item_id="item_b", position=2),
+            PlaylistItem(video_id="unmapped_a", playlist_item_id="item_a", position=3),
+        )
+
+        (result,) = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+        )
+
+        assert result.moved_to_end_count == 0
+        assert result.reordered_count == 1
+        mock_youtube_api.update_playlist_item_position.assert_called_once()  # type: ignore[attr-defined]
+
     def test_sync_playlist_raises_error_when_playlist_not_found(
         self,
         usecase: SyncPlaylistUseCase,
@@ -298,7 +576,7 @@ sessions:
         """プレイリストが存在しない場合はHttpErrorを発生"""
         resp = MagicMock()
         resp.status = 404
-        mock_youtube_api.list_playlist_items.side_effect = HttpError(  # type: ignore[attr-defined]
+        mock_youtube_api.fetch_playlist.side_effect = HttpError(  # type: ignore[attr-defined]
             resp=resp,
             content=b'{"error": {"message": "Playlist not found"}}',
         )
@@ -316,25 +594,25 @@ sessions:
         mock_youtube_api: YouTubeApiProtocol,
     ) -> None:
         """マッピングなし動画がすでに正しい位置にある場合はUNCHANGEDとして記録"""
-        mock_youtube_api.list_playlist_items.return_value = {  # type: ignore[attr-defined]
-            "video1": PlaylistItem(
+        mock_youtube_api.fetch_playlist.return_value = _snapshot(  # type: ignore[attr-defined]
+            PlaylistItem(
                 video_id="video1",
                 playlist_item_id="item1",
                 position=0,
             ),
-            "video2": PlaylistItem(
+            PlaylistItem(
                 video_id="video2",
                 playlist_item_id="item2",
                 position=1,
             ),
-            "unmapped_video": PlaylistItem(
+            PlaylistItem(
                 video_id="unmapped_video",
                 playlist_item_id="item_unmapped",
                 position=2,  # すでに末尾にある
             ),
-        }
+        )
 
-        result = usecase.execute(
+        (result,) = usecase.execute(
             mapping_file=mapping_file,
             dry_run=True,
         )
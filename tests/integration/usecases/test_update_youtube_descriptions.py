@@ -1,15 +1,23 @@
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import call, create_autospec
+from unittest.mock import Mock, call, create_autospec
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.adapters.video_state_store import SqliteVideoStateStore
 from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
 from confengine_to_youtube.domain.errors import FrameOverflowError
 from confengine_to_youtube.domain.session import Session
-from confengine_to_youtube.usecases.dto import VideoInfo, VideoUpdateRequest
+from confengine_to_youtube.domain.session_selector import SessionSelector
+from confengine_to_youtube.usecases.dto import (
+    VideoInfo,
+    VideoUpdateRecord,
+    VideoUpdateRequest,
+    VideoUpdateStatus,
+)
 from confengine_to_youtube.usecases.protocols import (
     ConfEngineApiProtocol,
     YouTubeApiProtocol,
@@ -88,15 +96,24 @@ sessions:
         return create_mock_confengine_api(sessions=sessions, timezone=jst)
 
     @pytest.fixture
-    def mock_youtube_api(self) -> YouTubeApiProtocol:
+    def fetch_video(self) -> Mock:
+        """動画1件分の取得内容 (get_videos_info のモックが動画ごとに呼ぶ)"""
+        return Mock(
+            side_effect=lambda video_id: VideoInfo(
+                video_id=video_id,
+                title=f"Title for {video_id}",
+                description=f"Description for {video_id}",
+                category_id=28,
+            ),
+        )
+
+    @pytest.fixture
+    def mock_youtube_api(self, fetch_video: Mock) -> YouTubeApiProtocol:
         """モックYouTube API"""
         mock = create_autospec(YouTubeApiGateway, spec_set=True)
-        mock.get_video_info.side_effect = lambda video_id: VideoInfo(
-            video_id=video_id,
-            title=f"Title for {video_id}",
-            description=f"Description for {video_id}",
-            category_id=28,
-        )
+        mock.get_videos_info.side_effect = lambda video_ids: {
+            video_id: fetch_video(video_id=video_id) for video_id in video_ids
+        }
         return mock  # type: ignore[no-any-return]
 
     @pytest.fixture
@@ -194,6 +211,76 @@ sessions:
             ),
         ]
 
+    def test_execute_fetches_video_info_in_batch(
+        self,
+        usecase: UpdateYouTubeDescriptionsUseCase,
+        mapping_file: Path,
+        mock_youtube_api: YouTubeApiProtocol,
+    ) -> None:
+        """動画情報はまとめて1回で取得し、ステージごとの処理実績を返す"""
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=True,
+        )
+
+        assert mock_youtube_api.get_videos_info.call_args_list == [  # type: ignore[attr-defined]
+            call(video_ids=["video1", "video2"]),
+        ]
+        assert [(stats.name, stats.items) for stats in result.stage_stats] == [
+            ("resolve", 2),
+            ("generate", 2),
+            ("prefetch", 2),
+            ("diff", 2),
+            ("apply", 2),
+        ]
+
+    def test_execute_streams_records_to_sink(
+        self,
+        usecase: UpdateYouTubeDescriptionsUseCase,
+        mapping_file: Path,
+    ) -> None:
+        """渡し先を指定すると、セッションごとの結果を渡してプレビューは溜めない"""
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            sink=records.append,
+        )
+
+        assert result.previews == ()
+        assert result.changed_count == 2
+        assert [
+            (record.video_id, record.status, record.description_changed)
+            for record in records
+        ] == [
+            ("video1", VideoUpdateStatus.UPDATED, True),
+            ("video2", VideoUpdateStatus.UPDATED, True),
+        ]
+        assert all(record.update_seconds is not None for record in records)
+        assert records[0].elapsed_seconds <= records[1].elapsed_seconds
+
+    def test_execute_reports_phase_timings(
+        self,
+        usecase: UpdateYouTubeDescriptionsUseCase,
+        mapping_file: Path,
+    ) -> None:
+        """フェーズごとの呼び出し回数と所要時間を返す"""
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+        )
+
+        calls = {timing.name: timing.calls for timing in result.phases}
+        assert calls == {
+            "mapping.read": 1,
+            "confengine.fetch_schedule": 1,
+            "generate": 1,
+            "youtube.get_videos_info": 1,
+            "youtube.update_video": 2,
+        }
+        assert all(timing.seconds >= 0 for timing in result.phases)
+
     def test_execute_processes_empty_abstract_sessions(
         self,
         mock_youtube_api: YouTubeApiProtocol,
@@ -233,6 +320,7 @@ sessions:
     def test_execute_preserves_when_both_flags_false(
         self,
         mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
         tmp_path: Path,
         mapping_reader: MappingFileReader,
         jst: ZoneInfo,
@@ -282,7 +370,7 @@ sessions:
         assert result.preserved_count == 1
         assert result.changed_count == 0
         assert len(result.previews) == 0
-        mock_youtube_api.get_video_info.assert_not_called()  # type: ignore[attr-defined]
+        fetch_video.assert_not_called()
         mock_youtube_api.update_video.assert_not_called()  # type: ignore[attr-defined]
 
     def test_execute_preserves_title_only(
@@ -449,6 +537,93 @@ sessions: {}
         assert result.changed_count == 0
         assert result.no_mapping_count == 1
 
+    def test_execute_updates_video_mapped_to_multiple_slots_once(
+        self,
+        usecase: UpdateYouTubeDescriptionsUseCase,
+        mock_youtube_api: YouTubeApiProtocol,
+        tmp_path: Path,
+    ) -> None:
+        """複数スロットにマッピングされた動画は、最初のセッションの内容で1回だけ更新する"""
+        # 2コマ続きのワークショップを1本の動画にした場合
+        yaml_content = """
+conf_id: test-conf
+playlist_id: PLtest123
+sessions:
+  "2026-01-07":
+    "Hall A":
+      "10:00":
+        video_id: "workshop"
+      "11:00":
+        video_id: "workshop"
+"""
+        mapping_file = write_yaml_file(
+            tmp_path=tmp_path,
+            content=yaml_content,
+            filename="workshop_mapping.yaml",
+        )
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            sink=records.append,
+        )
+
+        assert result.changed_count == 1
+        assert result.duplicate_count == 1
+        assert result.unused_mappings_count == 0
+        mock_youtube_api.get_videos_info.assert_called_once_with(  # type: ignore[attr-defined]
+            video_ids=["workshop"],
+        )
+        (update_call,) = mock_youtube_api.update_video.call_args_list  # type: ignore[attr-defined]
+        assert update_call.kwargs["request"].title.startswith("Session 1")
+        assert sorted((record.session_key, record.status) for record in records) == [
+            ("2026-01-07T10:00:00+09:00_Hall A", VideoUpdateStatus.UPDATED),
+            ("2026-01-07T11:00:00+09:00_Hall A", VideoUpdateStatus.DUPLICATE),
+        ]
+
+    def test_execute_skips_selected_duplicate_of_unselected_session(
+        self,
+        usecase: UpdateYouTubeDescriptionsUseCase,
+        mock_youtube_api: YouTubeApiProtocol,
+        tmp_path: Path,
+    ) -> None:
+        """絞り込みで後のセッションだけを選んでも、最初のセッションの内容を上書きしない"""
+        yaml_content = """
+conf_id: test-conf
+playlist_id: PLtest123
+sessions:
+  "2026-01-07":
+    "Hall A":
+      "10:00":
+        video_id: "workshop"
+      "11:00":
+        video_id: "workshop"
+"""
+        mapping_file = write_yaml_file(
+            tmp_path=tmp_path,
+            content=yaml_content,
+            filename="workshop_mapping.yaml",
+        )
+        # CLIから渡される日時はタイムゾーンなし
+        local_1100 = datetime(year=2026, month=1, day=7, hour=11, minute=0)  # noqa: DTZ001
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            sink=records.append,
+            selector=SessionSelector(slots=frozenset({(local_1100, "Hall A")})),
+        )
+
+        assert result.changed_count == 0
+        assert result.duplicate_count == 1
+        mock_youtube_api.get_videos_info.assert_not_called()  # type: ignore[attr-defined]
+        mock_youtube_api.update_video.assert_not_called()  # type: ignore[attr-defined]
+        assert [(record.session_key, record.status) for record in records] == [
+            ("2026-01-07T11:00:00+09:00_Hall A", VideoUpdateStatus.DUPLICATE),
+        ]
+
     def test_execute_warns_unused_mappings(
         self,
         mock_youtube_api: YouTubeApiProtocol,
@@ -608,9 +783,11 @@ sessions:
             youtube_api=mock_youtube_api,
         )
 
+        records: list[VideoUpdateRecord] = []
         result = usecase.execute(
             mapping_file=mapping_file,
             dry_run=True,
+            sink=records.append,
         )
 
         assert result.changed_count == 0
@@ -618,10 +795,15 @@ sessions:
         assert len(result.errors) == 1
         assert result.errors[0].video_id == "video1"
         assert isinstance(result.errors[0].error, FrameOverflowError)
+        # sink にもエラーの内容を渡す
+        (record,) = records
+        assert record.status == VideoUpdateStatus.FAILED
+        assert record.error_message == result.errors[0].error.message
 
     def test_execute_skips_unchanged_videos(
         self,
         mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
         tmp_path: Path,
         mapping_reader: MappingFileReader,
         jst: ZoneInfo,
@@ -645,8 +827,8 @@ sessions:
         expected_description = (
             "Speaker: Speaker A\n\nAbstract 1\n\n***\n\nhttps://example.com/1\n\n***"
         )
-        mock_youtube_api.get_video_info.side_effect = None  # type: ignore[attr-defined]
-        mock_youtube_api.get_video_info.return_value = VideoInfo(  # type: ignore[attr-defined]
+        fetch_video.side_effect = None
+        fetch_video.return_value = VideoInfo(
             video_id="video1",
             title=expected_title,
             description=expected_description,
@@ -690,6 +872,7 @@ sessions:
     def test_execute_updates_changed_videos_only(
         self,
         mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
         tmp_path: Path,
         mapping_reader: MappingFileReader,
         jst: ZoneInfo,
@@ -722,7 +905,7 @@ sessions:
             "Speaker: Speaker A\n\nAbstract 1\n\n***\n\nhttps://example.com/1\n\n***"
         )
 
-        def mock_get_video_info(video_id: str) -> VideoInfo:
+        def video_info_for(video_id: str) -> VideoInfo:
             if video_id == "video1":
                 return VideoInfo(
                     video_id=video_id,
@@ -737,7 +920,7 @@ sessions:
                 category_id=28,
             )
 
-        mock_youtube_api.get_video_info.side_effect = mock_get_video_info  # type: ignore[attr-defined]
+        fetch_video.side_effect = video_info_for
 
         yaml_content = """
 conf_id: test-conf
@@ -776,3 +959,252 @@ sessions:
         mock_youtube_api.update_video.assert_called_once()  # type: ignore[attr-defined]
         call_args = mock_youtube_api.update_video.call_args  # type: ignore[attr-defined]
         assert call_args.kwargs["request"].video_id == "video2"
+
+    @pytest.fixture
+    def state_store(self, tmp_path: Path) -> Iterator[SqliteVideoStateStore]:
+        with SqliteVideoStateStore(db_path=tmp_path / "state.sqlite3") as store:
+            yield store
+
+    def _create_usecase_with_state_store(
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        state_store: SqliteVideoStateStore,
+        now: datetime,
+    ) -> UpdateYouTubeDescriptionsUseCase:
+        mock_youtube_api.update_video.return_value = "etag-after-update"  # type: ignore[attr-defined]
+        return UpdateYouTubeDescriptionsUseCase(
+            confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=mock_youtube_api,
+            state_store=state_store,
+            state_ttl=timedelta(hours=24),
+            clock=lambda: now,
+        )
+
+    def test_execute_skips_video_read_when_synced_content_unchanged(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """前回同期時と生成内容が同じで有効期限内なら動画情報を取得しない"""
+        synced_at = datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC)
+        self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        saved = state_store.get(video_id="video1")
+        assert saved is not None
+        assert saved.etag == "etag-after-update"
+        assert saved.category_id == 28
+        assert saved.synced_at == synced_at
+
+        fetch_video.reset_mock()
+        mock_youtube_api.update_video.reset_mock()  # type: ignore[attr-defined]
+
+        result = self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at + timedelta(hours=1),
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert result.state_skipped_count == 2
+        assert result.changed_count == 0
+        assert result.previews == ()
+        fetch_video.assert_not_called()
+        mock_youtube_api.update_video.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_execute_reads_video_again_after_state_ttl(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """同期状態が有効期限切れならYouTubeから再取得する"""
+        synced_at = datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC)
+        self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+        fetch_video.reset_mock()
+
+        result = self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at + timedelta(hours=25),
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert result.state_skipped_count == 0
+        assert fetch_video.call_count == 2
+
+    def test_execute_skips_video_read_without_state_ttl(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """有効期限を指定しなければ、同期状態はいつまでも有効"""
+        synced_at = datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC)
+        mock_youtube_api.update_video.return_value = "etag-after-update"  # type: ignore[attr-defined]
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=mock_youtube_api,
+            state_store=state_store,
+            clock=lambda: synced_at,
+        )
+        usecase.execute(mapping_file=mapping_file, dry_run=False)
+        fetch_video.reset_mock()
+
+        result = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=mock_youtube_api,
+            state_store=state_store,
+            clock=lambda: synced_at + timedelta(days=365),
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert result.state_skipped_count == 2
+        fetch_video.assert_not_called()
+
+    def test_execute_verify_remote_reads_synced_videos(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """verify_remote 指定時は同期状態によるスキップを行わない"""
+        now = datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC)
+        usecase = self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=now,
+        )
+        usecase.execute(mapping_file=mapping_file, dry_run=False)
+        fetch_video.reset_mock()
+
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            verify_remote=True,
+        )
+
+        assert result.state_skipped_count == 0
+        assert fetch_video.call_count == 2
+
+    def test_execute_reads_video_when_generated_content_changed(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """生成内容が前回同期時と異なればYouTubeから取得して更新する"""
+        synced_at = datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC)
+        self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+        fetch_video.reset_mock()
+
+        changed_mapping_file = write_yaml_file(
+            tmp_path=tmp_path,
+            content=mapping_file.read_text(encoding="utf-8") + 'footer: "New"\n',
+            filename="changed_mapping.yaml",
+        )
+        result = self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=synced_at + timedelta(hours=1),
+        ).execute(mapping_file=changed_mapping_file, dry_run=False)
+
+        assert result.state_skipped_count == 0
+        assert result.changed_count == 2
+        assert fetch_video.call_count == 2
+
+    def test_execute_dry_run_does_not_save_state(
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """dry-runでは同期状態を記録しない"""
+        self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC),
+        ).execute(mapping_file=mapping_file, dry_run=True)
+
+        assert state_store.get(video_id="video1") is None
+
+    def test_execute_saves_state_for_unchanged_video(  # noqa: PLR0913
+        self,
+        mock_confengine_api: ConfEngineApiProtocol,
+        mapping_reader: MappingFileReader,
+        mock_youtube_api: YouTubeApiProtocol,
+        fetch_video: Mock,
+        state_store: SqliteVideoStateStore,
+        mapping_file: Path,
+    ) -> None:
+        """YouTube側が既に生成内容と一致する場合も取得時のETagで状態を記録する"""
+        fetch_video.side_effect = None
+        fetch_video.return_value = VideoInfo(
+            video_id="video1",
+            title="Session 1 - Speaker A",
+            description=(
+                "Speaker: Speaker A\n\nAbstract 1\n\n***\n\nhttps://example.com/1\n\n***"
+            ),
+            category_id=28,
+            etag="etag-remote",
+        )
+
+        self._create_usecase_with_state_store(
+            mock_confengine_api=mock_confengine_api,
+            mapping_reader=mapping_reader,
+            mock_youtube_api=mock_youtube_api,
+            state_store=state_store,
+            now=datetime(year=2026, month=1, day=7, hour=12, tzinfo=UTC),
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        saved = state_store.get(video_id="video1")
+        assert saved is not None
+        assert saved.etag == "etag-remote"
@@ -0,0 +1,269 @@
+"""動画の更新が失敗した場合のテスト"""
+
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.usecases import update_youtube_descriptions
+from confengine_to_youtube.usecases.circuit_breaker import WriteFailurePolicy
+from confengine_to_youtube.usecases.dto import (
+    VideoFetchFailure,
+    VideoInfo,
+    VideoNotFound,
+    VideoUpdateRecord,
+    VideoUpdateRequest,
+    VideoUpdateStatus,
+    VideoWriteFailure,
+)
+from confengine_to_youtube.usecases.errors import VideoFetchError, VideoUpdateError
+from confengine_to_youtube.usecases.update_youtube_descriptions import (
+    UpdateYouTubeDescriptionsUseCase,
+)
+from tests.fakes.synthetic import synthetic_video_id
+from tests.fakes.youtube_api import InMemoryYouTubeApi
+from tests.fakes.youtube_backend import QUOTA_COSTS, FakeYouTubeBackend
+from tests.integration.usecases.conftest import create_mock_confengine_api
+
+SESSION_COUNT = 20
+
+pytestmark = pytest.mark.parametrize(
+    "synthetic_conference",
+    [{"session_count": SESSION_COUNT, "playlist_id": "PLfailures"}],
+    indirect=True,
+)
+
+
+class _RejectingYouTubeApi(InMemoryYouTubeApi):
+    """指定した動画の更新だけを拒否する"""
+
+    def __init__(self, backend: FakeYouTubeBackend, rejected: set[str]) -> None:
+        super().__init__(backend=backend)
+        self.rejected = rejected
+
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        if request.video_id in self.rejected:
+            msg = f"Failed to update video {request.video_id}: HTTP 403 forbidden"
+            raise VideoUpdateError(msg)
+        return super().update_video(request=request)
+
+
+class _RevokedYouTubeApi(InMemoryYouTubeApi):
+    """最初の取得の後に権限が失われ、以降の更新も取得も拒否する
+
+    2回目以降の取得は、更新が rejected_writes 回拒否されるまで待ってから拒否する
+    (ブレーカーが開く前に取得を始めていた場合を再現する)。
+    """
+
+    def __init__(self, backend: FakeYouTubeBackend, rejected_writes: int) -> None:
+        super().__init__(backend=backend)
+        self.read_calls = 0
+        self._rejected_writes = rejected_writes
+        self._write_calls = 0
+        self._writes_rejected = threading.Event()
+
+    def get_videos_info(self, video_ids: Sequence[str]) -> dict[str, VideoInfo]:
+        self.read_calls += 1
+        if self.read_calls == 1:
+            return super().get_videos_info(video_ids=video_ids)
+
+        self._writes_rejected.wait(timeout=10)
+        msg = f"Failed to fetch {len(video_ids)} videos: HTTP 403 forbidden"
+        raise VideoFetchError(msg)
+
+    def update_video(self, request: VideoUpdateRequest) -> str | None:
+        self._write_calls += 1
+        if self._write_calls >= self._rejected_writes:
+            self._writes_rejected.set()
+        msg = f"Failed to update video {request.video_id}: HTTP 403 forbidden"
+        raise VideoUpdateError(msg)
+
+
+class TestVideoUpdateFailures:
+    """UpdateYouTubeDescriptionsUseCase の更新失敗の扱い"""
+
+    def test_isolated_failures_are_recorded_and_skipped(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """散発的な失敗はエラーとして記録し、残りの動画の更新を続ける"""
+        rejected = {synthetic_video_id(index=3), synthetic_video_id(index=11)}
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=_RejectingYouTubeApi(backend=backend, rejected=rejected),
+        )
+
+        result = usecase.execute(mapping_file=mapping_file)
+
+        assert not result.aborted
+        assert result.aborted_count == 0
+        assert result.changed_count == SESSION_COUNT - 2
+        assert {error.video_id for error in result.errors} == rejected
+        assert all(
+            isinstance(error.error, VideoWriteFailure) for error in result.errors
+        )
+        assert result.write_failure_count == len(rejected)
+
+    def test_sustained_failures_abort_remaining_updates(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """失敗が続いたら以降の更新を打ち切り、残りの動画を打ち切りとして数える"""
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=InMemoryYouTubeApi(backend=backend),
+            write_failure_policy=WriteFailurePolicy(max_consecutive_failures=4),
+        )
+        # 動画情報の取得1回と、3件の更新の分しかクォータがない
+        backend.quota_limit = (
+            QUOTA_COSTS["videos.list"] + 3 * QUOTA_COSTS["videos.update"]
+        )
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(mapping_file=mapping_file, sink=records.append)
+
+        assert result.aborted
+        assert result.changed_count == 3
+        assert len(result.errors) == 4
+        assert result.aborted_count == SESSION_COUNT - 3 - 4
+        assert backend.calls["videos.update"] == 3
+        assert [record.status for record in records] == [
+            *[VideoUpdateStatus.UPDATED] * 3,
+            *[VideoUpdateStatus.FAILED] * 4,
+            *[VideoUpdateStatus.ABORTED] * (SESSION_COUNT - 3 - 4),
+        ]
+
+    def test_dry_run_never_aborts(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """dry-run は書き込まないため打ち切らない"""
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=_RejectingYouTubeApi(
+                backend=backend,
+                rejected={synthetic_video_id(index=i) for i in range(SESSION_COUNT)},
+            ),
+            write_failure_policy=WriteFailurePolicy(max_consecutive_failures=1),
+        )
+
+        result = usecase.execute(mapping_file=mapping_file, dry_run=True)
+
+        assert not result.aborted
+        assert result.changed_count == SESSION_COUNT
+        assert result.errors == ()
+
+    def test_missing_videos_are_reported_per_session(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """YouTube に見つからない動画はそのセッションのエラーとし、他の動画は更新する"""
+        missing = synthetic_video_id(index=5)
+        del backend.videos[missing]
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=InMemoryYouTubeApi(backend=backend),
+        )
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(mapping_file=mapping_file, sink=records.append)
+
+        assert result.changed_count == SESSION_COUNT - 1
+        assert [(error.video_id, type(error.error)) for error in result.errors] == [
+            (missing, VideoNotFound),
+        ]
+        assert [record.status for record in records if record.video_id == missing] == [
+            VideoUpdateStatus.FAILED
+        ]
+
+    def test_errors_from_different_stages_are_in_session_order(
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+    ) -> None:
+        """取得と更新のエラーはステージによらずセッション順に並ぶ"""
+        rejected = synthetic_video_id(index=3)
+        missing = synthetic_video_id(index=11)
+        del backend.videos[missing]
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=_RejectingYouTubeApi(backend=backend, rejected={rejected}),
+        )
+
+        result = usecase.execute(mapping_file=mapping_file)
+
+        assert [(error.video_id, type(error.error)) for error in result.errors] == [
+            (rejected, VideoWriteFailure),
+            (missing, VideoNotFound),
+        ]
+        assert result.write_failure_count == 1
+
+    def test_reads_stop_once_the_breaker_is_open(  # noqa: PLR0913
+        self,
+        sessions: tuple[Session, ...],
+        mapping_file: Path,
+        mapping_reader: MappingFileReader,
+        backend: FakeYouTubeBackend,
+        jst: ZoneInfo,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """ブレーカーが開いたら動画情報も取得せず、残りのセッションを打ち切る
+
+        開く前に始めていた取得が拒否された場合は、そのバッチのセッションをエラーとする。
+        """
+        # 20件を5件ずつ4回に分けて取得する
+        monkeypatch.setattr(update_youtube_descriptions, "VIDEO_INFO_BATCH_SIZE", 5)
+        api = _RevokedYouTubeApi(backend=backend, rejected_writes=3)
+        usecase = UpdateYouTubeDescriptionsUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=mapping_reader,
+            youtube_api=api,
+            write_failure_policy=WriteFailurePolicy(max_consecutive_failures=3),
+        )
+        records: list[VideoUpdateRecord] = []
+
+        result = usecase.execute(mapping_file=mapping_file, sink=records.append)
+
+        assert result.aborted
+        assert result.changed_count == 0
+        # 2回目の取得はブレーカーが開く前に始まっていた場合だけ行われる
+        assert api.read_calls <= 2
+        assert result.aborted_count + len(result.errors) == SESSION_COUNT
+        assert {type(error.error) for error in result.errors} <= {
+            VideoWriteFailure,
+            VideoFetchFailure,
+        }
+        statuses = {record.session_key: record.status for record in records}
+        assert len(statuses) == SESSION_COUNT
+        assert all(
+            statuses[str(session.slot)] == VideoUpdateStatus.ABORTED
+            for session in sessions[10:]
+        )
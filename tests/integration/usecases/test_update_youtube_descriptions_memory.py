@@ -0,0 +1,131 @@
+"""dry-run のメモリ使用量のテスト
+
+プレビューを preview_sink に渡して捨てる場合、実行中に増えるメモリのうち
+生成結果やプレビューの分がセッション数によらず一定の範囲に収まることを
+tracemalloc で確かめる。コンテンツ生成は複数のワーカーに分配する設定で実行する。
+"""
+
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from unittest.mock import create_autospec
+from zoneinfo import ZoneInfo
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.usecases.content_generation import ContentBatchGenerator
+from confengine_to_youtube.usecases.dto import VideoUpdatePreview, VideoUpdateResult
+from confengine_to_youtube.usecases.update_youtube_descriptions import (
+    UpdateYouTubeDescriptionsUseCase,
+)
+from tests.fakes.youtube_api import InMemoryYouTubeApi
+from tests.integration.usecases.conftest import (
+    create_mock_confengine_api,
+    create_synthetic_conference,
+)
+
+SMALL_SESSION_COUNT = 250
+LARGE_SESSION_COUNT = 3000
+# 最初のチャンクだけ直列に生成し、以降は2つのワーカーに分配する
+PARALLEL_THRESHOLD = 32
+MAX_WORKERS = 2
+# セッション1件あたりに許すピークメモリの増分のバイト数。マッピングのドメインへの
+# 変換は計測前に済ませるので、残るのは使ったスロットの記録などの200バイト弱。
+# 生成結果やプレビューを溜めると1件ごとに生成したdescription (合成セッションでは
+# 1KB強) 以上が残る (プレビューなら2KB程度) ため、それより十分小さくする
+MAX_GROWTH_PER_SESSION = 512
+
+
+def _streaming_peak_growth(
+    tmp_path: Path,
+    jst: ZoneInfo,
+    session_count: int,
+) -> int:
+    """パイプラインに流す直前から、実行中のピークまでに増えたバイト数
+
+    スケジュール・マッピングファイルの読み込みとドメインへの変換は計測前に済ませる。
+    """
+    conference = create_synthetic_conference(
+        tmp_path=tmp_path,
+        timezone=jst,
+        session_count=session_count,
+        playlist_id="PLmemory",
+    )
+    mapping_file = conference.mapping_file
+    mapping_reader = create_autospec(MappingFileReader, spec_set=True)
+    mapping_reader.read.return_value = MappingFileReader().read(file_path=mapping_file)
+
+    usecase = UpdateYouTubeDescriptionsUseCase(
+        confengine_api=create_mock_confengine_api(
+            sessions=conference.sessions,
+            timezone=jst,
+        ),
+        mapping_reader=mapping_reader,
+        youtube_api=InMemoryYouTubeApi(backend=conference.backend),
+        content_generator=lambda: ContentBatchGenerator(
+            parallel_threshold=PARALLEL_THRESHOLD,
+            max_workers=MAX_WORKERS,
+        ),
+    )
+    previewed = 0
+    baseline = 0
+    execute_pipeline = usecase._execute
+
+    def measured_pipeline(
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> VideoUpdateResult:
+        # マッピングのドメインへの変換などが済んだ時点から測る
+        nonlocal baseline
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        return execute_pipeline(*args, **kwargs)
+
+    usecase._execute = measured_pipeline  # type: ignore[method-assign]
+
+    def discard(preview: VideoUpdatePreview) -> None:
+        nonlocal previewed
+        assert preview.has_changes
+        previewed += 1
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = usecase.execute(
+            mapping_file=mapping_file,
+            dry_run=True,
+            preview_sink=discard,
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.previews == ()
+    assert result.changed_count == previewed == session_count
+
+    return peak - baseline
+
+
+class TestDryRunMemory:
+    """dry-run のピークメモリ"""
+
+    def test_streamed_previews_keep_memory_bounded(
+        self,
+        tmp_path: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """プレビューを溜めなければ、セッション数を増やしてもピークはほぼ変わらない"""
+        small = _streaming_peak_growth(
+            tmp_path=tmp_path,
+            jst=jst,
+            session_count=SMALL_SESSION_COUNT,
+        )
+        large = _streaming_peak_growth(
+            tmp_path=tmp_path,
+            jst=jst,
+            session_count=LARGE_SESSION_COUNT,
+        )
+
+        extra_sessions = LARGE_SESSION_COUNT - SMALL_SESSION_COUNT
+        assert large - small < extra_sessions * MAX_GROWTH_PER_SESSION
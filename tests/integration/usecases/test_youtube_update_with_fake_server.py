@@ -0,0 +1,413 @@
+"""フェイクYouTubeサーバーを使った youtube-update の通しテスト
+
+ConfEngine API のみモックし、YouTube 側は実際のHTTP通信経路を通して
+API呼び出し回数 (クォータ予算) を検証する。
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from confengine_to_youtube.adapters.mapping_file_reader import MappingFileReader
+from confengine_to_youtube.adapters.playlist_sync_journal import (
+    JsonlPlaylistSyncJournal,
+)
+from confengine_to_youtube.adapters.video_state_store import SqliteVideoStateStore
+from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
+from confengine_to_youtube.domain.session import Session
+from confengine_to_youtube.usecases.sync_playlist import SyncPlaylistUseCase
+from confengine_to_youtube.usecases.update_youtube_descriptions import (
+    UpdateYouTubeDescriptionsUseCase,
+)
+from tests.fakes.synthetic import (
+    synthetic_mapping_yaml,
+    synthetic_video_id,
+)
+from tests.fakes.youtube_backend import FakeYouTubeBackend
+from tests.fakes.youtube_server import FakeYouTubeServer
+from tests.integration.usecases.conftest import create_mock_confengine_api
+
+PLAYLIST_ID = "PLfake"
+SESSION_COUNT = 5
+
+
+@pytest.mark.parametrize(
+    "synthetic_conference",
+    [
+        {
+            "session_count": SESSION_COUNT,
+            "playlist_id": PLAYLIST_ID,
+            "with_playlist": True,
+        },
+    ],
+    indirect=True,
+)
+class TestYouTubeUpdateWithFakeServer:
+    """フェイクサーバーに対する youtube-update 相当の処理"""
+
+    @pytest.fixture
+    def gateway(self, backend: FakeYouTubeBackend) -> Iterator[YouTubeApiGateway]:
+        with FakeYouTubeServer(backend=backend) as server:
+            yield YouTubeApiGateway.from_api_endpoint(api_endpoint=server.api_endpoint)
+
+    def _run(  # noqa: PLR0913
+        self,
+        sessions: tuple[Session, ...],
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+        state_store: SqliteVideoStateStore | None = None,
+        *,
+        verify_remote: bool = False,
+    ) -> None:
+        confengine_api = create_mock_confengine_api(sessions=sessions, timezone=jst)
+        mapping_reader = MappingFileReader()
+
+        UpdateYouTubeDescriptionsUseCase(
+            confengine_api=confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=gateway,
+            state_store=state_store,
+        ).execute(
+            mapping_file=mapping_file,
+            dry_run=False,
+            verify_remote=verify_remote,
+        )
+        SyncPlaylistUseCase(
+            confengine_api=confengine_api,
+            mapping_reader=mapping_reader,
+            youtube_api=gateway,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+    def test_first_run_updates_videos_and_populates_playlist(
+        self,
+        sessions: tuple[Session, ...],
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """初回実行で全動画を更新し、プレイリストをスケジュール順に構成する"""
+        self._run(
+            sessions=sessions,
+            gateway=gateway,
+            mapping_file=mapping_file,
+            jst=jst,
+        )
+
+        assert backend.videos[synthetic_video_id(index=0)].title.startswith(
+            "Session 0: ",
+        )
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        # 動画情報は50件ずつまとめて取得する
+        assert backend.calls["videos.list"] == 1
+        assert backend.calls["videos.update"] == SESSION_COUNT
+        assert backend.calls["playlistItems.insert"] == SESSION_COUNT
+        # 追加後の position はローカルで追跡するため、取得は最初の1回だけ
+        assert backend.calls["playlistItems.list"] == 1
+
+    def test_second_run_issues_no_writes(
+        self,
+        sessions: tuple[Session, ...],
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """変更がない2回目の実行では書き込みを行わない"""
+        self._run(
+            sessions=sessions,
+            gateway=gateway,
+            mapping_file=mapping_file,
+            jst=jst,
+        )
+        backend.reset_counters()
+
+        self._run(
+            sessions=sessions,
+            gateway=gateway,
+            mapping_file=mapping_file,
+            jst=jst,
+        )
+
+        assert backend.calls == {
+            "videos.list": 1,
+            "playlistItems.list": 1,
+        }
+        assert backend.quota_used == 2
+
+    def test_steady_state_run_with_state_store_skips_video_reads(  # noqa: PLR0913
+        self,
+        sessions: tuple[Session, ...],
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+        mapping_file: Path,
+        jst: ZoneInfo,
+        tmp_path: Path,
+    ) -> None:
+        """同期状態ストアがあれば、変更のない2回目の実行で動画を取得しない"""
+        with SqliteVideoStateStore(db_path=tmp_path / "state.sqlite3") as store:
+            for _ in range(2):
+                backend.reset_counters()
+                self._run(
+                    sessions=sessions,
+                    gateway=gateway,
+                    mapping_file=mapping_file,
+                    jst=jst,
+                    state_store=store,
+                )
+
+        assert backend.calls == {"playlistItems.list": 1}
+
+    def test_verify_remote_restores_manually_edited_video(  # noqa: PLR0913
+        self,
+        sessions: tuple[Session, ...],
+        gateway: YouTubeApiGateway,
+        backend: FakeYouTubeBackend,
+        mapping_file: Path,
+        jst: ZoneInfo,
+        tmp_path: Path,
+    ) -> None:
+        """YouTube側で編集された動画は --verify-remote 指定時だけ取得して元に戻す"""
+        video_id = synthetic_video_id(index=0)
+
+        with SqliteVideoStateStore(db_path=tmp_path / "state.sqlite3") as store:
+            self._run(
+                sessions=sessions,
+                gateway=gateway,
+                mapping_file=mapping_file,
+                jst=jst,
+                state_store=store,
+            )
+            generated_title = backend.videos[video_id].title
+            backend.add_video(video_id=video_id, title="Edited in YouTube Studio")
+
+            backend.reset_counters()
+            self._run(
+                sessions=sessions,
+                gateway=gateway,
+                mapping_file=mapping_file,
+                jst=jst,
+                state_store=store,
+            )
+            assert backend.calls["videos.list"] == 0
+            assert backend.videos[video_id].title == "Edited in YouTube Studio"
+
+            backend.reset_counters()
+            self._run(
+                sessions=sessions,
+                gateway=gateway,
+                mapping_file=mapping_file,
+                jst=jst,
+                state_store=store,
+                verify_remote=True,
+            )
+
+        assert backend.calls["videos.list"] == 1
+        assert backend.calls["videos.update"] == 1
+        assert backend.videos[video_id].title == generated_title
+
+    def test_reversed_playlist_is_reordered_with_single_listing(
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """逆順のプレイリストを並べ替え、最後の確認を含めて2回の取得で済む"""
+        backend.add_playlist(
+            playlist_id=PLAYLIST_ID,
+            video_ids=tuple(
+                synthetic_video_id(index=i) for i in reversed(range(SESSION_COUNT))
+            ),
+        )
+
+        SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+        ).execute(mapping_file=mapping_file, dry_run=False, verify=True)
+
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        assert backend.calls["playlistItems.list"] == 2
+
+    def test_new_video_near_top_is_inserted_without_moving_others(
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """先頭付近に1件追加するだけなら、既存アイテムの移動は発生しない"""
+        backend.add_playlist(
+            playlist_id=PLAYLIST_ID,
+            video_ids=tuple(
+                synthetic_video_id(index=i) for i in range(1, SESSION_COUNT)
+            ),
+        )
+
+        SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        assert backend.calls == {"playlistItems.list": 1, "playlistItems.insert": 1}
+
+    def test_saved_plan_is_applied_with_one_precondition_listing(
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """計画と適用でそれぞれ1回ずつしかプレイリストを取得しない"""
+        backend.add_playlist(
+            playlist_id=PLAYLIST_ID,
+            video_ids=tuple(
+                synthetic_video_id(index=i) for i in reversed(range(SESSION_COUNT))
+            ),
+        )
+        usecase = SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+        )
+
+        (plan,) = usecase.plan(mapping_file=mapping_file)
+        usecase.apply(plans=[plan])
+
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        assert backend.calls["playlistItems.list"] == 2
+
+    def test_interrupted_sync_is_resumed_from_journal(  # noqa: PLR0913
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+        tmp_path: Path,
+    ) -> None:
+        """クォータ超過で中断した同期を、再計画せず残りの操作だけで再開する"""
+        backend.add_playlist(
+            playlist_id=PLAYLIST_ID,
+            video_ids=tuple(
+                synthetic_video_id(index=i) for i in reversed(range(SESSION_COUNT))
+            ),
+        )
+        usecase = SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+            journal=JsonlPlaylistSyncJournal(directory=tmp_path / "journal"),
+        )
+        # 取得1回と移動2回分のクォータしかない
+        backend.quota_limit = 1 + 2 * 50
+
+        with pytest.raises(HttpError):
+            usecase.execute(mapping_file=mapping_file, dry_run=False)
+
+        backend.quota_limit = None
+        backend.reset_counters()
+        usecase.execute(mapping_file=mapping_file, dry_run=False, resume=True)
+
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        # 逆順の5件は4回の移動が必要で、中断前に済んだ2回は繰り返さない
+        assert backend.calls == {"playlistItems.list": 1, "playlistItems.update": 2}
+
+    def test_day_and_track_playlists_are_synced_in_one_run(
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        tmp_path: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """スケジュールを1回取得するだけで、日付・トラックごとのプレイリストも同期する"""
+        for playlist_id in ("PLday", "PLtrack1", "PLtrack2"):
+            backend.add_playlist(playlist_id=playlist_id)
+        mapping_file = tmp_path / "mapping.yaml"
+        mapping_file.write_text(
+            data=synthetic_mapping_yaml(sessions=sessions, playlist_id=PLAYLIST_ID)
+            + "playlists:\n"
+            + '  by_day: { "2026-01-07": PLday }\n'
+            + '  by_track: { "Track 1": PLtrack1, "Track 2": PLtrack2 }\n',
+            encoding="utf-8",
+        )
+        confengine_api = create_mock_confengine_api(sessions=sessions, timezone=jst)
+
+        results = SyncPlaylistUseCase(
+            confengine_api=confengine_api,
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert [result.playlist_id for result in results] == [
+            PLAYLIST_ID,
+            "PLday",
+            "PLtrack1",
+            "PLtrack2",
+        ]
+        all_video_ids = [synthetic_video_id(index=i) for i in range(SESSION_COUNT)]
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == all_video_ids
+        assert backend.playlist_video_ids(playlist_id="PLday") == all_video_ids
+        # 合成セッションのトラックは index % 3 で割り当てられる
+        assert backend.playlist_video_ids(playlist_id="PLtrack1") == [
+            synthetic_video_id(index=0),
+            synthetic_video_id(index=3),
+        ]
+        assert backend.playlist_video_ids(playlist_id="PLtrack2") == [
+            synthetic_video_id(index=1),
+            synthetic_video_id(index=4),
+        ]
+        confengine_api.fetch_schedule.assert_called_once()  # type: ignore[attr-defined]
+        assert backend.calls == {
+            "playlistItems.list": 4,
+            "playlistItems.insert": 2 * SESSION_COUNT + 4,
+        }
+
+    def test_new_sessions_at_end_are_appended(
+        self,
+        sessions: tuple[Session, ...],
+        backend: FakeYouTubeBackend,
+        gateway: YouTubeApiGateway,
+        mapping_file: Path,
+        jst: ZoneInfo,
+    ) -> None:
+        """末尾に続くセッションの追加は、移動も再取得もせず順に追加するだけで済む"""
+        backend.add_playlist(
+            playlist_id=PLAYLIST_ID,
+            video_ids=(synthetic_video_id(index=0), synthetic_video_id(index=1)),
+        )
+
+        SyncPlaylistUseCase(
+            confengine_api=create_mock_confengine_api(sessions=sessions, timezone=jst),
+            mapping_reader=MappingFileReader(),
+            youtube_api=gateway,
+        ).execute(mapping_file=mapping_file, dry_run=False)
+
+        assert backend.playlist_video_ids(playlist_id=PLAYLIST_ID) == [
+            synthetic_video_id(index=i) for i in range(SESSION_COUNT)
+        ]
+        assert backend.calls == {
+            "playlistItems.list": 1,
+            "playlistItems.insert": SESSION_COUNT - 2,
+        }
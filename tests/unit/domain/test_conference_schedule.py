@@ -1,6 +1,6 @@
 """ConferenceSchedule 集約のテスト"""
 
-from datetime import datetime
+from datetime import UTC, date, datetime
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -11,6 +11,7 @@ from confengine_to_youtube.domain.session import Session
 from confengine_to_youtube.domain.session_abstract import SessionAbstract
 from confengine_to_youtube.domain.speaker import Speaker
 from tests.conftest import create_session
+from tests.fakes.synthetic import synthetic_sessions
 
 
 class TestConferenceSchedule:
@@ -175,3 +176,113 @@ class TestSessionsWithContent:
         result = schedule.sessions_with_content()
 
         assert result == (session1, session2)
+
+
+class TestIndexes:
+    """索引を使った検索のテスト"""
+
+    @pytest.fixture
+    def schedule(self, jst: ZoneInfo) -> ConferenceSchedule:
+        """2日分 (1日あたり96セッション) のスケジュール"""
+        return ConferenceSchedule(
+            conf_id="test-conf",
+            timezone=jst,
+            sessions=synthetic_sessions(count=150, timezone=jst),
+        )
+
+    def test_sessions_on_rooms_and_tracks(self, schedule: ConferenceSchedule) -> None:
+        """日付・部屋・トラックごとのセッションを元の順序で返す"""
+        day2 = date(year=2026, month=1, day=8)
+
+        assert schedule.sessions_on(dates=[day2]) == [
+            s for s in schedule.sessions if s.slot.timeslot.date() == day2
+        ]
+        assert schedule.sessions_in_rooms(rooms=["Hall B"]) == [
+            s for s in schedule.sessions if s.slot.room == "Hall B"
+        ]
+        assert schedule.sessions_in_tracks(tracks=["Track 3"]) == [
+            s for s in schedule.sessions if s.track == "Track 3"
+        ]
+        assert schedule.sessions_on(dates=[date(year=2026, month=1, day=9)]) == []
+
+    def test_session_by_url(self, schedule: ConferenceSchedule) -> None:
+        """URLからセッションを引く"""
+        session = schedule.sessions[42]
+
+        assert schedule.session_by_url(url=session.url) == session
+        assert schedule.session_by_url(url="https://example.com/unknown") is None
+        assert schedule.session_by_url(url="") is None
+
+    def test_sessions_between_is_half_open(
+        self,
+        schedule: ConferenceSchedule,
+        jst: ZoneInfo,
+    ) -> None:
+        """開始時刻が start 以上 end 未満のセッションを返す"""
+        start = datetime(year=2026, month=1, day=7, hour=10, tzinfo=jst)
+        end = datetime(year=2026, month=1, day=7, hour=11, tzinfo=jst)
+
+        result = schedule.sessions_between(start=start, end=end)
+
+        assert result == [
+            s for s in schedule.sessions if start <= s.slot.timeslot < end
+        ]
+        # 10:00 と 10:30 の2コマ、4部屋ずつ
+        assert len(result) == 8
+
+    def test_sessions_between_other_timezone(
+        self,
+        schedule: ConferenceSchedule,
+    ) -> None:
+        """別のタイムゾーンで指定しても同じ時刻として比較する"""
+        # 2026-01-08 09:00 JST
+        start = datetime(year=2026, month=1, day=8, hour=0, tzinfo=UTC)
+
+        result = schedule.sessions_between(
+            start=start,
+            end=datetime(year=2026, month=1, day=9, tzinfo=UTC),
+        )
+
+        assert result == list(schedule.sessions[96:])
+
+    def test_sessions_between_sorts_by_time(self, jst: ZoneInfo) -> None:
+        """元の順序が時刻順でなくても開始時刻順に返す"""
+        first, second, third = synthetic_sessions(count=12, timezone=jst)[::4]
+        schedule = ConferenceSchedule(
+            conf_id="test-conf",
+            timezone=jst,
+            sessions=(third, first, second),
+        )
+
+        result = schedule.sessions_between(
+            start=first.slot.timeslot,
+            end=third.slot.timeslot,
+        )
+
+        assert result == [first, second]
+
+    def test_sessions_between_empty_range(self, schedule: ConferenceSchedule) -> None:
+        """終了時刻が開始時刻以前なら空"""
+        start = schedule.sessions[10].slot.timeslot
+
+        assert schedule.sessions_between(start=start, end=start) == []
+        assert (
+            schedule.sessions_between(
+                start=start,
+                end=schedule.sessions[0].slot.timeslot,
+            )
+            == []
+        )
+
+    def test_subset_builds_own_indexes(self, schedule: ConferenceSchedule) -> None:
+        """subset() したスケジュールは自身のセッションだけを索引に持つ"""
+        # 元のスケジュールの索引を先に作っておく
+        assert schedule.session_by_url(url=schedule.sessions[0].url) is not None
+
+        subset = schedule.subset(sessions=schedule.sessions[4:8])
+
+        assert subset.session_by_url(url=schedule.sessions[0].url) is None
+        assert subset.sessions_between(
+            start=schedule.sessions[0].slot.timeslot,
+            end=schedule.sessions[-1].slot.timeslot,
+        ) == list(schedule.sessions[4:8])
@@ -1,5 +1,7 @@
 """Session エンティティのテスト"""
 
+import pickle
+from dataclasses import replace
 from datetime import UTC, datetime
 
 import pytest
@@ -71,3 +73,68 @@ class TestSession:
             url=URL,
         )
         assert session.speakers_last_name == "Doe, Smith"
+
+    def test_speakers_follow_replace(self) -> None:
+        """replace() で作り直したセッションはスピーカー表記も作り直す"""
+        session = create_session(
+            title="Test",
+            speakers=[("John", "Doe")],
+            abstract=ABSTRACT,
+            timeslot=TIMESLOT,
+            room=ROOM,
+            url=URL,
+        )
+        other = create_session(
+            title="Other",
+            speakers=[("Jane", "Smith")],
+            abstract=ABSTRACT,
+            timeslot=TIMESLOT,
+            room=ROOM,
+            url=URL,
+        )
+
+        assert session.speakers_full == "John Doe"
+
+        replaced = replace(session, speakers=other.speakers)
+
+        assert replaced.speakers_full == "Jane Smith"
+        assert replaced.speakers_initials == "J. Smith"
+        assert replaced.speakers_last_name == "Smith"
+
+    def test_speakers_rendered_once(self) -> None:
+        """スピーカー表記は初回に組み立て、以降は同じ文字列を返す"""
+        session = create_session(
+            title="Test",
+            speakers=[("John", "Doe"), ("Jane", "Smith")],
+            abstract=ABSTRACT,
+            timeslot=TIMESLOT,
+            room=ROOM,
+            url=URL,
+        )
+
+        first = session.speakers_initials
+
+        assert session.speakers_initials is first
+        # 組み立て済みの表記は等価性とハッシュに影響しない
+        assert session == replace(session)
+        assert hash(session) == hash(replace(session))
+
+    def test_pickle_round_trip(self) -> None:
+        """プロセスプールに渡せるよう、スピーカー表記ごと復元できる"""
+        session = create_session(
+            title="Test",
+            speakers=[("John", "Doe"), ("Jane", "Smith")],
+            abstract=ABSTRACT,
+            timeslot=TIMESLOT,
+            room=ROOM,
+            url=URL,
+        )
+
+        assert session.speakers_full == "John Doe, Jane Smith"
+
+        restored = pickle.loads(pickle.dumps(session))  # noqa: S301
+
+        assert restored == session
+        assert hash(restored) == hash(session)
+        assert restored.speakers_full == "John Doe, Jane Smith"
+        assert restored.speakers_last_name == "Doe, Smith"
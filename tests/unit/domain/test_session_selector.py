@@ -0,0 +1,157 @@
+"""SessionSelector のテスト"""
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from confengine_to_youtube.domain.conference_schedule import ConferenceSchedule
+from confengine_to_youtube.domain.session_selector import SessionSelector
+from confengine_to_youtube.domain.video_mapping import MappingConfig, VideoMapping
+from tests.fakes.synthetic import synthetic_sessions, synthetic_video_id
+
+# 2日目の途中まで (1日あたり96セッション)
+SESSION_COUNT = 150
+
+
+@pytest.fixture
+def schedule(jst: ZoneInfo) -> ConferenceSchedule:
+    return ConferenceSchedule(
+        conf_id="test-conf",
+        timezone=jst,
+        sessions=synthetic_sessions(count=SESSION_COUNT, timezone=jst),
+    )
+
+
+@pytest.fixture
+def mapping_config(schedule: ConferenceSchedule) -> MappingConfig:
+    """偶数番目のセッションだけをマッピングした設定"""
+    return MappingConfig(
+        conf_id="test-conf",
+        playlist_id="PL1",
+        mappings=frozenset(
+            VideoMapping(slot=session.slot, video_id=synthetic_video_id(index=index))
+            for index, session in enumerate(schedule.sessions)
+            if index % 2 == 0
+        ),
+        hashtags=(),
+        footer="",
+    )
+
+
+class TestSessionSelector:
+    """SessionSelector のテスト"""
+
+    def test_empty_selector_returns_inputs(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> None:
+        """条件がなければ絞り込まない"""
+        selector = SessionSelector()
+
+        assert selector.is_empty
+        assert selector.select(schedule=schedule, mapping_config=mapping_config) == (
+            schedule,
+            mapping_config,
+        )
+
+    def test_and_across_criteria_or_within(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> None:
+        """種類どうしは AND、同じ種類の値どうしは OR で絞り込み、元の順序を保つ"""
+        selector = SessionSelector(
+            dates=frozenset({date(year=2026, month=1, day=8)}),
+            rooms=frozenset({"Hall B", "Hall D"}),
+            tracks=frozenset({"Track 1"}),
+        )
+
+        selected_schedule, selected_config = selector.select(
+            schedule=schedule,
+            mapping_config=mapping_config,
+        )
+
+        expected = [
+            session
+            for session in schedule.sessions
+            if session.slot.timeslot.date() == date(year=2026, month=1, day=8)
+            and session.slot.room in {"Hall B", "Hall D"}
+            and session.track == "Track 1"
+        ]
+        assert expected
+        assert list(selected_schedule.sessions) == expected
+        assert {mapping.slot for mapping in selected_config.mappings} == {
+            session.slot
+            for session in expected
+            if mapping_config.find_mapping(slot=session.slot) is not None
+        }
+        # プレイリスト設定などはそのまま
+        assert selected_config.playlist_id == mapping_config.playlist_id
+
+    def test_slot_uses_schedule_timezone(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> None:
+        """スロットの日時は会場のタイムゾーンの現地時刻として扱う"""
+        # CLIから渡される日時はタイムゾーンなし
+        local_0930 = datetime(year=2026, month=1, day=7, hour=9, minute=30)  # noqa: DTZ001
+        # UTC として扱うと 12:00 JST の Hall A のセッションに当たってしまう
+        local_0300 = datetime(year=2026, month=1, day=7, hour=3, minute=0)  # noqa: DTZ001
+        selector = SessionSelector(
+            slots=frozenset({(local_0930, "Hall C"), (local_0300, "Hall A")}),
+        )
+
+        selected_schedule, _ = selector.select(
+            schedule=schedule,
+            mapping_config=mapping_config,
+        )
+
+        assert [session.slot.room for session in selected_schedule.sessions] == [
+            "Hall C",
+        ]
+        assert selected_schedule.sessions[0].slot.timeslot.hour == 9
+
+    def test_video_ids(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> None:
+        """動画IDはマッピングからスロットを引いて絞り込む"""
+        selector = SessionSelector(
+            video_ids=frozenset(
+                {synthetic_video_id(index=4), synthetic_video_id(index=2), "unknown"},
+            ),
+        )
+
+        selected_schedule, selected_config = selector.select(
+            schedule=schedule,
+            mapping_config=mapping_config,
+        )
+
+        assert selected_schedule.sessions == (
+            schedule.sessions[2],
+            schedule.sessions[4],
+        )
+        assert {mapping.video_id for mapping in selected_config.mappings} == {
+            synthetic_video_id(index=2),
+            synthetic_video_id(index=4),
+        }
+
+    def test_no_match(
+        self,
+        schedule: ConferenceSchedule,
+        mapping_config: MappingConfig,
+    ) -> None:
+        """条件に合うセッションがなければ空になる"""
+        selector = SessionSelector(rooms=frozenset({"Nowhere"}))
+
+        selected_schedule, selected_config = selector.select(
+            schedule=schedule,
+            mapping_config=mapping_config,
+        )
+
+        assert selected_schedule.sessions == ()
+        assert selected_config.mappings == frozenset()
@@ -1,8 +1,9 @@
 """VideoMapping エンティティのテスト"""
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 
 from confengine_to_youtube.domain.schedule_slot import ScheduleSlot
+from confengine_to_youtube.domain.session import Session
 from confengine_to_youtube.domain.video_mapping import MappingConfig, VideoMapping
 
 
@@ -174,3 +175,94 @@ class TestMappingConfig:
         )
 
         assert config.hashtags == ("#RSGT2026", "#Agile", "#Scrum")
+
+    def test_playlist_ids_for_session(self, sample_session: Session) -> None:
+        """セッションの日付・トラックに対応するプレイリストを返す"""
+        config = MappingConfig(
+            conf_id="test-conf",
+            playlist_id="PLmain",
+            mappings=frozenset(),
+            hashtags=(),
+            footer="",
+            day_playlist_ids={
+                sample_session.slot.timeslot.date(): "PLday",
+                date(year=2000, month=1, day=1): "PLother-day",
+            },
+            track_playlist_ids={
+                sample_session.track: "PLtrack",
+                "Other track": "PLother-track",
+            },
+        )
+
+        assert config.playlist_ids_for(session=sample_session) == (
+            "PLmain",
+            "PLday",
+            "PLtrack",
+        )
+        assert config.playlist_ids == (
+            "PLmain",
+            "PLday",
+            "PLother-day",
+            "PLtrack",
+            "PLother-track",
+        )
+
+    def test_playlist_ids_are_deduplicated(self, sample_session: Session) -> None:
+        """同じプレイリストが複数回指定されても1回だけ返す"""
+        config = MappingConfig(
+            conf_id="test-conf",
+            playlist_id="PLmain",
+            mappings=frozenset(),
+            hashtags=(),
+            footer="",
+            track_playlist_ids={sample_session.track: "PLmain"},
+        )
+
+        assert config.playlist_ids_for(session=sample_session) == ("PLmain",)
+        assert config.playlist_ids == ("PLmain",)
+
+
+class TestMappingConfigIndexes:
+    """MappingConfig の索引を使った検索のテスト"""
+
+    def _config(self) -> MappingConfig:
+        slots = [
+            ScheduleSlot(
+                timeslot=datetime(year=2026, month=1, day=7, hour=hour, tzinfo=UTC),
+                room="Hall A",
+            )
+            for hour in (10, 11, 12)
+        ]
+        return MappingConfig(
+            conf_id="test-conf",
+            playlist_id="PL1",
+            mappings=frozenset(
+                {
+                    VideoMapping(slot=slots[0], video_id="workshop"),
+                    VideoMapping(slot=slots[1], video_id="workshop"),
+                    VideoMapping(slot=slots[2], video_id="talk"),
+                },
+            ),
+            hashtags=(),
+            footer="",
+        )
+
+    def test_mappings_for_videos_returns_every_slot(self) -> None:
+        """複数スロットにマッピングされた動画は全てのスロットを返す"""
+        config = self._config()
+
+        mappings = config.mappings_for_videos(video_ids=["workshop", "unknown"])
+
+        assert sorted(mapping.slot.timeslot.hour for mapping in mappings) == [10, 11]
+
+    def test_subset_keeps_only_given_slots(self) -> None:
+        """指定スロットのマッピングだけを残し、索引も作り直す"""
+        config = self._config()
+        talk = config.mappings_for_videos(video_ids=["talk"])[0]
+
+        subset = config.subset(slots=[talk.slot])
+
+        assert subset.mappings == frozenset({talk})
+        assert subset.find_mapping(slot=talk.slot) == talk
+        assert subset.mappings_for_videos(video_ids=["workshop"]) == []
+        assert subset.playlist_id == config.playlist_id
@@ -0,0 +1,121 @@
+"""実行結果のフェーズ別計測の表示・JSON変換のテスト"""
+
+from __future__ import annotations
+
+import json
+
+from confengine_to_youtube.infrastructure.cli.result_report import (
+    format_phase_table,
+    record_to_dict,
+    report_to_dict,
+)
+from confengine_to_youtube.usecases.dto import (
+    PhaseTiming,
+    PipelineStageStats,
+    PlaylistSyncResult,
+    VideoUpdateRecord,
+    VideoUpdateResult,
+    VideoUpdateStatus,
+)
+
+
+class TestFormatPhaseTable:
+    """format_phase_table のテスト"""
+
+    def test_formats_calls_total_and_average(self) -> None:
+        """回数・累計・平均を名前の幅に揃えて表示する"""
+        table = format_phase_table(
+            phases=(
+                PhaseTiming(name="youtube.update_video", calls=4, seconds=2.0),
+                PhaseTiming(name="plan", calls=1, seconds=0.0125),
+            ),
+        )
+
+        assert table.splitlines() == [
+            "phase                 calls     total       avg",
+            "youtube.update_video      4    2.000s   500.0ms",
+            "plan                      1    0.013s    12.5ms",
+        ]
+
+
+class TestRecordToDict:
+    """record_to_dict のテスト"""
+
+    def test_serializes_status_in_lower_case(self) -> None:
+        """状態は小文字の名前、更新しなかった項目は null にする"""
+        record = VideoUpdateRecord(
+            session_key="2026-01-07 10:00 Hall A",
+            video_id="video1",
+            status=VideoUpdateStatus.STATE_SKIPPED,
+            elapsed_seconds=0.5,
+        )
+
+        assert record_to_dict(record=record) == {
+            "session_key": "2026-01-07 10:00 Hall A",
+            "video_id": "video1",
+            "status": "state_skipped",
+            "title_changed": False,
+            "description_changed": False,
+            "error": None,
+            "elapsed_seconds": 0.5,
+            "update_seconds": None,
+        }
+
+
+class TestReportToDict:
+    """report_to_dict のテスト"""
+
+    def test_serializes_counts_and_phases(self) -> None:
+        """件数・ステージ実績・フェーズ別計測をJSONに変換できる形にする"""
+        phases = (PhaseTiming(name="youtube.fetch_playlist", calls=2, seconds=0.5),)
+        report = report_to_dict(
+            result=VideoUpdateResult(
+                is_dry_run=False,
+                previews=(),
+                changed_count=3,
+                stage_stats=(
+                    PipelineStageStats(name="apply", items=3, busy_seconds=1.5),
+                ),
+                phases=(PhaseTiming(name="generate", calls=1, seconds=0.25),),
+            ),
+            playlist_results=tuple(
+                PlaylistSyncResult(
+                    is_dry_run=False,
+                    playlist_id=playlist_id,
+                    added_count=1,
+                    reordered_count=0,
+                    unchanged_count=2,
+                    moved_to_end_count=0,
+                    operations=(),
+                    phases=phases,
+                )
+                for playlist_id in ("PL1", "PL2")
+            ),
+        )
+
+        assert json.loads(json.dumps(report)) == report
+        assert report["update"]["changed"] == 3
+        assert report["update"]["stages"] == [
+            {"name": "apply", "items": 3, "busy_seconds": 1.5},
+        ]
+        assert report["update"]["phases"] == [
+            {"name": "generate", "calls": 1, "seconds": 0.25},
+        ]
+        assert [playlist["playlist_id"] for playlist in report["playlists"]] == [
+            "PL1",
+            "PL2",
+        ]
+        # 全プレイリストで共通のフェーズ別計測は1回だけ出力する
+        assert report["playlist_phases"] == [
+            {"name": "youtube.fetch_playlist", "calls": 2, "seconds": 0.5},
+        ]
+
+    def test_without_playlists(self) -> None:
+        """プレイリストがなければフェーズ別計測も空"""
+        report = report_to_dict(
+            result=VideoUpdateResult(is_dry_run=True, previews=()),
+            playlist_results=(),
+        )
+
+        assert report["playlists"] == []
+        assert report["playlist_phases"] == []
@@ -0,0 +1,73 @@
+"""書き込みのサーキットブレーカーのテスト"""
+
+from confengine_to_youtube.usecases.circuit_breaker import (
+    WriteCircuitBreaker,
+    WriteFailurePolicy,
+)
+
+
+def _record(breaker: WriteCircuitBreaker, results: str) -> None:
+    """文字列の o を成功、x を失敗として順に記録する"""
+    for result in results:
+        breaker.record(succeeded=result == "o")
+
+
+class TestWriteCircuitBreaker:
+    """WriteCircuitBreaker のテスト"""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """連続で上限回数失敗したら開く"""
+        breaker = WriteCircuitBreaker(
+            policy=WriteFailurePolicy(max_consecutive_failures=3, window=100),
+        )
+
+        _record(breaker=breaker, results="oxx")
+        assert not breaker.is_open
+
+        _record(breaker=breaker, results="x")
+        assert breaker.is_open
+
+    def test_success_resets_consecutive_failures(self) -> None:
+        """間に成功があれば連続失敗の数え直しになる"""
+        breaker = WriteCircuitBreaker(
+            policy=WriteFailurePolicy(max_consecutive_failures=3, window=100),
+        )
+
+        _record(breaker=breaker, results="xxoxxoxx")
+
+        assert not breaker.is_open
+
+    def test_opens_on_failure_rate_within_window(self) -> None:
+        """直近の書き込みのうち上限の割合以上が失敗したら開く"""
+        breaker = WriteCircuitBreaker(
+            policy=WriteFailurePolicy(
+                max_consecutive_failures=10,
+                max_failure_rate=0.5,
+                window=6,
+            ),
+        )
+
+        # 窓が埋まるまでは割合を判定しない
+        _record(breaker=breaker, results="xox")
+        assert not breaker.is_open
+
+        _record(breaker=breaker, results="oo")
+        assert not breaker.is_open
+
+        # 直近6回のうち3回が失敗
+        _record(breaker=breaker, results="x")
+        assert breaker.is_open
+
+    def test_old_failures_leave_window(self) -> None:
+        """窓から外れた失敗は割合に数えない"""
+        breaker = WriteCircuitBreaker(
+            policy=WriteFailurePolicy(
+                max_consecutive_failures=10,
+                max_failure_rate=0.5,
+                window=4,
+            ),
+        )
+
+        _record(breaker=breaker, results="xoxoooox")
+
+        assert not breaker.is_open
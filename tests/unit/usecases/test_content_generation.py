@@ -0,0 +1,144 @@
+"""ContentBatchGenerator のテスト"""
+
+from collections.abc import Iterator
+from zoneinfo import ZoneInfo
+
+import pytest
+from returns.result import Failure, Success
+
+from confengine_to_youtube.domain.errors import FrameOverflowError
+from confengine_to_youtube.usecases import content_generation
+from confengine_to_youtube.usecases.content_generation import (
+    ContentBatchGenerator,
+    ContentJob,
+    GeneratedContent,
+    generate_content,
+)
+from tests.fakes.synthetic import synthetic_sessions
+
+
+@pytest.fixture
+def jobs(jst: ZoneInfo) -> list[ContentJob]:
+    jobs = [
+        ContentJob(
+            session=session,
+            update_title=True,
+            update_description=index % 3 != 0,
+            hashtags=("#RSGT2026",),
+            footer="footer",
+        )
+        for index, session in enumerate(synthetic_sessions(count=40, timezone=jst))
+    ]
+    # フレームだけで上限を超えるセッションは生成エラーになる
+    jobs[7] = ContentJob(
+        session=jobs[7].session,
+        update_title=True,
+        update_description=True,
+        hashtags=(),
+        footer="x" * 5000,
+    )
+    return jobs
+
+
+class TestGenerateContent:
+    """generate_content のテスト"""
+
+    def test_flags_select_generated_fields(self, jobs: list[ContentJob]) -> None:
+        """フラグがfalseの項目は None になる"""
+        match generate_content(job=jobs[0]):
+            case Success(GeneratedContent(title=title, description=description)):
+                assert title is not None
+                assert title.startswith("Session 0: ")
+                assert description is None
+            case _:  # pragma: no cover
+                pytest.fail("generation failed")
+
+    def test_frame_overflow_is_failure(self, jobs: list[ContentJob]) -> None:
+        """説明文の生成エラーは Failure として返す"""
+        match generate_content(job=jobs[7]):
+            case Failure(FrameOverflowError()):
+                pass
+            case _:  # pragma: no cover
+                pytest.fail("expected FrameOverflowError")
+
+
+class TestContentBatchGenerator:
+    """ContentBatchGenerator のテスト"""
+
+    def test_below_threshold_runs_serially(
+        self,
+        jobs: list[ContentJob],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """閾値未満ではワーカーを起動しない"""
+        monkeypatch.setattr(content_generation, "ProcessPoolExecutor", None)
+        monkeypatch.setattr(content_generation, "ThreadPoolExecutor", None)
+
+        with ContentBatchGenerator(parallel_threshold=100, max_workers=4) as generator:
+            results = generator.generate(jobs=jobs)
+
+        assert results == [generate_content(job=job) for job in jobs]
+
+    def test_process_pool_keeps_job_order(self, jobs: list[ContentJob]) -> None:
+        """プロセスプールで生成しても jobs と同じ順に同じ結果を返す"""
+        with ContentBatchGenerator(parallel_threshold=1, max_workers=2) as generator:
+            first = generator.generate(jobs=jobs)
+            # 2回目以降のバッチでも同じワーカーを使う
+            second = generator.generate(jobs=jobs[::-1])
+
+        expected = [generate_content(job=job) for job in jobs]
+        assert first == expected
+        assert second == expected[::-1]
+
+    def test_free_threaded_build_uses_threads(
+        self,
+        jobs: list[ContentJob],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """GILが無効なビルドではプロセスではなくスレッドに分配する"""
+        monkeypatch.setattr(content_generation, "is_free_threaded", lambda: True)
+        monkeypatch.setattr(content_generation, "ProcessPoolExecutor", None)
+
+        with ContentBatchGenerator(parallel_threshold=1, max_workers=2) as generator:
+            results = generator.generate(jobs=jobs)
+
+        assert results == [generate_content(job=job) for job in jobs]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_stream_does_not_wait_for_all_jobs(
+        self,
+        jst: ZoneInfo,
+        max_workers: int,
+    ) -> None:
+        """ジョブの総数によらず、読み進めた件数が一定のうちに最初の結果を流す"""
+        all_jobs = [
+            ContentJob(
+                session=session,
+                update_title=True,
+                update_description=True,
+                hashtags=(),
+                footer="",
+            )
+            for session in synthetic_sessions(count=2000, timezone=jst)
+        ]
+        pulled = 0
+
+        def jobs() -> Iterator[ContentJob]:
+            nonlocal pulled
+            for job in all_jobs:
+                pulled += 1
+                yield job
+
+        with ContentBatchGenerator(
+            parallel_threshold=0,
+            max_workers=max_workers,
+        ) as generator:
+            results = generator.stream(jobs=jobs())
+            first = next(results)
+            pulled_at_first = pulled
+            rest = list(results)
+
+        # 32件ずつのチャンクを、直列なら1つ、並列なら結果を待つ上限 (ワーカー数の2倍)
+        # と読みかけの1つまで
+        assert pulled_at_first <= 32 * (2 * max_workers + 1)
+        assert [first, *rest] == [generate_content(job=job) for job in all_jobs]
@@ -0,0 +1,139 @@
+"""run_pipeline のテスト"""
+
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from confengine_to_youtube.usecases.pipeline import PipelineStage, run_pipeline
+
+
+class TestRunPipeline:
+    """run_pipeline のテスト"""
+
+    def test_items_flow_through_stages_in_order(self) -> None:
+        """各ステージの出力が到着順のまま次のステージに渡る"""
+        received: list[int] = []
+
+        def double(items: Iterator[int]) -> Iterator[int]:
+            for item in items:
+                yield item * 2
+
+        def keep_multiples_of_four(items: Iterator[int]) -> Iterator[int]:
+            return (item for item in items if item % 4 == 0)
+
+        def collect(items: Iterator[int]) -> Iterator[int]:
+            for item in items:
+                received.append(item)
+                yield item
+
+        stats = run_pipeline(
+            source=range(100),
+            stages=(
+                PipelineStage(name="double", func=double),
+                PipelineStage(name="filter", func=keep_multiples_of_four),
+                PipelineStage(name="collect", func=collect),
+            ),
+            queue_size=2,
+        )
+
+        assert received == [item * 2 for item in range(0, 100, 2)]
+        assert [(s.name, s.items) for s in stats] == [
+            ("double", 100),
+            ("filter", 100),
+            ("collect", 50),
+        ]
+
+    def test_stage_error_is_raised_and_stops_other_stages(self) -> None:
+        """ステージの例外が呼び出し元に送出され、他のステージも終了する"""
+        pulled: list[int] = []
+
+        def source() -> Iterator[int]:
+            for item in range(10_000):
+                pulled.append(item)
+                yield item
+
+        def fail_at_ten(items: Iterator[int]) -> Iterator[int]:
+            for item in items:
+                if item == 10:
+                    msg = "boom"
+                    raise ValueError(msg)
+                yield item
+
+        with pytest.raises(ValueError, match="boom"):
+            run_pipeline(
+                source=source(),
+                stages=(
+                    PipelineStage(name="pass", func=lambda items: items),
+                    PipelineStage(name="fail", func=fail_at_ten),
+                ),
+                queue_size=4,
+            )
+
+        assert len(pulled) < 10_000
+        assert not [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+    def test_queues_bound_items_in_flight(self) -> None:
+        """下流が止まっている間、上流は有界キューが埋まったところで待つ"""
+        pulled: list[int] = []
+        release = threading.Event()
+
+        def source() -> Iterator[int]:
+            for item in range(1000):
+                pulled.append(item)
+                yield item
+
+        def blocked(items: Iterator[int]) -> Iterator[int]:
+            release.wait(timeout=5)
+            yield from items
+
+        def release_later() -> None:
+            time.sleep(0.2)
+            in_flight.append(len(pulled))
+            release.set()
+
+        in_flight: list[int] = []
+        releaser = threading.Thread(target=release_later)
+        releaser.start()
+
+        run_pipeline(
+            source=source(),
+            stages=(
+                PipelineStage(name="pass", func=lambda items: items),
+                PipelineStage(name="blocked", func=blocked),
+            ),
+            queue_size=4,
+        )
+        releaser.join()
+
+        # 1段目の出力キュー (4) + 1段目が保持中の1件 + 2段目の入力待ち分だけ
+        assert in_flight[0] <= 6
+        assert len(pulled) == 1000
+
+    def test_reports_busy_time_excluding_queue_waits(self) -> None:
+        """下流を待っていた時間はステージの処理時間に含めない"""
+
+        def fast(items: Iterator[int]) -> Iterator[int]:
+            yield from items
+
+        def slow(items: Iterator[int]) -> Iterator[int]:
+            for item in items:
+                time.sleep(0.01)
+                yield item
+
+        stats = run_pipeline(
+            source=range(20),
+            stages=(
+                PipelineStage(name="fast", func=fast),
+                PipelineStage(name="slow", func=slow),
+            ),
+            queue_size=1,
+        )
+
+        fast_stats, slow_stats = stats
+        assert slow_stats.busy_seconds >= 0.2
+        assert fast_stats.busy_seconds < slow_stats.busy_seconds / 2
+        assert slow_stats.throughput == pytest.approx(
+            20 / slow_stats.busy_seconds,
+        )
@@ -0,0 +1,183 @@
+"""プレイリストの並べ替え計画のテスト"""
+
+import random
+
+import pytest
+
+from confengine_to_youtube.usecases.playlist_planner import (
+    find_items_to_keep,
+    find_selected_items_to_keep,
+    restrict_target,
+)
+
+
+class TestFindItemsToKeep:
+    """find_items_to_keep のテスト"""
+
+    def test_sorted_playlist_keeps_all(self) -> None:
+        """既に目標どおりなら全て残す"""
+        result = find_items_to_keep(current=["a", "b", "c"], target=["a", "b", "c"])
+
+        assert result == {"a", "b", "c"}
+
+    def test_new_items_do_not_disturb_existing_order(self) -> None:
+        """先頭付近への追加があっても既存アイテムは動かさない"""
+        result = find_items_to_keep(
+            current=["b", "c", "d"],
+            target=["a", "b", "c", "d"],
+        )
+
+        assert result == {"b", "c", "d"}
+
+    def test_single_misplaced_item_is_moved(self) -> None:
+        """1つだけずれたアイテムがあれば、それ以外を残す"""
+        result = find_items_to_keep(
+            current=["x", "a", "b", "c"],
+            target=["a", "b", "c", "x"],
+        )
+
+        assert result == {"a", "b", "c"}
+
+    def test_reversed_playlist_keeps_one(self) -> None:
+        """逆順なら1つだけ残す"""
+        result = find_items_to_keep(current=["c", "b", "a"], target=["a", "b", "c"])
+
+        assert len(result) == 1
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_unmapped_tail_is_never_moved(self, seed: int) -> None:
+        """マッピング済みの動画より後ろにあるマッピングにない動画は、並べ替えで動かさない
+
+        マッピングにない動画の目標の並びは現在の位置順なので、
+        マッピング済みの動画がどれだけ乱れていても末尾の塊は常に残せる。
+        """
+        rng = random.Random(x=seed)  # noqa: S311
+        mapped = [f"m{i}" for i in range(30)]
+        unmapped = [f"u{i}" for i in range(10)]
+        current = rng.sample(mapped, k=len(mapped)) + rng.sample(
+            unmapped, k=len(unmapped)
+        )
+        unmapped_in_current_order = [v for v in current if v.startswith("u")]
+
+        result = find_items_to_keep(
+            current=current,
+            target=[*mapped, *unmapped_in_current_order],
+        )
+
+        assert set(unmapped) <= result
+
+    def test_items_missing_from_target_are_not_kept(self) -> None:
+        """目標に含まれないアイテムは残さない"""
+        result = find_items_to_keep(current=["a", "z", "b"], target=["a", "b"])
+
+        assert result == {"a", "b"}
+
+    @pytest.mark.parametrize(
+        ("current", "target", "expected_length"),
+        [
+            ([], ["a"], 0),
+            (["b", "d", "a", "c", "e"], ["a", "b", "c", "d", "e"], 3),
+            (["e", "a", "d", "b", "c"], ["a", "b", "c", "d", "e"], 3),
+        ],
+    )
+    def test_keeps_longest_ordered_subsequence(
+        self,
+        current: list[str],
+        target: list[str],
+        expected_length: int,
+    ) -> None:
+        """目標順に並んだ最長の部分列を残す"""
+        result = find_items_to_keep(current=current, target=target)
+
+        kept_in_current_order = [video_id for video_id in current if video_id in result]
+        assert kept_in_current_order == [
+            video_id for video_id in target if video_id in result
+        ]
+        assert len(result) == expected_length
+
+
+class TestRestrictTarget:
+    """restrict_target のテスト"""
+
+    def test_moves_only_selected_items(self) -> None:
+        """対象外の動画は現在の位置のまま、対象の動画だけを目標の位置へ置く"""
+        result = restrict_target(
+            current=["c", "a", "x", "b"],
+            target=["a", "b", "c", "x"],
+            selected={"b"},
+        )
+
+        # b は目標の並びで直前にある a の直後へ
+        assert result == ["c", "a", "b", "x"]
+
+    def test_adds_selected_but_not_other_new_items(self) -> None:
+        """まだない動画は、対象のものだけを追加する"""
+        result = restrict_target(
+            current=["b", "d"],
+            target=["a", "b", "c", "d", "e"],
+            selected={"a", "c"},
+        )
+
+        assert result == ["a", "b", "c", "d"]
+
+    def test_consecutive_selected_items_keep_target_order(self) -> None:
+        """連続する対象の動画は目標の並び順に並ぶ"""
+        result = restrict_target(
+            current=["c", "b", "a", "z"],
+            target=["a", "b", "c", "z"],
+            selected={"a", "b", "c"},
+        )
+
+        assert result == ["a", "b", "c", "z"]
+
+
+class TestFindSelectedItemsToKeep:
+    """find_selected_items_to_keep のテスト"""
+
+    def test_selected_item_in_place_is_kept(self) -> None:
+        """前後の動画との順序が正しい対象の動画は動かさない"""
+        current = ["c", "a", "b", "x"]
+        target = restrict_target(
+            current=current, target=["a", "b", "c", "x"], selected={"b"}
+        )
+
+        assert find_selected_items_to_keep(
+            current=current,
+            target=target,
+            selected={"b"},
+        ) == {"a", "b", "c", "x"}
+
+    def test_unselected_items_are_always_kept(self) -> None:
+        """対象外の動画は、目標の並びとずれていても残す"""
+        current = ["b", "x", "a", "y"]
+        target = restrict_target(
+            current=current, target=["a", "b", "x", "y"], selected={"b"}
+        )
+
+        keep = find_selected_items_to_keep(
+            current=current,
+            target=target,
+            selected={"b"},
+        )
+
+        assert target == ["x", "a", "b", "y"]
+        assert keep == {"x", "a", "y"}
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_kept_items_follow_target_order(self, seed: int) -> None:
+        """残すアイテムは常に目標の並びでの順序どおりに並んでいる"""
+        rng = random.Random(x=seed)  # noqa: S311
+        items = [f"v{i}" for i in range(30)]
+        current = rng.sample(items, k=20)
+        selected = set(rng.sample(items, k=8))
+
+        target = restrict_target(current=current, target=items, selected=selected)
+        keep = find_selected_items_to_keep(
+            current=current,
+            target=target,
+            selected=selected,
+        )
+
+        assert set(current) - selected <= keep
+        kept = [video_id for video_id in current if video_id in keep]
+        assert kept == [video_id for video_id in target if video_id in keep]
@@ -0,0 +1,93 @@
+"""PlaylistState のテスト"""
+
+import pytest
+
+from confengine_to_youtube.usecases.dto import PlaylistItem
+from confengine_to_youtube.usecases.playlist_state import PlaylistState
+
+
+def _item(video_id: str, position: int) -> PlaylistItem:
+    return PlaylistItem(
+        video_id=video_id,
+        playlist_item_id=f"item-{video_id}",
+        position=position,
+    )
+
+
+class TestPlaylistState:
+    """PlaylistState のテスト"""
+
+    @pytest.fixture
+    def state(self) -> PlaylistState:
+        return PlaylistState(
+            items=[
+                _item(video_id="c", position=2),
+                _item(video_id="a", position=0),
+                _item(video_id="b", position=1),
+            ],
+        )
+
+    def test_orders_items_by_position(self, state: PlaylistState) -> None:
+        """アイテムを position 順に並べる"""
+        assert state.video_ids() == ("a", "b", "c")
+        assert len(state) == 3
+        assert "b" in state
+
+    def test_insert_shifts_following_items(self, state: PlaylistState) -> None:
+        """挿入位置以降のアイテムは後ろにずれる"""
+        state.insert(item=_item(video_id="x", position=1), position=1)
+
+        assert state.video_ids() == ("a", "x", "b", "c")
+        assert state.get(video_id="c") == _item(video_id="c", position=3)
+
+    def test_move_forward_shifts_items_between(self, state: PlaylistState) -> None:
+        """前方への移動で間のアイテムは後ろにずれる"""
+        state.move(video_id="c", position=0)
+
+        assert state.items() == (
+            _item(video_id="c", position=0),
+            _item(video_id="a", position=1),
+            _item(video_id="b", position=2),
+        )
+
+    def test_move_backward_shifts_items_between(self, state: PlaylistState) -> None:
+        """後方への移動で間のアイテムは前にずれる"""
+        state.move(video_id="a", position=2)
+
+        assert state.video_ids() == ("b", "c", "a")
+
+    @pytest.mark.parametrize(
+        ("video_id", "after_video_id", "expected"),
+        [
+            ("x", None, 0),
+            ("x", "b", 2),
+            ("c", "a", 1),
+            ("a", "c", 2),
+            ("a", None, 0),
+        ],
+    )
+    def test_position_after(
+        self,
+        state: PlaylistState,
+        video_id: str,
+        after_video_id: str | None,
+        expected: int,
+    ) -> None:
+        """直後に置くための position は、移動時の取り除きによるずれを考慮する"""
+        position = state.position_after(
+            video_id=video_id,
+            after_video_id=after_video_id,
+        )
+
+        if video_id in state:
+            state.move(video_id=video_id, position=position)
+        else:
+            state.insert(item=_item(video_id=video_id, position=0), position=position)
+        assert position == expected
+        video_ids = state.video_ids()
+        if after_video_id is not None:
+            assert video_ids.index(video_id) == video_ids.index(after_video_id) + 1
+
+    def test_get_unknown_video_returns_none(self, state: PlaylistState) -> None:
+        """存在しない動画は None"""
+        assert state.get(video_id="missing") is None
@@ -0,0 +1,104 @@
+"""フェーズ計測のテスト"""
+
+import contextvars
+import threading
+from unittest.mock import create_autospec
+
+import pytest
+
+from confengine_to_youtube.adapters.youtube_api import YouTubeApiGateway
+from confengine_to_youtube.usecases.dto import PlaylistItem
+from confengine_to_youtube.usecases.timing import (
+    TimedYouTubeApi,
+    measure_phases,
+    phase,
+)
+
+
+class TestMeasurePhases:
+    """measure_phases / phase のテスト"""
+
+    def test_aggregates_calls_in_first_seen_order(self) -> None:
+        """同じ名前のフェーズは回数と時間を足し合わせ、最初に記録された順に並ぶ"""
+        with measure_phases() as timer:
+            for _ in range(3):
+                with phase(name="b"):
+                    pass
+            with phase(name="a"):
+                pass
+
+        assert [(timing.name, timing.calls) for timing in timer.phases()] == [
+            ("b", 3),
+            ("a", 1),
+        ]
+
+    def test_phase_without_timer_is_noop(self) -> None:
+        """計測中でなければ何も記録しない"""
+        with phase(name="outside"):
+            pass
+
+        with measure_phases() as timer:
+            pass
+
+        assert timer.phases() == ()
+
+    def test_records_failed_phase(self) -> None:
+        """例外で抜けたフェーズも記録する"""
+        msg = "boom"
+        with (
+            measure_phases() as timer,
+            pytest.raises(ValueError, match=msg),
+            phase(name="failing"),
+        ):
+            raise ValueError(msg)
+
+        assert [timing.name for timing in timer.phases()] == ["failing"]
+
+    def test_copied_context_records_from_thread(self) -> None:
+        """コンテキストを引き継いだスレッドからのフェーズも集計する"""
+
+        def work() -> None:
+            with phase(name="worker"):
+                pass
+
+        with measure_phases() as timer:
+            threads = [
+                threading.Thread(target=contextvars.copy_context().run, args=(work,))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert [(timing.name, timing.calls) for timing in timer.phases()] == [
+            ("worker", 4),
+        ]
+
+
+class TestTimedYouTubeApi:
+    """TimedYouTubeApi のテスト"""
+
+    def test_records_each_call_and_forwards_arguments(self) -> None:
+        """呼び出しごとにメソッド名のフェーズを記録し、引数をそのまま渡す"""
+        mock = create_autospec(YouTubeApiGateway, spec_set=True)
+        mock.add_to_playlist.return_value = PlaylistItem(
+            video_id="video1",
+            playlist_item_id="item1",
+            position=0,
+        )
+        api = TimedYouTubeApi(youtube_api=mock)
+
+        with measure_phases() as timer:
+            api.add_to_playlist(playlist_id="PL1", video_id="video1")
+            api.add_to_playlist(playlist_id="PL1", video_id="video1", position=0)
+
+        mock.add_to_playlist.assert_any_call(playlist_id="PL1", video_id="video1")
+        mock.add_to_playlist.assert_any_call(
+            playlist_id="PL1",
+            video_id="video1",
+            position=0,
+        )
+        assert [(timing.name, timing.calls) for timing in timer.phases()] == [
+            ("youtube.add_to_playlist", 2),
+        ]